@@ -577,11 +577,13 @@ class KeycloakAdapter(KeycloakPort, KeycloakExceptionHandlerMixin):
 
     @override
     @ttl_cache_decorator(ttl_seconds=300, maxsize=100)  # Cache for 5 minutes
-    def get_user_by_username(self, username: str) -> KeycloakUserType | None:
+    def get_user_by_username(self, username: str, brief: bool = False) -> KeycloakUserType | None:
         """Get user details by username.
 
         Args:
             username: User's username
+            brief: Request Keycloak's brief representation, which leaves out attributes and
+                access details, when only basic fields such as names or existence are needed
 
         Returns:
             User details or None if not found
@@ -590,7 +592,8 @@ class KeycloakAdapter(KeycloakPort, KeycloakExceptionHandlerMixin):
             ValueError: If query fails
         """
         try:
-            users = self.admin_adapter.get_users({"username": username})
+            query = {"username": username, "briefRepresentation": True} if brief else {"username": username}
+            users = self.admin_adapter.get_users(query)
             return users[0] if users else None
         except KeycloakError as e:
             raise InternalError() from e
@@ -2028,11 +2031,13 @@ class AsyncKeycloakAdapter(AsyncKeycloakPort, KeycloakExceptionHandlerMixin):
 
     @override
     @alru_cache(ttl=300, maxsize=100)  # Cache for 5 minutes
-    async def get_user_by_username(self, username: str) -> KeycloakUserType | None:
+    async def get_user_by_username(self, username: str, brief: bool = False) -> KeycloakUserType | None:
         """Get user details by username.
 
         Args:
             username: User's username
+            brief: Request Keycloak's brief representation, which leaves out attributes and
+                access details, when only basic fields such as names or existence are needed
 
         Returns:
             User details or None if not found
@@ -2041,7 +2046,8 @@ class AsyncKeycloakAdapter(AsyncKeycloakPort, KeycloakExceptionHandlerMixin):
             ValueError: If query fails
         """
         try:
-            users = await self.admin_adapter.a_get_users({"username": username})
+            query = {"username": username, "briefRepresentation": True} if brief else {"username": username}
+            users = await self.admin_adapter.a_get_users(query)
             return users[0] if users else None
         except KeycloakError as e:
             self._handle_keycloak_exception(e, "get_user_by_username")
@@ -72,8 +72,8 @@ class KeycloakPort:
         raise NotImplementedError
 
     @abstractmethod
-    def get_user_by_username(self, username: str) -> KeycloakUserType | None:
-        """Get user details by username."""
+    def get_user_by_username(self, username: str, brief: bool = False) -> KeycloakUserType | None:
+        """Get user details by username, optionally as Keycloak's brief representation."""
         raise NotImplementedError
 
     @abstractmethod
@@ -404,8 +404,8 @@ class AsyncKeycloakPort:
         raise NotImplementedError
 
     @abstractmethod
-    async def get_user_by_username(self, username: str) -> KeycloakUserType | None:
-        """Get user details by username."""
+    async def get_user_by_username(self, username: str, brief: bool = False) -> KeycloakUserType | None:
+        """Get user details by username, optionally as Keycloak's brief representation."""
         raise NotImplementedError
 
     @abstractmethod
@@ -27,6 +27,7 @@ if TYPE_CHECKING:
         async_starrocks_sqlalchemy_atomic_decorator,
         postgres_sqlalchemy_atomic_decorator,
         sqlalchemy_atomic_decorator,
+        sqlalchemy_atomic_retry_decorator,
         sqlite_sqlalchemy_atomic_decorator,
         starrocks_sqlalchemy_atomic_decorator,
     )
@@ -56,6 +57,7 @@ def __getattr__(name: str) -> object:
         "async_starrocks_sqlalchemy_atomic_decorator",
         "postgres_sqlalchemy_atomic_decorator",
         "sqlalchemy_atomic_decorator",
+        "sqlalchemy_atomic_retry_decorator",
         "sqlite_sqlalchemy_atomic_decorator",
         "starrocks_sqlalchemy_atomic_decorator",
     }
@@ -71,6 +73,7 @@ def __getattr__(name: str) -> object:
                 async_starrocks_sqlalchemy_atomic_decorator,
                 postgres_sqlalchemy_atomic_decorator,
                 sqlalchemy_atomic_decorator,
+                sqlalchemy_atomic_retry_decorator,
                 sqlite_sqlalchemy_atomic_decorator,
                 starrocks_sqlalchemy_atomic_decorator,
             )
@@ -81,6 +84,7 @@ def __getattr__(name: str) -> object:
                 "async_starrocks_sqlalchemy_atomic_decorator": async_starrocks_sqlalchemy_atomic_decorator,
                 "postgres_sqlalchemy_atomic_decorator": postgres_sqlalchemy_atomic_decorator,
                 "sqlalchemy_atomic_decorator": sqlalchemy_atomic_decorator,
+                "sqlalchemy_atomic_retry_decorator": sqlalchemy_atomic_retry_decorator,
                 "sqlite_sqlalchemy_atomic_decorator": sqlite_sqlalchemy_atomic_decorator,
                 "starrocks_sqlalchemy_atomic_decorator": starrocks_sqlalchemy_atomic_decorator,
             }
@@ -106,6 +110,7 @@ __all__ = [
     "retry_decorator",
     "singleton_decorator",
     "sqlalchemy_atomic_decorator",
+    "sqlalchemy_atomic_retry_decorator",
     "sqlite_sqlalchemy_atomic_decorator",
     "starrocks_sqlalchemy_atomic_decorator",
     "timeout_decorator",
@@ -4,7 +4,10 @@ This module provides decorators for managing SQLAlchemy transactions with automa
 and support for different database types (PostgreSQL, SQLite, StarRocks).
 """
 
+import asyncio
+import inspect
 import logging
+import time
 from collections.abc import Awaitable, Callable
 from functools import partial, wraps
 from typing import Any, Literal, NoReturn, TypeVar, cast, overload
@@ -53,6 +56,9 @@ ATOMIC_BLOCK_CONFIGS = {
 # Type variables for function return types
 R = TypeVar("R")
 
+# Errors raised by the atomic decorators when the whole transaction can safely be replayed
+RETRYABLE_TRANSACTION_ERRORS: tuple[type[BaseError], ...] = (DatabaseSerializationError, DatabaseDeadlockError)
+
 
 def _handle_db_exception(exception: BaseException, db_type: str, func_name: str) -> NoReturn:
     """Handle database exceptions and raise appropriate errors.
@@ -317,6 +323,76 @@ def sqlalchemy_atomic_decorator[R](
         return partial(sqlalchemy_atomic_decorator, db_type=db_type, is_async=is_async)
 
 
+def sqlalchemy_atomic_retry_decorator(
+    max_retries: int = 3,
+    backoff: float = 0.01,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Retry a whole atomic transaction when it is aborted by a serialization failure or deadlock.
+
+    Databases running at SERIALIZABLE isolation (or detecting deadlocks) abort one of the
+    conflicting transactions and expect the client to replay it. This decorator must wrap an
+    atomic decorator, so every attempt runs in a fresh transaction. Attempts are delayed with
+    exponential backoff (``backoff * 2 ** attempt``). Both sync and async functions are supported.
+
+    Apply it only to the outermost atomic function. A nested block shares its session with the
+    enclosing transaction, which is already rolled back when the error surfaces.
+
+    Args:
+        max_retries (int): The maximum number of attempts. Defaults to 3.
+        backoff (float): The base delay in seconds between attempts. Defaults to 0.01.
+
+    Returns:
+        Callable: A decorator that adds the retry loop to the wrapped function.
+
+    Raises:
+        ValueError: If max_retries is less than 1.
+        DatabaseSerializationError: If every attempt fails with a serialization failure.
+        DatabaseDeadlockError: If every attempt fails with a deadlock.
+
+    Example:
+        @sqlalchemy_atomic_retry_decorator(max_retries=5)
+        @postgres_sqlalchemy_atomic_decorator
+        def transfer(source_id: int, target_id: int, amount: int) -> None:
+            # Database operations
+            pass
+    """
+    if max_retries < 1:
+        raise ValueError(f"max_retries must be at least 1, got {max_retries}")
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        func_name = getattr(func, "__name__", "unknown")
+
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                for attempt in range(max_retries - 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except RETRYABLE_TRANSACTION_ERRORS as e:
+                        logger.warning("Transaction %s aborted on attempt %d: %s", func_name, attempt + 1, e)
+                        await asyncio.sleep(backoff * 2**attempt)
+                # Last attempt lets the error propagate to the caller
+                return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(func)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            for attempt in range(max_retries - 1):
+                try:
+                    return func(*args, **kwargs)
+                except RETRYABLE_TRANSACTION_ERRORS as e:
+                    logger.warning("Transaction %s aborted on attempt %d: %s", func_name, attempt + 1, e)
+                    time.sleep(backoff * 2**attempt)
+            # Last attempt lets the error propagate to the caller
+            return func(*args, **kwargs)
+
+        return sync_wrapper
+
+    return decorator
+
+
 def postgres_sqlalchemy_atomic_decorator(function: Callable[..., Any] | None = None) -> Callable[..., Any] | partial:
     """Decorator for PostgreSQL atomic transactions.
 
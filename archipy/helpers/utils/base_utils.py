@@ -1,3 +1,4 @@
+import operator
 import re
 
 from archipy.helpers.utils.datetime_utils import DatetimeUtils
@@ -13,6 +14,11 @@ from archipy.models.errors import (
     InvalidPhoneNumberError,
 )
 
+# Pattern is compiled once at import instead of on every sanitization call
+_NON_DIGIT_PATTERN = re.compile(r"\D")
+# Position weights of the first nine national code digits
+_IRANIAN_NATIONAL_CODE_WEIGHTS = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+
 
 class BaseUtils(ErrorUtils, DatetimeUtils, PasswordUtils, JWTUtils, TOTPUtils, FileUtils, StringUtils):
     """A utility class that combines multiple utility functionalities into a single class.
@@ -31,7 +37,7 @@ class BaseUtils(ErrorUtils, DatetimeUtils, PasswordUtils, JWTUtils, TOTPUtils, F
             str: The sanitized phone number in a standardized format.
         """
         # Remove non-numeric characters
-        cleaned_number = re.sub(r"\D", "", landline_or_phone_number)
+        cleaned_number = _NON_DIGIT_PATTERN.sub("", landline_or_phone_number)
 
         # Standardize international format to local Iran format
         if cleaned_number.startswith("0098"):  # Handles "0098"
@@ -57,11 +63,10 @@ class BaseUtils(ErrorUtils, DatetimeUtils, PasswordUtils, JWTUtils, TOTPUtils, F
         """
         # Sanitize the input to remove spaces, dashes, or other non-numeric characters
         sanitized_number = cls.sanitize_iranian_landline_or_phone_number(phone_number)
-        # Define the regular expression pattern for Iranian phone numbers
-        iranian_mobile_pattern = re.compile(r"^09\d{9}$")  # Mobile numbers
 
-        # Check if the phone number matches either mobile or landline pattern
-        if not iranian_mobile_pattern.match(sanitized_number):
+        # The sanitized number holds digits only, so the mobile format `09` + 9 digits
+        # reduces to a length and prefix check
+        if len(sanitized_number) != 11 or not sanitized_number.startswith("09"):
             raise InvalidPhoneNumberError(phone_number)
 
     @classmethod
@@ -76,10 +81,10 @@ class BaseUtils(ErrorUtils, DatetimeUtils, PasswordUtils, JWTUtils, TOTPUtils, F
         """
         # Sanitize the input to remove spaces, dashes, or other non-numeric characters
         sanitized_number = cls.sanitize_iranian_landline_or_phone_number(landline_number)
-        # Landline examples: `0` + 2 to 4-digit area code + 7 to 8-digit local number
-        iranian_landline_pattern = re.compile(r"^0\d{2,4}\d{7,8}$")
 
-        if not iranian_landline_pattern.match(sanitized_number):
+        # Landline examples: `0` + 2 to 4-digit area code + 7 to 8-digit local number.
+        # The sanitized number holds digits only, so this is a length and prefix check.
+        if not 10 <= len(sanitized_number) <= 13 or not sanitized_number.startswith("0"):
             raise InvalidLandlineNumberError(landline_number)
 
     @classmethod
@@ -99,50 +104,16 @@ class BaseUtils(ErrorUtils, DatetimeUtils, PasswordUtils, JWTUtils, TOTPUtils, F
             national_code (str): A string containing the national ID to validate.
 
         Raises:
-            InvalidNationalCodeError: If the ID is invalid due to length or checksum.
+            InvalidNationalCodeError: If the ID is invalid due to length, non-digit characters or checksum.
         """
+        # Reject wrong lengths and non-digit characters before the checksum
+        if len(national_code) != 10 or not national_code.isdecimal():
+            raise InvalidNationalCodeError(national_code)
 
-        def _validate_length(national_code: str) -> None:
-            """Validates that the national code is exactly 10 digits long.
-
-            Args:
-                national_code (str): The national code to validate.
-
-            Raises:
-                InvalidNationalCodeError: If the length is not 10 digits.
-            """
-            if not len(national_code) == 10:
-                raise InvalidNationalCodeError(national_code)
-
-        def _calculate_weighted_sum(national_code: str) -> int:
-            """Calculates the weighted sum of the national code digits.
-
-            Args:
-                national_code (str): The national code to calculate the weighted sum for.
-
-            Returns:
-                int: The weighted sum of the national code digits.
-            """
-            return sum(int(digit) * (10 - i) for i, digit in enumerate(national_code[:-1]))
-
-        def _get_checksums(national_code: str) -> tuple[int, int]:
-            """Calculates the expected and actual checksums for the national code.
-
-            Args:
-                national_code (str): The national code to calculate checksums for.
-
-            Returns:
-                tuple[int, int]: A tuple containing the calculated checksum and the actual checksum.
-            """
-            weighted_sum = _calculate_weighted_sum(national_code)
-            remainder = weighted_sum % 11
-
-            calculated_checksum = remainder if remainder < 2 else 11 - remainder
-            actual_checksum = int(national_code[-1])
-
-            return calculated_checksum, actual_checksum
+        digits = tuple(map(int, national_code))
+        weighted_sum = sum(map(operator.mul, digits[:-1], _IRANIAN_NATIONAL_CODE_WEIGHTS, strict=True))
+        remainder = weighted_sum % 11
 
-        _validate_length(national_code)
-        calculated_checksum, actual_checksum = _get_checksums(national_code)
-        if calculated_checksum != actual_checksum:
+        calculated_checksum = remainder if remainder < 2 else 11 - remainder
+        if calculated_checksum != digits[-1]:
             raise InvalidNationalCodeError(national_code)
@@ -82,6 +82,30 @@ Feature: SQLAlchemy Atomic Transactions
       | postgres|
       | sqlite  |
 
+  Scenario Outline: Retry an atomic transaction aborted by a database lock
+    Given the application database is initialized for <db_type>
+    And test entities are defined
+    When an atomic transaction hits a database lock on its first 2 of 3 attempts
+    Then the retried transaction should succeed on attempt 3
+    And only the entity from the successful attempt should exist
+
+    Examples:
+      | db_type |
+      | postgres|
+      | sqlite  |
+
+  Scenario Outline: Propagate the database lock error once retries are exhausted
+    Given the application database is initialized for <db_type>
+    And test entities are defined
+    When an atomic transaction hits a database lock on its first 3 of 3 attempts
+    Then the database lock error should propagate after 3 attempts
+    And no entity from the failed attempts should exist
+
+    Examples:
+      | db_type |
+      | postgres|
+      | sqlite  |
+
   Scenario Outline: Verify session consistency across multiple atomic blocks
     Given the application database is initialized for <db_type>
     And test entities are defined
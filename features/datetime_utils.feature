@@ -55,6 +55,7 @@ Feature: Datetime Utilities
     When we check if the date is a holiday in Iran
     Then an error should be raised
 
+  @mock-holiday-api
   Scenario: Ensure caching mechanism works for holiday checks
 #    Nowruz, a holiday in Iran
     Given a Gregorian date "2025-03-27"
@@ -67,12 +68,14 @@ Feature: Datetime Utilities
     When we check if the date is a holiday in Iran
     Then the result should be True
 
+  @mock-holiday-api
   Scenario: Verify historical dates use longer cache TTL
 #    Test that historical dates get cached with HISTORICAL_CACHE_TTL
     Given a historical Gregorian date "2020-03-21"
     When we check if the date is a holiday in Iran with cache verification
     Then the result should be cached with historical TTL
 
+  @mock-holiday-api
   Scenario: Verify current dates use standard cache TTL
 #    Test that strictly future calendar dates get standard CACHE_TTL (today/past use historical TTL).
     Given a Gregorian date strictly after today
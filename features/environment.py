@@ -5,7 +5,10 @@ particularly focusing on setup/teardown of resources like databases
 and handling async operations.
 """
 
+import asyncio
 import logging
+import os
+import random
 import uuid
 
 from behave.model import Feature, Scenario
@@ -62,6 +65,14 @@ def before_all(context: Context) -> None:
     context.logger = logging.getLogger("behave.tests")
     context.logger.info("Starting test suite")
 
+    # Share one event loop across all async steps and async cleanups so pooled
+    # async connections stay bound to a live loop for the whole test run
+    context.async_runner = asyncio.Runner()
+    context.async_runner.get_loop()
+
+    # Auth settings never change during a run, resolve them once for the JWT steps
+    context.auth_config = BaseConfig.global_config().AUTH
+
     # Create the scenario context pool manager
     context.scenario_context_pool = ScenarioContextPoolManager()
 
@@ -156,15 +167,29 @@ def before_scenario(context: Context, scenario: Scenario) -> None:
 
     # Get the scenario-specific context from the pool
     scenario_context = context.scenario_context_pool.get_context(scenario.id)
+    # Set on the scenario layer, so behave discards it when the scenario ends
+    context.current_scenario_context = scenario_context
 
     logger.info(f"Starting scenario: {scenario.name} (ID: {scenario.id})")
 
+    # Resolve the async tag once so steps read a flag instead of scanning the tag list
+    context.is_async = "async" in scenario.tags
+
+    # Seed a per-scenario generator once so fixtures can build UUIDs without a syscall each
+    context.rng = random.Random(os.urandom(16))
+
     # Assign test containers to scenario context
     try:
         scenario_context.store("test_containers", context.test_containers)
     except Exception:
         logger.exception("Error setting test containers")
 
+    # Patch the holiday API once for the whole scenario instead of inside each step
+    if "mock-holiday-api" in scenario.effective_tags:
+        from features.test_helpers import start_holiday_api_mock
+
+        context.holiday_api_patcher = start_holiday_api_mock(scenario_context)
+
 
 def after_scenario(context: Context, scenario: Scenario) -> None:
     """Cleanup performed after each scenario runs."""
@@ -182,6 +207,32 @@ def after_scenario(context: Context, scenario: Scenario) -> None:
     except Exception:
         pass
 
+    # Restore the real holiday API patched in before_scenario
+    holiday_api_patcher = getattr(context, "holiday_api_patcher", None)
+    if holiday_api_patcher is not None:
+        holiday_api_patcher.stop()
+
+    scenario_context = getattr(context, "current_scenario_context", None)
+
+    # Delete the Elasticsearch indices and documents the scenario created
+    if scenario_context is not None and (
+        scenario_context.get("created_indices") or scenario_context.get("created_documents")
+    ):
+        try:
+            from features.steps.elastic_adapter_steps import cleanup_elasticsearch_scenario
+
+            context.async_runner.run(cleanup_elasticsearch_scenario(context))
+        except Exception:
+            logger.exception("Error cleaning up Elasticsearch test data")
+
+    # Close the Keycloak adapters the scenario built for its own realm and client
+    if scenario_context is not None and scenario_context.keycloak_adapters:
+        from features.test_helpers import close_keycloak_adapter
+
+        for adapter in scenario_context.keycloak_adapters:
+            close_keycloak_adapter(adapter, context.async_runner)
+        scenario_context.keycloak_adapters.clear()
+
     # Clean up the scenario context and remove from pool
     if hasattr(context, "scenario_context_pool"):
         context.scenario_context_pool.cleanup_context(scenario_id)
@@ -213,16 +264,8 @@ def after_feature(context: Context, feature: Feature) -> None:
                 )
                 context.logger.info("Stopped async gRPC server gracefully")
             else:
-                # Fallback: try to stop without thread/loop info
-                import asyncio
-
-                try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-
-                loop.run_until_complete(context.grpc_async_server.stop(grace=2.0))
+                # Fallback: stop on the shared event loop instead of spinning up a new one
+                context.async_runner.run(context.grpc_async_server.stop(grace=2.0))
                 context.logger.info("Stopped async gRPC server (fallback method)")
         except Exception as e:
             context.logger.warning(f"Error stopping async gRPC server: {e}")
@@ -243,4 +286,11 @@ def after_all(context: Context) -> None:
     if hasattr(context, "scenario_context_pool"):
         context.scenario_context_pool.cleanup_all()
 
+    # Close the shared event loop once every async cleanup has run on it
+    if hasattr(context, "async_runner"):
+        from features.test_helpers import close_shared_adapters
+
+        close_shared_adapters(context.async_runner)
+        context.async_runner.close()
+
     context.logger.info("Test suite completed")
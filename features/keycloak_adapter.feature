@@ -148,6 +148,25 @@ Feature: Keycloak Authentication Testing
       | sync         | testuser | pass123  | client-role      | Client Role             | test-realm      | Test Realm         | test-client      |
       | async        | asyncuser| async123 | async-client-role| Async Client Role       | async-test-realm| Async Test Realm   | async-test-client|
 
+  Scenario Outline: Client role verification from a table
+    Given a configured <adapter_type> Keycloak adapter
+    And I create a realm named "<realm_name>" with display name "<realm_display_name>" using <adapter_type> adapter
+    And I create a client named "<client_name>" in realm "<realm_name>" with service accounts and update adapter using <adapter_type> adapter
+    And I create a user with username "<username>" and password "<password>" using <adapter_type> adapter
+    When I create a client role named "<role1>" for client "<client_name>" with description "First Role" using <adapter_type> adapter
+    And I create a client role named "<role2>" for client "<client_name>" with description "Second Role" using <adapter_type> adapter
+    And I assign client role "<role1>" of client "<client_name>" to user "<username>" using <adapter_type> adapter
+    And I assign client role "<role2>" of client "<client_name>" to user "<username>" using <adapter_type> adapter
+    Then the following client roles should be assigned
+      | username   | role_name | client_name   |
+      | <username> | <role1>   | <client_name> |
+      | <username> | <role2>   | <client_name> |
+
+    Examples:
+      | adapter_type | username         | password | role1              | role2              | realm_name      | realm_display_name | client_name      |
+      | sync         | clientroleuser   | pass123  | client-role-one    | client-role-two    | test-realm      | Test Realm         | test-client      |
+      | async        | asyncclientrole  | async123 | async-client-one   | async-client-two   | async-test-realm| Async Test Realm   | async-test-client|
+
   Scenario Outline: User search operations
     Given a configured <adapter_type> Keycloak adapter
     And I create a realm named "<realm_name>" with display name "<realm_display_name>" using <adapter_type> adapter
@@ -177,6 +196,45 @@ Feature: Keycloak Authentication Testing
       | sync         | testuser | pass123  | John       | Doe       | test-realm      | Test Realm         | test-client      |
       | async        | asyncuser| async123 | Async      | User      | async-test-realm| Async Test Realm   | async-test-client|
 
+  Scenario Outline: Bulk realm role assignment
+    Given a configured <adapter_type> Keycloak adapter
+    And I create a realm named "<realm_name>" with display name "<realm_display_name>" using <adapter_type> adapter
+    And I create a client named "<client_name>" in realm "<realm_name>" with service accounts and update adapter using <adapter_type> adapter
+    And I create a user with username "<user1>" and password "<password>" using <adapter_type> adapter
+    And I create a user with username "<user2>" and password "<password>" using <adapter_type> adapter
+    And I create a realm role named "<role_name>" with description "<role_description>" using <adapter_type> adapter
+    When I assign the following realm roles using <adapter_type> adapter
+      | username | role_name   |
+      | <user1>  | <role_name> |
+      | <user2>  | <role_name> |
+    Then the <adapter_type> realm role assignment should succeed
+    And the user "<user1>" should have realm role "<role_name>"
+    And the user "<user2>" should have realm role "<role_name>"
+
+    Examples:
+      | adapter_type | user1          | user2          | password | role_name       | role_description | realm_name      | realm_display_name | client_name      |
+      | sync         | bulkroleuser1  | bulkroleuser2  | pass123  | bulk-role       | Bulk Role        | test-realm      | Test Realm         | test-client      |
+      | async        | asyncbulkrole1 | asyncbulkrole2 | async123 | async-bulk-role | Async Bulk Role  | async-test-realm| Async Test Realm   | async-test-client|
+
+  Scenario Outline: Bulk user update operations
+    Given a configured <adapter_type> Keycloak adapter
+    And I create a realm named "<realm_name>" with display name "<realm_display_name>" using <adapter_type> adapter
+    And I create a client named "<client_name>" in realm "<realm_name>" with service accounts and update adapter using <adapter_type> adapter
+    And I create a user with username "<user1>" and password "<password>" using <adapter_type> adapter
+    And I create a user with username "<user2>" and password "<password>" using <adapter_type> adapter
+    When I update the following users using <adapter_type> adapter
+      | username | first_name | last_name |
+      | <user1>  | John       | Doe       |
+      | <user2>  | Jane       | Roe       |
+    Then the <adapter_type> user update should succeed
+    And the user "<user1>" should have first name "John" and last name "Doe"
+    And the user "<user2>" should have first name "Jane" and last name "Roe"
+
+    Examples:
+      | adapter_type | user1           | user2           | password | realm_name      | realm_display_name | client_name      |
+      | sync         | bulkupdateuser1 | bulkupdateuser2 | pass123  | test-realm      | Test Realm         | test-client      |
+      | async        | asyncbulkupd1   | asyncbulkupd2   | async123 | async-test-realm| Async Test Realm   | async-test-client|
+
   Scenario Outline: Password reset operations
     Given a configured <adapter_type> Keycloak adapter
     And I create a realm named "<realm_name>" with display name "<realm_display_name>" using <adapter_type> adapter
@@ -13,14 +13,45 @@ class ScenarioContext:
         """Initialize with a unique scenario ID."""
         self.scenario_id = scenario_id
         self.storage = {}
+        # Storage keys indexed by their first "_"-separated segment, and the keys naming errors
+        self.keys_by_prefix = {}
+        self.error_keys = set()
         self.db_file = None
         self.adapter = None
         self.async_adapter = None
+        self.outer_transaction = None
+        self.async_outer_transaction = None
         self.entities = {}
         self.entity_ids = {}
+        # Atomic transaction step state, kept as plain attributes instead of storage keys
+        self.db_type = "sqlite"
+        self.rolled_back_uuid = None
+        self.failed_transaction_exception = None
+        self.failed_inner_exception = None
+        self.original_description = None
+        self.original_updated_at = None
+        self.updated_description = None
+        self.updated_at = None
+        self.is_deleted = None
+        self.normal_exception = None
+        self.deadlock_exception = None
+        self.retry_attempt_uuids = []
+        self.retry_result_uuid = None
+        self.retry_exception = None
+        self.query_results = None
+        # Keycloak user ids by username
+        self.user_ids = {}
+        # Keycloak adapters built for this scenario's realm and client, closed when it ends
+        self.keycloak_adapters = []
 
     def store(self, key, value):
         """Store an object with the given key."""
+        if key not in self.storage:
+            prefix, sep, _ = key.partition("_")
+            if sep:
+                self.keys_by_prefix.setdefault(prefix, set()).add(key)
+            if "error" in key.lower():
+                self.error_keys.add(key)
         self.storage[key] = value
 
     def get(self, key, default=None):
@@ -38,6 +69,11 @@ class ScenarioContext:
                 elif hasattr(self.adapter, "session_manager") and hasattr(self.adapter.session_manager, "engine"):
                     # First remove any open sessions
                     self.adapter.session_manager.remove_session()
+                    # Discard the scenario's writes by rolling back the outer transaction
+                    if self.outer_transaction:
+                        connection, transaction = self.outer_transaction
+                        transaction.rollback()
+                        connection.close()
                     # Then dispose of the engine
                     self.adapter.session_manager.engine.dispose()
             except Exception as e:
@@ -52,8 +88,8 @@ class ScenarioContext:
                     # If we have a running loop, create a task
                     asyncio.create_task(self.async_cleanup())
                 except RuntimeError:
-                    # No running loop, run in new loop
-                    asyncio.run(self.async_cleanup())
+                    # No running loop, reuse the shared loop the async steps ran on
+                    asyncio.get_event_loop().run_until_complete(self.async_cleanup())
             except Exception as e:
                 print(f"Error in async cleanup: {e}")
 
@@ -80,6 +116,10 @@ class ScenarioContext:
                 ):
                     # Clean up async sessions and engine
                     await self.async_adapter.session_manager.remove_session()
+                    if self.async_outer_transaction:
+                        connection, transaction = self.async_outer_transaction
+                        await transaction.rollback()
+                        await connection.close()
                     await self.async_adapter.session_manager.engine.dispose()
             except Exception as e:
                 print(f"Error in async cleanup: {e}")
@@ -17,9 +17,10 @@ class ScenarioContextPoolManager(metaclass=Singleton):
 
     def get_context(self, scenario_id: UUID) -> ScenarioContext:
         """Get or create a scenario context for the given ID."""
-        if scenario_id not in self.context_pool.keys():
-            self.context_pool[scenario_id] = ScenarioContext(scenario_id)
-        return self.context_pool[scenario_id]
+        scenario_context = self.context_pool.get(scenario_id)
+        if scenario_context is None:
+            scenario_context = self.context_pool[scenario_id] = ScenarioContext(scenario_id)
+        return scenario_context
 
     def cleanup_context(self, scenario_id: UUID) -> None:
         """Clean up a specific scenario context."""
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from behave import given, then, when
 from fastapi import Depends, FastAPI
 from fastapi.routing import APIRoute
@@ -9,6 +11,11 @@ from archipy.helpers.utils.app_utils import AppUtils, FastAPIExceptionHandler, F
 from archipy.models.errors import BaseError
 from features.test_helpers import get_current_scenario_context
 
+# Exception types an endpoint can raise in the feature file
+ENDPOINT_ERROR_TYPES = MappingProxyType({
+    "BaseError": BaseError,
+})
+
 
 @given("a FastAPI app")
 def step_given_fastapi_app(context):
@@ -282,15 +289,16 @@ def step_then_custom_header_not_exposed(context):
 def step_when_endpoint_raises_exception(context, exception_type):
     scenario_context = get_current_scenario_context(context)
     app = scenario_context.get("app")
+    error_class = ENDPOINT_ERROR_TYPES[exception_type]
 
     app.add_exception_handler(
-        eval(exception_type),
+        error_class,
         FastAPIExceptionHandler.custom_exception_handler,
     )
 
     @app.get("/test-exception")
     def raise_exception():
-        raise eval(exception_type)()
+        raise error_class()
 
     client = TestClient(app)
     response = client.get("/test-exception")
@@ -4,6 +4,7 @@ This module contains step definitions for both synchronous and asynchronous
 atomic transaction scenarios.
 """
 
+import functools
 import logging
 import os
 import tempfile
@@ -25,19 +26,53 @@ from archipy.helpers.decorators.sqlalchemy_atomic import (
     async_postgres_sqlalchemy_atomic_decorator,
     async_sqlite_sqlalchemy_atomic_decorator,
     postgres_sqlalchemy_atomic_decorator,
+    sqlalchemy_atomic_retry_decorator,
     sqlite_sqlalchemy_atomic_decorator,
 )
 from archipy.models.entities.sqlalchemy.base_entities import BaseEntity
-from archipy.models.errors import InternalError
-from features.test_entity import RelatedTestEntity, TestAdminEntity, TestEntity, TestManagerEntity
+from archipy.models.errors import DatabaseDeadlockError, InternalError
+from features.test_entity import TestAdminEntity, TestEntity, TestManagerEntity
 from features.test_entity_factory import TestEntityFactory
 from features.test_helpers import (
+    async_bind_session_to_outer_transaction,
     async_schema_setup,
+    async_warm_up_connection_pool,
+    bind_session_to_outer_transaction,
+    fast_uuid4,
     get_adapter,
     get_async_adapter,
     get_current_scenario_context,
+    warm_up_connection_pool,
+)
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import selectinload
+
+steps_logger = logging.getLogger("behave.steps")
+
+# Pool settings for the test adapters. A small LIFO pool keeps a warm connection
+# checked in between the many short atomic blocks a scenario runs. Pre-ping is off
+# by default since a local SQLite file connection cannot go stale between checkouts.
+TEST_POOL_SETTINGS = {
+    "POOL_SIZE": 5,
+    "POOL_MAX_OVERFLOW": 10,
+    "POOL_PRE_PING": False,
+    "POOL_USE_LIFO": True,
+}
+
+# The PostgreSQL container can drop idle connections, so its pool keeps pre-ping
+POSTGRES_TEST_POOL_SETTINGS = {**TEST_POOL_SETTINGS, "POOL_PRE_PING": True}
+
+# Statements built once and reused with bound parameters, so every execution hits
+# SQLAlchemy's compiled-statement cache without rebuilding the expression tree
+DESCRIPTIONS_QUERY = select(TestEntity.test_uuid, TestEntity.description).where(
+    TestEntity.test_uuid.in_(bindparam("entity_uuids", expanding=True)),
+)
+ENTITY_WITH_RELATED_QUERY = (
+    select(TestEntity)
+    .options(selectinload(TestEntity.related_entities))
+    .where(TestEntity.test_uuid == bindparam("entity_uuid"))
 )
-from sqlalchemy import select
 
 
 def store_entity(context, entity, key=None):
@@ -53,8 +88,8 @@ def store_entity(context, entity, key=None):
     scenario_context.entities[uuid_str] = entity
     scenario_context.entity_ids[key] = uuid_str
 
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
-    logger.info(f"Stored entity {key} with UUID {uuid_str}")
+    logger = getattr(context, "logger", steps_logger)
+    logger.info("Stored entity %s with UUID %s", key, uuid_str)
 
     return uuid_str
 
@@ -109,6 +144,49 @@ def _get_atomic_decorator(db_type: str, is_async: bool = False):
         return async_sqlite_sqlalchemy_atomic_decorator if is_async else sqlite_sqlalchemy_atomic_decorator
 
 
+@functools.cache
+def _atomic(func, db_type: str, is_async: bool = False):
+    """Wrap a module-level operation in the atomic decorator for the database type.
+
+    The wrapper is built once per (function, database type) pair and reused by every step.
+
+    Args:
+        func: Module-level function taking the adapter as its first argument
+        db_type: Database type ('postgres' or 'sqlite')
+        is_async: Whether func is a coroutine function
+
+    Returns:
+        The atomic-wrapped function
+    """
+    return _get_atomic_decorator(db_type, is_async=is_async)(func)
+
+
+def _create_entities(adapter, entities):
+    """Insert the entities through the sync adapter with a single flush."""
+    adapter.bulk_create(entities)
+    return entities
+
+
+def _fetch_descriptions(adapter, entity_uuids):
+    """Return the description of each TestEntity, or None for entities that do not exist."""
+    session = adapter.get_session()
+    found = dict(session.execute(DESCRIPTIONS_QUERY, {"entity_uuids": entity_uuids}).tuples())
+    return [found.get(entity_uuid) for entity_uuid in entity_uuids]
+
+
+async def _async_create_entities(async_adapter, entities):
+    """Insert the entities through the async adapter with a single flush."""
+    await async_adapter.bulk_create(entities)
+    return entities
+
+
+async def _async_fetch_descriptions(async_adapter, entity_uuids):
+    """Return the description of each TestEntity, or None for entities that do not exist."""
+    session = async_adapter.get_session()
+    found = dict((await session.execute(DESCRIPTIONS_QUERY, {"entity_uuids": entity_uuids})).tuples())
+    return [found.get(entity_uuid) for entity_uuid in entity_uuids]
+
+
 def _get_session_registry(db_type: str):
     """Get the appropriate session manager registry for the database type.
 
@@ -147,13 +225,13 @@ async def step_given_database_initialized(context, db_type: str):
         context: Behave context
         db_type: Database type ('postgres' or 'sqlite')
     """
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
 
     # Get the current scenario context
     scenario_context = get_current_scenario_context(context)
 
     # Store database type in scenario context for later use
-    scenario_context.store("db_type", db_type)
+    scenario_context.db_type = db_type
 
     # Get the appropriate registry and adapter classes
     session_registry = _get_session_registry(db_type)
@@ -162,9 +240,9 @@ async def step_given_database_initialized(context, db_type: str):
     if db_type == "postgres":
         # Use PostgreSQL container connection details
         global_config = BaseConfig.global_config()
-        postgres_config = global_config.POSTGRES_SQLALCHEMY
+        postgres_config = global_config.POSTGRES_SQLALCHEMY.model_copy(update=POSTGRES_TEST_POOL_SETTINGS)
 
-        logger.info(f"Creating PostgreSQL adapter with host: {postgres_config.HOST}, port: {postgres_config.PORT}")
+        logger.info("Creating PostgreSQL adapter with host: %s, port: %s", postgres_config.HOST, postgres_config.PORT)
 
         # Create sync adapter
         adapter = sync_adapter_class(orm_config=postgres_config)
@@ -175,6 +253,10 @@ async def step_given_database_initialized(context, db_type: str):
         logger.info("Creating database schema with sync PostgreSQL adapter")
         BaseEntity.metadata.drop_all(adapter.session_manager.engine)
         BaseEntity.metadata.create_all(adapter.session_manager.engine)
+        warm_up_connection_pool(adapter.session_manager.engine, TEST_POOL_SETTINGS["POOL_SIZE"])
+
+        # Run the scenario inside an outer transaction that is rolled back on cleanup
+        scenario_context.outer_transaction = bind_session_to_outer_transaction(adapter.session_manager)
 
         # For async tests, create and set up the async adapter
         if any("async" in tag.lower() for tag in context.scenario.tags):
@@ -189,10 +271,17 @@ async def step_given_database_initialized(context, db_type: str):
                 # Create schema with async adapter
                 logger.info("Creating database schema with async PostgreSQL adapter")
                 await async_schema_setup(async_adapter)
+                await async_warm_up_connection_pool(
+                    async_adapter.session_manager.engine,
+                    TEST_POOL_SETTINGS["POOL_SIZE"],
+                )
+                scenario_context.async_outer_transaction = await async_bind_session_to_outer_transaction(
+                    async_adapter.session_manager,
+                )
 
                 logger.info("Async PostgreSQL adapter and schema setup completed")
             except Exception as e:
-                logger.exception(f"Error setting up async PostgreSQL adapter: {e}")
+                logger.exception("Error setting up async PostgreSQL adapter: %s", e)
 
     else:  # sqlite
         # Use file-based SQLite database
@@ -204,22 +293,23 @@ async def step_given_database_initialized(context, db_type: str):
         if os.path.exists(db_file):
             try:
                 os.remove(db_file)
-                logger.info(f"Removed existing database file: {db_file}")
+                logger.info("Removed existing database file: %s", db_file)
             except Exception as e:
-                logger.exception(f"Failed to remove existing database file: {e}")
+                logger.exception("Failed to remove existing database file: %s", e)
                 # Generate a new unique name to avoid conflicts
                 db_file = os.path.join(temp_dir, f"test_db_{uuid.uuid4().hex}.sqlite")
-                logger.info(f"Using alternative database file: {db_file}")
+                logger.info("Using alternative database file: %s", db_file)
 
         # Store the file path in the scenario context
         scenario_context.db_file = db_file
 
-        logger.info(f"Creating SQLite adapter with database: {db_file}")
+        logger.info("Creating SQLite adapter with database: %s", db_file)
 
         # Create configuration with file-based database
         sync_config = SQLiteSQLAlchemyConfig(
             DRIVER_NAME="sqlite",
             DATABASE=db_file,
+            **TEST_POOL_SETTINGS,
         )
 
         # Create adapter for tests and store in scenario context
@@ -231,15 +321,17 @@ async def step_given_database_initialized(context, db_type: str):
         logger.info("Creating database schema with sync SQLite adapter")
         BaseEntity.metadata.drop_all(adapter.session_manager.engine)
         BaseEntity.metadata.create_all(adapter.session_manager.engine)
+        warm_up_connection_pool(adapter.session_manager.engine, TEST_POOL_SETTINGS["POOL_SIZE"])
 
         # For async tests, create and set up the async adapter
         if any("async" in tag.lower() for tag in context.scenario.tags):
-            logger.info(f"Creating async SQLite adapter with database: {db_file}")
+            logger.info("Creating async SQLite adapter with database: %s", db_file)
 
             # Create async config with the same database file
             async_config = SQLiteSQLAlchemyConfig(
                 DRIVER_NAME="sqlite+aiosqlite",
                 DATABASE=db_file,
+                **TEST_POOL_SETTINGS,
             )
 
             try:
@@ -251,16 +343,20 @@ async def step_given_database_initialized(context, db_type: str):
                 # Create schema with async adapter
                 logger.info("Creating database schema with async SQLite adapter")
                 await async_schema_setup(async_adapter)
+                await async_warm_up_connection_pool(
+                    async_adapter.session_manager.engine,
+                    TEST_POOL_SETTINGS["POOL_SIZE"],
+                )
 
                 logger.info("Async SQLite adapter and schema setup completed")
             except Exception as e:
-                logger.exception(f"Error setting up async SQLite adapter: {e}")
+                logger.exception("Error setting up async SQLite adapter: %s", e)
 
 
 @given("test entities are defined")
 def step_given_test_entities_defined(context):
     """Verify that test entities are properly defined."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     logger.info("Verifying test entity definitions")
 
     # Verify TestEntity is properly defined
@@ -278,80 +374,56 @@ def step_given_test_entities_defined(context):
 @when("a new entity is created in an atomic transaction")
 def step_when_entity_created_in_atomic(context):
     """Create a new entity within an atomic transaction."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    adapter = get_adapter(context)
 
     # Generate a UUID for the entity
-    test_uuid = uuid.uuid4()
+    test_uuid = fast_uuid4(context.rng)
+    logger.info("Creating entity with UUID %s", test_uuid)
 
-    atomic_decorator = _get_atomic_decorator(db_type, is_async=False)
-
-    @atomic_decorator
-    def create_entity_atomic():
-        """Create a new entity within an atomic block."""
-        logger.info(f"Creating entity with UUID {test_uuid}")
-
-        entity = TestEntityFactory.create_test_entity(
-            test_uuid=test_uuid,
-            description="Entity created in atomic transaction",
-        )
-
-        # Use the scenario-specific adapter
-        adapter = get_adapter(context)
-        adapter.create(entity)
-
-        # Store the entity in the scenario context
-        store_entity(context, entity, "test_entity")
-
-        return entity
+    entity = TestEntityFactory.create_test_entity(
+        test_uuid=test_uuid,
+        description="Entity created in atomic transaction",
+    )
+    store_entity(context, entity, "test_entity")
 
     # Execute the atomic operation
-    create_entity_atomic()
+    _atomic(_create_entities, db_type)(adapter, [entity])
     logger.info("Entity created successfully")
 
 
 @then("the entity should be retrievable")
 def step_then_entity_should_be_retrievable(context):
     """Verify the entity exists after atomic transaction."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    adapter = get_adapter(context)
 
     # Get the entity's UUID from scenario context
     entity_uuid = uuid.UUID(get_entity_id(context, "test_entity"))
-    logger.info(f"Retrieving entity with UUID {entity_uuid}")
-
-    atomic_decorator = _get_atomic_decorator(db_type, is_async=False)
-
-    @atomic_decorator
-    def get_entity():
-        # Get the adapter from scenario context
-        adapter = get_adapter(context)
-        session = adapter.get_session()
-
-        retrieved_entity = session.get(TestEntity, entity_uuid)
-        assert retrieved_entity is not None, "Entity not found in database after atomic transaction"
-        assert (
-            retrieved_entity.description == "Entity created in atomic transaction"
-        ), "Entity has incorrect description"
-        logger.info("Entity retrieved successfully")
-        return retrieved_entity
+    logger.info("Retrieving entity with UUID %s", entity_uuid)
 
-    get_entity()
+    description = _atomic(_fetch_descriptions, db_type)(adapter, [entity_uuid])[0]
+    assert description is not None, "Entity not found in database after atomic transaction"
+    assert description == "Entity created in atomic transaction", "Entity has incorrect description"
+    logger.info("Entity retrieved successfully")
 
 
 @when("a new entity creation fails within an atomic transaction")
 def step_when_entity_creation_fails_in_atomic(context):
     """Attempt to create an entity with a failure that causes rollback."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    adapter = get_adapter(context)
 
     # Generate a UUID for the entity
-    test_uuid = uuid.uuid4()
+    test_uuid = fast_uuid4(context.rng)
     scenario_context.rolled_back_uuid = test_uuid
-    logger.info(f"Attempting to create entity with UUID {test_uuid} (will fail)")
+    logger.info("Attempting to create entity with UUID %s (will fail)", test_uuid)
 
     try:
         atomic_decorator = _get_atomic_decorator(db_type, is_async=False)
@@ -363,8 +435,6 @@ def step_when_entity_creation_fails_in_atomic(context):
                 test_uuid=test_uuid,
                 description="Entity that should be rolled back",
             )
-            # Get the adapter from scenario context
-            adapter = get_adapter(context)
             adapter.create(entity)
 
             # Store the UUID for verification
@@ -377,10 +447,10 @@ def step_when_entity_creation_fails_in_atomic(context):
         create_entity_with_failure()
     except Exception as e:
         # We expect this exception
-        logger.info(f"Expected exception caught: {type(e).__name__} - {str(e)}")
+        logger.info("Expected exception caught: %s - %s", type(e).__name__, e)
         print(f"DEBUG: Caught exception type: {type(e).__name__}, message: {str(e)}")
         # Store the exception to verify it later
-        scenario_context.store("failed_transaction_exception", e)
+        scenario_context.failed_transaction_exception = e
     else:
         assert False, "Exception was not raised as expected"
 
@@ -388,47 +458,39 @@ def step_when_entity_creation_fails_in_atomic(context):
 @then("no entity should exist in the database")
 def step_then_no_entity_should_exist(context):
     """Verify the entity doesn't exist after failed atomic transaction."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
 
     # Get a fresh session to verify rollback
     adapter = get_adapter(context)
-    atomic_decorator = _get_atomic_decorator(db_type, is_async=False)
-
-    @atomic_decorator
-    def check_entity_absence():
-        adapter = get_adapter(context)
-        session = adapter.get_session()
-        retrieved_entity = session.get(TestEntity, scenario_context.rolled_back_uuid)
-        assert retrieved_entity is None, "Entity found in database after failed atomic transaction"
-        logger.info("Verified entity doesn't exist (rollback successful)")
-        return retrieved_entity
-
-    check_entity_absence()
+    description = _atomic(_fetch_descriptions, db_type)(adapter, [scenario_context.rolled_back_uuid])[0]
+    assert description is None, "Entity found in database after failed atomic transaction"
+    logger.info("Verified entity doesn't exist (rollback successful)")
 
 
 @then("the database session should remain usable")
 def step_then_session_should_remain_usable(context):
     """Verify the session is still usable after a failed transaction."""
-    logger = context.__dict__.get("logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    adapter = get_adapter(context)
     logger.info("Verifying session is still usable after rollback")
     atomic_decorator = _get_atomic_decorator(db_type, is_async=False)
 
+    @sqlalchemy_atomic_retry_decorator()
     @atomic_decorator
     def verify_session_usable():
         # Create a new entity to test the session is still working
-        test_uuid = uuid.uuid4()
-        logger.info(f"Creating test entity with UUID {test_uuid}")
+        test_uuid = fast_uuid4(context.rng)
+        logger.info("Creating test entity with UUID %s", test_uuid)
 
         # Create a new entity with the fresh session
         entity = TestEntityFactory.create_test_entity(
             test_uuid=test_uuid,
             description="Entity to test session usability",
         )
-        adapter = get_adapter(context)
         adapter.create(entity)
 
         # Try to retrieve it to confirm session is working
@@ -448,14 +510,15 @@ def step_then_session_should_remain_usable(context):
 @when("nested atomic transactions are executed")
 def step_when_nested_atomic_executed(context):
     """Test nested atomic transactions, both successful and failing."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    adapter = get_adapter(context)
 
     # Create test UUIDs
-    outer_uuid = uuid.uuid4()
-    inner_uuid = uuid.uuid4()
-    failing_uuid = uuid.uuid4()
+    outer_uuid = fast_uuid4(context.rng)
+    inner_uuid = fast_uuid4(context.rng)
+    failing_uuid = fast_uuid4(context.rng)
 
     # Store UUIDs for verification
     scenario_context.entity_ids["outer_entity"] = str(outer_uuid)
@@ -470,10 +533,9 @@ def step_when_nested_atomic_executed(context):
         @atomic_decorator
         def outer_atomic():
             """Execute the outermost atomic block."""
-            logger.info(f"Creating outer entity with UUID {outer_uuid}")
+            logger.info("Creating outer entity with UUID %s", outer_uuid)
 
             # Create the outer entity
-            adapter = get_adapter(context)
             outer_entity = TestEntityFactory.create_test_entity(
                 test_uuid=outer_uuid,
                 description="Outer entity from nested transaction",
@@ -485,10 +547,9 @@ def step_when_nested_atomic_executed(context):
                 @atomic_decorator
                 def inner_atomic():
                     """Execute a successful inner atomic block."""
-                    logger.info(f"Creating inner entity with UUID {inner_uuid}")
+                    logger.info("Creating inner entity with UUID %s", inner_uuid)
 
                     # Create the inner entity (should succeed)
-                    adapter = get_adapter(context)
                     inner_entity = TestEntityFactory.create_test_entity(
                         test_uuid=inner_uuid,
                         description="Inner entity from nested transaction",
@@ -497,7 +558,7 @@ def step_when_nested_atomic_executed(context):
                     return inner_entity
 
                 inner_entity = inner_atomic()
-                logger.info(f"Successfully created inner entity: {inner_entity}")
+                logger.info("Successfully created inner entity: %s", inner_entity)
 
                 # Now test a failing inner transaction
                 try:
@@ -505,10 +566,9 @@ def step_when_nested_atomic_executed(context):
                     @atomic_decorator
                     def failing_inner_atomic():
                         """Execute a failing inner atomic block."""
-                        logger.info(f"Creating entity with UUID {failing_uuid} (will fail)")
+                        logger.info("Creating entity with UUID %s (will fail)", failing_uuid)
 
                         # Create entity that should be rolled back
-                        adapter = get_adapter(context)
                         failing_entity = TestEntityFactory.create_test_entity(
                             test_uuid=failing_uuid,
                             description="Entity from failing nested transaction",
@@ -522,23 +582,23 @@ def step_when_nested_atomic_executed(context):
                     failing_inner_atomic()
                 except Exception as e:
                     # We expect this exception
-                    logger.info(f"Expected exception caught in inner block: {type(e).__name__} - {str(e)}")
+                    logger.info("Expected exception caught in inner block: %s - %s", type(e).__name__, e)
                     print(f"DEBUG: Caught inner exception type: {type(e).__name__}, message: {str(e)}")
                     # Store the exception to verify it later
-                    scenario_context.store("failed_inner_exception", e)
+                    scenario_context.failed_inner_exception = e
 
                 return outer_entity
 
             except Exception as e:
-                logger.error(f"Unexpected error in outer block: {str(e)}")
+                logger.error("Unexpected error in outer block: %s", e)
                 raise
 
         # Execute the transaction
         outer_entity = outer_atomic()
-        logger.info(f"Successfully completed nested transactions, with outer entity: {outer_entity}")
+        logger.info("Successfully completed nested transactions, with outer entity: %s", outer_entity)
 
     except Exception as e:
-        logger.error(f"Unexpected error in nested transaction test: {str(e)}")
+        logger.error("Unexpected error in nested transaction test: %s", e)
         print(f"DEBUG: Unexpected outer exception: {type(e).__name__}, message: {str(e)}")
         raise
 
@@ -550,75 +610,56 @@ def step_then_successful_nested_visible(context):
     Note: When a failing inner transaction causes a rollback, it cascades to the outer transaction,
     so all entities (including successful inner and outer) are rolled back.
     """
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    adapter = get_adapter(context)
 
     # Get UUIDs for verification
     entity1_uuid = uuid.UUID(scenario_context.entity_ids["outer_entity"])
     entity2_uuid = uuid.UUID(scenario_context.entity_ids["inner_entity"])
 
     logger.info("Verifying nested transaction entities after cascading rollback")
-    atomic_decorator = _get_atomic_decorator(db_type, is_async=False)
-
-    @atomic_decorator
-    def verify_nested_results():
-        adapter = get_adapter(context)
-        session = adapter.get_session()
+    entity1, entity2 = _atomic(_fetch_descriptions, db_type)(adapter, [entity1_uuid, entity2_uuid])
 
-        # When a failing inner transaction causes a rollback, it cascades to the outer transaction
-        # So all entities (including successful inner and outer) should be rolled back
-        # Check entity 1 (outer atomic) - should NOT be visible due to cascading rollback
-        entity1 = session.get(TestEntity, entity1_uuid)
-        assert entity1 is None, "Entity 1 (outer) found after cascading rollback from failed inner transaction"
+    # When a failing inner transaction causes a rollback, it cascades to the outer transaction
+    # So all entities (including successful inner and outer) should be rolled back
+    # Check entity 1 (outer atomic) - should NOT be visible due to cascading rollback
+    assert entity1 is None, "Entity 1 (outer) found after cascading rollback from failed inner transaction"
 
-        # Check entity 2 (successful inner atomic) - should NOT be visible due to cascading rollback
-        entity2 = session.get(TestEntity, entity2_uuid)
-        assert entity2 is None, "Entity 2 (inner) found after cascading rollback from failed inner transaction"
-        logger.info("Verified that all entities were rolled back due to cascading failure")
-
-        return True
-
-    verify_nested_results()
+    # Check entity 2 (successful inner atomic) - should NOT be visible due to cascading rollback
+    assert entity2 is None, "Entity 2 (inner) found after cascading rollback from failed inner transaction"
+    logger.info("Verified that all entities were rolled back due to cascading failure")
 
 
 @then("operations from failed nested transactions should be rolled back")
 def step_then_failed_nested_rolled_back(context):
     """Verify that entities from failed nested transactions don't exist."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    adapter = get_adapter(context)
 
     # Get UUID for verification
     entity3_uuid = uuid.UUID(scenario_context.entity_ids["failing_entity"])
-    logger.info(f"Verifying entity 3 with UUID {entity3_uuid} doesn't exist")
-    atomic_decorator = _get_atomic_decorator(db_type, is_async=False)
-
-    @atomic_decorator
-    def verify_rollback():
-        adapter = get_adapter(context)
-        session = adapter.get_session()
-
-        # Check entity 3 (failed inner atomic) - should not exist
-        entity3 = session.get(TestEntity, entity3_uuid)
-        assert entity3 is None, "Entity 3 found after failed inner atomic transaction"
-        logger.info("Verified entity 3 doesn't exist (rollback successful)")
-
-        return True
+    logger.info("Verifying entity 3 with UUID %s doesn't exist", entity3_uuid)
 
-    verify_rollback()
+    # Check entity 3 (failed inner atomic) - should not exist
+    entity3 = _atomic(_fetch_descriptions, db_type)(adapter, [entity3_uuid])[0]
+    assert entity3 is None, "Entity 3 found after failed inner atomic transaction"
+    logger.info("Verified entity 3 doesn't exist (rollback successful)")
 
 
 @given("an entity exists in the database")
 def step_given_entity_exists(context):
     """Create an entity in the database for testing updates."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
 
     # Generate a UUID for the entity
-    test_uuid = uuid.uuid4()
-    logger.info(f"Creating existing entity with UUID {test_uuid}")
+    test_uuid = fast_uuid4(context.rng)
+    logger.info("Creating existing entity with UUID %s", test_uuid)
     adapter = get_adapter(context)
     atomic_decorator = _get_atomic_decorator(db_type, is_async=False)
 
@@ -630,8 +671,8 @@ def step_given_entity_exists(context):
         # Store the entity for later retrieval
         store_entity(context, entity, "existing_entity")
         # Store original values for comparison
-        scenario_context.store("original_description", entity.description)
-        scenario_context.store("original_updated_at", getattr(entity, "updated_at", None))
+        scenario_context.original_description = entity.description
+        scenario_context.original_updated_at = getattr(entity, "updated_at", None)
 
     create_entity()
     logger.info("Entity created successfully")
@@ -640,29 +681,29 @@ def step_given_entity_exists(context):
 @when("the entity is updated within an atomic transaction")
 def step_when_entity_updated_in_atomic(context):
     """Update an entity within an atomic transaction."""
-    logger = context.__dict__.get("logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    adapter = get_adapter(context)
 
     # Get the entity UUID from context
     entity_uuid = uuid.UUID(scenario_context.entity_ids.get("existing_entity"))
-    logger.info(f"Updating entity with UUID {entity_uuid}")
+    logger.info("Updating entity with UUID %s", entity_uuid)
     atomic_decorator = _get_atomic_decorator(db_type, is_async=False)
 
     @atomic_decorator
     def update_entity():
-        adapter = get_adapter(context)
         session = adapter.get_session()
         entity = session.get(TestEntity, entity_uuid)
 
         # Verify we got the entity before updating
         if entity is None:
-            logger.exception(f"Entity with UUID {entity_uuid} not found for update")
+            logger.exception("Entity with UUID %s not found for update", entity_uuid)
             assert False, f"Entity with UUID {entity_uuid} not found for update"
 
         # Store the original description for verification
-        scenario_context.store("original_description", entity.description)
-        scenario_context.store("original_updated_at", getattr(entity, "updated_at", None))
+        scenario_context.original_description = entity.description
+        scenario_context.original_updated_at = getattr(entity, "updated_at", None)
 
         # Update properties
         entity.description = "Updated Description"
@@ -670,9 +711,9 @@ def step_when_entity_updated_in_atomic(context):
         entity.is_deleted = True
 
         # Store the updated entity's values for verification
-        scenario_context.store("updated_description", entity.description)
-        scenario_context.store("updated_at", entity.updated_at)
-        scenario_context.store("is_deleted", entity.is_deleted)
+        scenario_context.updated_description = entity.description
+        scenario_context.updated_at = entity.updated_at
+        scenario_context.is_deleted = entity.is_deleted
 
         return entity
 
@@ -683,43 +724,42 @@ def step_when_entity_updated_in_atomic(context):
 @then("the entity properties should reflect the updates")
 def step_then_entity_properties_reflect_updates(context):
     """Verify entity properties are updated correctly."""
-    logger = context.__dict__.get("logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    adapter = get_adapter(context)
 
     # Get the entity UUID from context
     entity_uuid = uuid.UUID(scenario_context.entity_ids.get("existing_entity"))
-    logger.info(f"Verifying updates for entity with UUID {entity_uuid}")
+    logger.info("Verifying updates for entity with UUID %s", entity_uuid)
     atomic_decorator = _get_atomic_decorator(db_type, is_async=False)
 
     @atomic_decorator
     def verify_entity_updates():
-        adapter = get_adapter(context)
         session = adapter.get_session()
         entity = session.get(TestEntity, entity_uuid)
 
         # Debug log to help troubleshoot
         if entity is None:
-            logger.exception(f"Entity with UUID {entity_uuid} not found during verification")
+            logger.exception("Entity with UUID %s not found during verification", entity_uuid)
             # List all entities in the database for debugging
             all_entities = session.query(TestEntity).all()
-            logger.exception(f"Found {len(all_entities)} entities in database")
+            logger.exception("Found %s entities in database", len(all_entities))
             for e in all_entities:
-                logger.exception(f"  Entity UUID: {e.test_uuid}, Description: {e.description}")
+                logger.exception("  Entity UUID: %s, Description: %s", e.test_uuid, e.description)
 
         # Verify updates
         assert entity is not None, "Updated entity not found"
 
         # Compare with stored values instead of hardcoded values
-        assert entity.description == scenario_context.get(
-            "updated_description",
-            "Updated Description",
-        ), f"Description mismatch. Expected: {scenario_context.get('updated_description')}, Got: {entity.description}"
-        assert entity.description != scenario_context.get("original_description", ""), "Description unchanged"
+        assert entity.description == scenario_context.updated_description, (
+            f"Description mismatch. Expected: {scenario_context.updated_description}, Got: {entity.description}"
+        )
+        assert entity.description != scenario_context.original_description, "Description unchanged"
         assert entity.is_deleted is True, "is_deleted flag not updated"
 
         # Verify updated_at was changed
-        original_updated_at = scenario_context.get("original_updated_at")
+        original_updated_at = scenario_context.original_updated_at
         if original_updated_at:
             assert entity.updated_at != original_updated_at, "updated_at timestamp unchanged"
         else:
@@ -734,42 +774,49 @@ def step_then_entity_properties_reflect_updates(context):
 @when("an entity with relationships is created in an atomic transaction")
 def step_when_entity_with_relationships_created(context):
     """Create an entity with relationships in an atomic transaction."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    adapter = get_adapter(context)
 
     # Generate UUIDs for the entities
-    main_uuid = uuid.uuid4()
-    related_uuids = [uuid.uuid4() for _ in range(3)]
+    main_uuid = fast_uuid4(context.rng)
+    related_uuids = [fast_uuid4(context.rng) for _ in range(3)]
 
     # Store UUIDs in context for later retrieval
     scenario_context.entity_ids["main_entity"] = str(main_uuid)
     for i, uuid_val in enumerate(related_uuids):
         scenario_context.entity_ids[f"related_entity_{i}"] = str(uuid_val)
 
-    logger.info(f"Creating entity with relationships, main UUID: {main_uuid}")
+    logger.info("Creating entity with relationships, main UUID: %s", main_uuid)
     atomic_decorator = _get_atomic_decorator(db_type, is_async=False)
 
     @atomic_decorator
     def create_entity_with_relationships():
+        # One timestamp for every row written in this block
+        created_at = datetime.now()
+
         # Create main entity directly to avoid StaleDataError
         main_entity = TestEntityFactory.create_test_entity(
             test_uuid=main_uuid,
             description="Main Entity with Relationships",
+            created_at=created_at,
         )
-        adapter = get_adapter(context)
         adapter.create(main_entity)
 
-        # Create related entities with explicit parent_id
+        # Create related entities with explicit parent_id in a single flush
+        related_entities = []
         for i, related_uuid in enumerate(related_uuids):
-            logger.info(f"Creating related entity {i} with UUID {related_uuid}")
+            logger.info("Creating related entity %s with UUID %s", i, related_uuid)
             related_entity = TestEntityFactory.create_related_test_entity(
                 related_uuid=related_uuid,
                 name=f"Related Entity {i + 1}",
                 parent_id=main_uuid,
                 value=f"Value {i + 1}",
+                created_at=created_at,
             )
-            adapter.create(related_entity)
+            related_entities.append(related_entity)
+        adapter.bulk_create(related_entities)
 
         return main_entity
 
@@ -780,9 +827,10 @@ def step_when_entity_with_relationships_created(context):
 @then("the entity and its relationships should be retrievable")
 def step_then_entity_and_relationships_retrievable(context):
     """Verify the entity and its relationships can be retrieved."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    adapter = get_adapter(context)
 
     # Get the UUIDs from context
     main_uuid = uuid.UUID(get_entity_id(context, "main_entity"))
@@ -790,27 +838,24 @@ def step_then_entity_and_relationships_retrievable(context):
 
     @atomic_decorator
     def verify_entity_relationships():
-        adapter = get_adapter(context)
         session = adapter.get_session()
 
-        # Get the main entity
-        main_entity = session.get(TestEntity, main_uuid)
+        # Get the main entity with its related entities eagerly loaded
+        main_entity = session.execute(ENTITY_WITH_RELATED_QUERY, {"entity_uuid": main_uuid}).scalar_one_or_none()
         assert main_entity is not None, "Main entity not found"
-        logger.info(f"Main entity retrieved with UUID {main_uuid}")
+        logger.info("Main entity retrieved with UUID %s", main_uuid)
 
-        # Query for related entities
-        related_query = select(RelatedTestEntity).where(RelatedTestEntity.parent_id == main_uuid)
-        related_entities = session.execute(related_query).scalars().all()
+        related_entities = main_entity.related_entities
 
         # Verify we have the expected number of related entities
         assert len(related_entities) == 3, f"Expected 3 related entities, found {len(related_entities)}"
-        logger.info(f"Found {len(related_entities)} related entities")
+        logger.info("Found %s related entities", len(related_entities))
 
         # Verify relationships through ORM
         for i, related in enumerate(related_entities):
             assert related.parent_id == main_uuid, "Related entity has wrong parent_id"
             assert related.name == f"Related Entity {i + 1}", f"Related entity {i} has wrong name"
-            logger.info(f"Verified related entity with UUID {related.related_uuid}")
+            logger.info("Verified related entity with UUID %s", related.related_uuid)
 
         return True
 
@@ -820,14 +865,15 @@ def step_then_entity_and_relationships_retrievable(context):
 @when("different types of entities are created in an atomic transaction")
 def step_when_different_entities_created_in_atomic(context):
     """Create different types of entities within an atomic transaction."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    adapter = get_adapter(context)
 
     # Generate UUIDs for the entities
-    regular_uuid = uuid.uuid4()
-    manager_uuid = uuid.uuid4()
-    admin_uuid = uuid.uuid4()
+    regular_uuid = fast_uuid4(context.rng)
+    manager_uuid = fast_uuid4(context.rng)
+    admin_uuid = fast_uuid4(context.rng)
 
     # Store UUIDs in context for later retrieval
     scenario_context.entity_ids["regular_entity"] = str(regular_uuid)
@@ -840,13 +886,12 @@ def step_when_different_entities_created_in_atomic(context):
     @atomic_decorator
     def create_multiple_entity_types():
         # Create a regular test entity
-        logger.info(f"Creating regular entity with UUID {regular_uuid}")
+        logger.info("Creating regular entity with UUID %s", regular_uuid)
         regular_entity = TestEntityFactory.create_test_entity(test_uuid=regular_uuid, description="Regular Test Entity")
-        adapter = get_adapter(context)
         adapter.create(regular_entity)
 
         # Create a manager test entity
-        logger.info(f"Creating manager entity with UUID {manager_uuid}")
+        logger.info("Creating manager entity with UUID %s", manager_uuid)
         manager_entity = TestEntityFactory.create_test_manager_entity(
             test_uuid=manager_uuid,
             description="Manager Test Entity",
@@ -854,7 +899,7 @@ def step_when_different_entities_created_in_atomic(context):
         adapter.create(manager_entity)
 
         # Create an admin test entity
-        logger.info(f"Creating admin entity with UUID {admin_uuid}")
+        logger.info("Creating admin entity with UUID %s", admin_uuid)
         admin_entity = TestEntityFactory.create_test_admin_entity(test_uuid=admin_uuid, description="Admin Test Entity")
         adapter.create(admin_entity)
 
@@ -867,9 +912,10 @@ def step_when_different_entities_created_in_atomic(context):
 @then("all entity types should be retrievable")
 def step_then_all_entity_types_retrievable(context):
     """Verify all different entity types can be retrieved."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    adapter = get_adapter(context)
 
     # Get the UUIDs from context
     regular_uuid = uuid.UUID(get_entity_id(context, "regular_entity"))
@@ -879,24 +925,23 @@ def step_then_all_entity_types_retrievable(context):
 
     @atomic_decorator
     def verify_entity_types():
-        adapter = get_adapter(context)
         session = adapter.get_session()
 
         # Verify regular entity
-        logger.info(f"Verifying regular entity with UUID {regular_uuid}")
+        logger.info("Verifying regular entity with UUID %s", regular_uuid)
         regular = session.get(TestEntity, regular_uuid)
         assert regular is not None, "Regular entity not found"
         assert regular.description == "Regular Test Entity", "Regular entity has wrong description"
 
         # Verify manager entity
-        logger.info(f"Verifying manager entity with UUID {manager_uuid}")
+        logger.info("Verifying manager entity with UUID %s", manager_uuid)
         manager = session.get(TestManagerEntity, manager_uuid)
         assert manager is not None, "Manager entity not found"
         assert manager.description == "Manager Test Entity", "Manager entity has wrong description"
         assert manager.created_by_uuid is not None, "Manager entity missing created_by_uuid"
 
         # Verify admin entity
-        logger.info(f"Verifying admin entity with UUID {admin_uuid}")
+        logger.info("Verifying admin entity with UUID %s", admin_uuid)
         admin = session.get(TestAdminEntity, admin_uuid)
         assert admin is not None, "Admin entity not found"
         assert admin.description == "Admin Test Entity", "Admin entity has wrong description"
@@ -911,9 +956,9 @@ def step_then_all_entity_types_retrievable(context):
 @when("an error is triggered within an atomic transaction")
 def step_when_error_triggered_in_atomic(context):
     """Trigger different types of errors within atomic transactions to test handlers."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
     adapter = get_adapter(context)
     atomic_decorator = _get_atomic_decorator(db_type, is_async=False)
 
@@ -930,8 +975,8 @@ def step_when_error_triggered_in_atomic(context):
 
         normal_exception()
     except Exception as e:
-        scenario_context.store("normal_exception", e)
-        logger.info(f"Caught normal exception: {type(e).__name__}")
+        scenario_context.normal_exception = e
+        logger.info("Caught normal exception: %s", type(e).__name__)
 
     # Test deadlock handling (simulated for both databases)
     logger.info("Testing deadlock exception handling")
@@ -943,28 +988,24 @@ def step_when_error_triggered_in_atomic(context):
             adapter.create(entity)
 
             # Simulate database deadlock
-            from sqlalchemy.exc import OperationalError
-
             logger.info("Raising database deadlock exception")
             raise OperationalError("database is locked", None, None)
 
         deadlock_exception()
     except Exception as e:
-        scenario_context.store("deadlock_exception", e)
-        logger.info(f"Caught deadlock exception: {type(e).__name__}")
+        scenario_context.deadlock_exception = e
+        logger.info("Caught deadlock exception: %s", type(e).__name__)
 
 
 @then("the appropriate error should be raised")
 def step_then_appropriate_error_raised(context):
     """Verify that appropriate errors were raised for each case."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
 
-    from archipy.models.errors import DatabaseDeadlockError, InternalError
-
     # Check normal exception was wrapped as InternalError
     logger.info("Verifying normal exception handling")
-    normal_exception = scenario_context.get("normal_exception")
+    normal_exception = scenario_context.normal_exception
     assert normal_exception is not None, "Normal exception was not captured"
     assert isinstance(
         normal_exception,
@@ -973,7 +1014,7 @@ def step_then_appropriate_error_raised(context):
 
     # Check deadlock exception
     logger.info("Verifying deadlock exception handling")
-    deadlock_exception = scenario_context.get("deadlock_exception")
+    deadlock_exception = scenario_context.deadlock_exception
     assert deadlock_exception is not None, "Deadlock exception was not captured"
     assert isinstance(
         deadlock_exception,
@@ -986,20 +1027,21 @@ def step_then_appropriate_error_raised(context):
 @then("the transaction should be rolled back")
 def step_then_transaction_rolled_back(context):
     """Verify that the transaction was rolled back after errors."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    adapter = get_adapter(context)
     logger.info("Verifying session is still usable after rollback")
     atomic_decorator = _get_atomic_decorator(db_type, is_async=False)
 
+    @sqlalchemy_atomic_retry_decorator()
     @atomic_decorator
     def verify_session_usable():
         # Create a new entity to test the session is still working
-        test_uuid = uuid.uuid4()
-        logger.info(f"Creating test entity with UUID {test_uuid}")
+        test_uuid = fast_uuid4(context.rng)
+        logger.info("Creating test entity with UUID %s", test_uuid)
 
         entity = TestEntityFactory.create_test_entity(test_uuid=test_uuid, description="Entity to verify rollback")
-        adapter = get_adapter(context)
         adapter.create(entity)
 
         # Try to retrieve it
@@ -1013,51 +1055,138 @@ def step_then_transaction_rolled_back(context):
     assert verify_session_usable(), "Session is not usable after transaction rollback"
 
 
+@when("an atomic transaction hits a database lock on its first {failures:d} of {max_retries:d} attempts")
+def step_when_atomic_retried_after_lock(context, failures, max_retries):
+    """Run a retried atomic transaction that inserts an entity and is aborted by a lock on its first attempts."""
+    logger = getattr(context, "logger", steps_logger)
+    scenario_context = get_current_scenario_context(context)
+    db_type = scenario_context.db_type
+    adapter = get_adapter(context)
+    atomic_decorator = _get_atomic_decorator(db_type, is_async=False)
+    attempt_uuids = scenario_context.retry_attempt_uuids
+
+    @sqlalchemy_atomic_retry_decorator(max_retries=max_retries, backoff=0)
+    @atomic_decorator
+    def create_entity_with_lock_failures():
+        test_uuid = fast_uuid4(context.rng)
+        attempt_uuids.append(test_uuid)
+        entity = TestEntityFactory.create_test_entity(
+            test_uuid=test_uuid,
+            description=f"Retry attempt {len(attempt_uuids)}",
+        )
+        adapter.create(entity)
+
+        if len(attempt_uuids) <= failures:
+            logger.info("Raising database lock on attempt %d", len(attempt_uuids))
+            raise OperationalError("database is locked", None, None)
+        return test_uuid
+
+    try:
+        scenario_context.retry_result_uuid = create_entity_with_lock_failures()
+    except Exception as e:
+        scenario_context.retry_exception = e
+        logger.info("Caught retry exception: %s", type(e).__name__)
+
+
+@then("the retried transaction should succeed on attempt {attempt:d}")
+def step_then_retried_transaction_succeeds(context, attempt):
+    """Verify the retried transaction returned the entity inserted by the given attempt."""
+    scenario_context = get_current_scenario_context(context)
+    attempt_uuids = scenario_context.retry_attempt_uuids
+
+    assert scenario_context.retry_exception is None, f"Retried transaction failed: {scenario_context.retry_exception}"
+    assert len(attempt_uuids) == attempt, f"Expected {attempt} attempts, got {len(attempt_uuids)}"
+    assert scenario_context.retry_result_uuid == attempt_uuids[-1], "Result does not come from the last attempt"
+
+
+@then("the database lock error should propagate after {attempts:d} attempts")
+def step_then_lock_error_propagates(context, attempts):
+    """Verify the lock error reached the caller once every attempt was used."""
+    scenario_context = get_current_scenario_context(context)
+    retry_exception = scenario_context.retry_exception
+
+    assert isinstance(
+        retry_exception,
+        DatabaseDeadlockError,
+    ), f"Lock failure not propagated as DatabaseDeadlockError: {type(retry_exception)}"
+    assert scenario_context.retry_result_uuid is None, "Transaction returned a result despite failing"
+    assert len(scenario_context.retry_attempt_uuids) == attempts, (
+        f"Expected {attempts} attempts, got {len(scenario_context.retry_attempt_uuids)}"
+    )
+
+
+@then("only the entity from the successful attempt should exist")
+def step_then_only_successful_attempt_exists(context):
+    """Verify the entities inserted by aborted attempts were rolled back."""
+    scenario_context = get_current_scenario_context(context)
+    db_type = scenario_context.db_type
+    adapter = get_adapter(context)
+    attempt_uuids = scenario_context.retry_attempt_uuids
+
+    descriptions = _atomic(_fetch_descriptions, db_type)(adapter, attempt_uuids)
+    assert descriptions[:-1] == [None] * (len(attempt_uuids) - 1), "Entities from aborted attempts were persisted"
+    assert descriptions[-1] == f"Retry attempt {len(attempt_uuids)}", "Entity from the successful attempt is missing"
+
+
+@then("no entity from the failed attempts should exist")
+def step_then_no_failed_attempt_exists(context):
+    """Verify every attempt of an exhausted retry was rolled back."""
+    scenario_context = get_current_scenario_context(context)
+    db_type = scenario_context.db_type
+    adapter = get_adapter(context)
+    attempt_uuids = scenario_context.retry_attempt_uuids
+
+    descriptions = _atomic(_fetch_descriptions, db_type)(adapter, attempt_uuids)
+    assert descriptions == [None] * len(attempt_uuids), "Entities from aborted attempts were persisted"
+
+
 @when("operations are performed across multiple atomic blocks")
 def step_when_operations_across_multiple_atomics(context):
     """Test session consistency across multiple atomic blocks."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    adapter = get_adapter(context)
     logger.info("Testing operations across multiple atomic blocks")
     atomic_decorator = _get_atomic_decorator(db_type, is_async=False)
 
     # Generate UUIDs for entities
-    entity_uuids = [uuid.uuid4() for _ in range(3)]
+    entity_uuids = [fast_uuid4(context.rng) for _ in range(3)]
 
     # Store UUIDs in context
     for i, uuid_val in enumerate(entity_uuids):
         scenario_context.entity_ids[f"multi_entity_{i}"] = str(uuid_val)
 
-    # Create initial entities
-    @atomic_decorator
-    def create_initial_entities():
-        logger.info("Creating initial entities in first atomic block")
-        entities = []
-        for i, uuid_val in enumerate(entity_uuids):
-            logger.info(f"Creating entity {i} with UUID {uuid_val}")
-            entity = TestEntityFactory.create_test_entity(test_uuid=uuid_val, description=f"Initial Entity {i + 1}")
-            adapter = get_adapter(context)
-            adapter.create(entity)
-            entities.append(entity)
-
-        return entities
+    # Create initial entities with a single flush
+    logger.info("Creating initial entities in first atomic block")
+    created_at = datetime.now()
+    entities = []
+    for i, uuid_val in enumerate(entity_uuids):
+        logger.info("Creating entity %s with UUID %s", i, uuid_val)
+        entity = TestEntityFactory.create_test_entity(
+            test_uuid=uuid_val,
+            description=f"Initial Entity {i + 1}",
+            created_at=created_at,
+        )
+        entities.append(entity)
 
-    create_initial_entities()
+    _atomic(_create_entities, db_type)(adapter, entities)
 
     # Update entities in a separate atomic block
     @atomic_decorator
     def update_entities():
         logger.info("Updating entities in second atomic block")
-        adapter = get_adapter(context)
         session = adapter.get_session()
 
-        # Update each entity with a new description
-        for i, uuid_val in enumerate(entity_uuids):
-            logger.info(f"Updating entity {i} with UUID {uuid_val}")
-            db_entity = session.get(TestEntity, uuid_val)
-            db_entity.description = f"Updated Entity {i + 1}"
-            db_entity.updated_at = datetime.now()
+        # Update every entity by primary key in a single executemany UPDATE
+        now = datetime.now()
+        session.execute(
+            update(TestEntity),
+            [
+                {"test_uuid": uuid_val, "description": f"Updated Entity {i + 1}", "updated_at": now}
+                for i, uuid_val in enumerate(entity_uuids)
+            ],
+        )
 
         # No explicit commit - handled by atomic decorator
         return True
@@ -1065,20 +1194,20 @@ def step_when_operations_across_multiple_atomics(context):
     update_entities()
 
     # Query entities in another atomic block
+    @sqlalchemy_atomic_retry_decorator()
     @atomic_decorator
     def query_entities():
         logger.info("Querying entities in third atomic block")
-        adapter = get_adapter(context)
         session = adapter.get_session()
 
         # Store results for verification
         results = []
         for i, uuid_val in enumerate(entity_uuids):
-            logger.info(f"Querying entity {i} with UUID {uuid_val}")
+            logger.info("Querying entity %s with UUID %s", i, uuid_val)
             db_entity = session.get(TestEntity, uuid_val)
             results.append({"uuid": uuid_val, "description": db_entity.description, "updated_at": db_entity.updated_at})
 
-        scenario_context.store("query_results", results)
+        scenario_context.query_results = results
         return results
 
     query_entities()
@@ -1088,111 +1217,88 @@ def step_when_operations_across_multiple_atomics(context):
 @then("session should maintain consistency across atomic blocks")
 def step_then_session_maintains_consistency(context):
     """Verify session consistency is maintained across multiple atomic blocks."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    adapter = get_adapter(context)
     logger.info("Verifying session consistency across multiple atomic blocks")
-    atomic_decorator = _get_atomic_decorator(db_type, is_async=False)
-
-    @atomic_decorator
-    def verify_consistency():
-        adapter = get_adapter(context)
-        session = adapter.get_session()
-
-        # Retrieve query results from scenario context
-        query_results = scenario_context.get("query_results")
 
-        # Check that each entity has the updated description
-        for i, result in enumerate(query_results):
-            logger.info(f"Verifying entity {i} with UUID {result['uuid']}")
+    # Read every entity back in one transaction with a single SELECT
+    query_results = scenario_context.query_results
+    db_descriptions = _atomic(_fetch_descriptions, db_type)(adapter, [result["uuid"] for result in query_results])
 
-            expected_description = f"Updated Entity {i + 1}"
-            assert (
-                result["description"] == expected_description
-            ), f"Entity {i + 1} has wrong description: {result['description']}"
-            assert result["updated_at"] is not None, f"Entity {i + 1} missing updated_at timestamp"
+    # Check that each entity has the updated description
+    for i, (result, db_description) in enumerate(zip(query_results, db_descriptions, strict=True)):
+        logger.info("Verifying entity %s with UUID %s", i, result["uuid"])
 
-            # Verify the entity in the database matches our context
-            db_entity = session.get(TestEntity, result["uuid"])
-            assert db_entity is not None, f"Entity {i + 1} not found in database"
-            assert (
-                db_entity.description == expected_description
-            ), f"Database entity {i + 1} has wrong description: {db_entity.description}"
+        expected_description = f"Updated Entity {i + 1}"
+        assert (
+            result["description"] == expected_description
+        ), f"Entity {i + 1} has wrong description: {result['description']}"
+        assert result["updated_at"] is not None, f"Entity {i + 1} missing updated_at timestamp"
 
-            logger.info(f"Entity {i} verified successfully")
+        # Verify the entity in the database matches our context
+        assert db_description is not None, f"Entity {i + 1} not found in database"
+        assert (
+            db_description == expected_description
+        ), f"Database entity {i + 1} has wrong description: {db_description}"
 
-        logger.info("Session consistency verified successfully")
-        return True
+        logger.info("Entity %s verified successfully", i)
 
-    assert verify_consistency(), "Session consistency verification failed"
+    logger.info("Session consistency verified successfully")
 
 
 @when("a new entity is created in an async atomic transaction")
 async def step_when_entity_created_in_async_atomic(context):
     """Create a new entity within an async atomic transaction."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
 
     # Generate a UUID for the entity
-    test_uuid = uuid.uuid4()
+    test_uuid = fast_uuid4(context.rng)
     scenario_context.entity_ids["async_entity"] = str(test_uuid)
 
-    logger.info(f"Creating async entity with UUID {test_uuid}")
+    logger.info("Creating async entity with UUID %s", test_uuid)
     async_adapter = get_async_adapter(context)
-    atomic_decorator = _get_atomic_decorator(db_type, is_async=True)
-
-    @atomic_decorator
-    async def create_entity_async_atomic():
-        """Create a new entity within an async atomic block."""
-        entity = TestEntityFactory.create_test_entity(test_uuid=test_uuid, description="Async Entity")
-
-        # Get the async adapter from scenario context
-        await async_adapter.create(entity)
-        return entity
+    entity = TestEntityFactory.create_test_entity(test_uuid=test_uuid, description="Async Entity")
 
     # Execute the async atomic operation
-    await create_entity_async_atomic()
+    await _atomic(_async_create_entities, db_type, is_async=True)(async_adapter, [entity])
     logger.info("Async entity created successfully")
 
 
 @then("the async entity should be retrievable")
 async def step_then_async_entity_should_be_retrievable(context):
     """Verify the entity exists after async atomic transaction."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    async_adapter = get_async_adapter(context)
 
     # Get the UUID from context
     async_uuid = uuid.UUID(get_entity_id(context, "async_entity"))
-    logger.info(f"Retrieving async entity with UUID {async_uuid}")
-    atomic_decorator = _get_atomic_decorator(db_type, is_async=True)
+    logger.info("Retrieving async entity with UUID %s", async_uuid)
 
-    @atomic_decorator
-    async def get_entity():
-        async_adapter = get_async_adapter(context)
-        session = async_adapter.session_manager.get_session()
-        retrieved_entity = await session.get(TestEntity, async_uuid)
-        assert retrieved_entity is not None, "Entity not found in database after async atomic transaction"
-        assert retrieved_entity.description == "Async Entity", "Entity has incorrect description"
-        logger.info("Async entity retrieved successfully")
-        return retrieved_entity
-
-    await get_entity()
+    descriptions = await _atomic(_async_fetch_descriptions, db_type, is_async=True)(async_adapter, [async_uuid])
+    assert descriptions[0] is not None, "Entity not found in database after async atomic transaction"
+    assert descriptions[0] == "Async Entity", "Entity has incorrect description"
+    logger.info("Async entity retrieved successfully")
 
 
 @when("a new async entity creation fails within an atomic transaction")
 async def step_when_async_entity_creation_fails(context):
     """Attempt to create an async entity with a failure that causes rollback."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    async_adapter = get_async_adapter(context)
 
     # Generate a UUID for the entity
-    test_uuid = uuid.uuid4()
+    test_uuid = fast_uuid4(context.rng)
     scenario_context.entity_ids["async_failed_entity"] = str(test_uuid)
 
-    logger.info(f"Creating async entity with UUID {test_uuid} (will fail)")
+    logger.info("Creating async entity with UUID %s (will fail)", test_uuid)
     atomic_decorator = _get_atomic_decorator(db_type, is_async=True)
 
     try:
@@ -1204,7 +1310,6 @@ async def step_when_async_entity_creation_fails(context):
                 test_uuid=test_uuid,
                 description="Async Entity that should be rolled back",
             )
-            async_adapter = get_async_adapter(context)
             await async_adapter.create(entity)
 
             # Simulate failure
@@ -1214,7 +1319,7 @@ async def step_when_async_entity_creation_fails(context):
         await create_entity_with_failure()
     except Exception as e:
         # We expect this exception
-        logger.info(f"Caught expected exception: {type(e).__name__}")
+        logger.info("Caught expected exception: %s", type(e).__name__)
     else:
         assert False, "Exception was not raised as expected"
 
@@ -1222,47 +1327,41 @@ async def step_when_async_entity_creation_fails(context):
 @then("no async entity should exist in the database")
 async def step_then_no_async_entity_should_exist(context):
     """Verify the entity doesn't exist after failed async atomic transaction."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    async_adapter = get_async_adapter(context)
 
     # Get the UUID from context
     async_uuid = uuid.UUID(get_entity_id(context, "async_failed_entity"))
-    logger.info(f"Verifying async entity with UUID {async_uuid} doesn't exist")
-    atomic_decorator = _get_atomic_decorator(db_type, is_async=True)
+    logger.info("Verifying async entity with UUID %s doesn't exist", async_uuid)
 
-    @atomic_decorator
-    async def check_entity_absence():
-        async_adapter = get_async_adapter(context)
-        session = async_adapter.session_manager.get_session()
-        retrieved_entity = await session.get(TestEntity, async_uuid)
-        assert retrieved_entity is None, "Entity found in database after failed async atomic transaction"
-        logger.info("Verified async entity doesn't exist (rollback successful)")
-        return retrieved_entity
-
-    await check_entity_absence()
+    descriptions = await _atomic(_async_fetch_descriptions, db_type, is_async=True)(async_adapter, [async_uuid])
+    assert descriptions[0] is None, "Entity found in database after failed async atomic transaction"
+    logger.info("Verified async entity doesn't exist (rollback successful)")
 
 
 @then("the async database session should remain usable")
 async def step_then_async_session_should_remain_usable(context):
     """Verify the async session is still usable after a failed transaction."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    async_adapter = get_async_adapter(context)
     logger.info("Verifying async session is still usable")
     atomic_decorator = _get_atomic_decorator(db_type, is_async=True)
 
+    @sqlalchemy_atomic_retry_decorator()
     @atomic_decorator
     async def verify_session_usable():
         # Create a new entity to test the session is still working
-        test_uuid = uuid.uuid4()
-        logger.info(f"Creating test entity with UUID {test_uuid}")
+        test_uuid = fast_uuid4(context.rng)
+        logger.info("Creating test entity with UUID %s", test_uuid)
 
         entity = TestEntityFactory.create_test_entity(
             test_uuid=test_uuid,
             description="Async Entity to test session usability",
         )
-        async_adapter = get_async_adapter(context)
         await async_adapter.create(entity)
 
         # Try to retrieve it
@@ -1280,115 +1379,114 @@ async def step_then_async_session_should_remain_usable(context):
 @when("multiple entities are created in an async atomic transaction")
 async def step_when_multiple_async_entities_created(context):
     """Create multiple entities in a single async atomic transaction."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    async_adapter = get_async_adapter(context)
 
     # Generate UUIDs for entities
-    entity_uuids = [uuid.uuid4() for _ in range(5)]
+    entity_uuids = [fast_uuid4(context.rng) for _ in range(5)]
 
     # Store UUIDs in context
     for i, uuid_val in enumerate(entity_uuids):
         scenario_context.entity_ids[f"multi_async_entity_{i}"] = str(uuid_val)
 
     logger.info("Creating multiple entities in async atomic transaction")
-    atomic_decorator = _get_atomic_decorator(db_type, is_async=True)
-
-    @atomic_decorator
-    async def create_multiple_entities():
-        """Create multiple entities within an async atomic block."""
-        entities = []
-        for i, uuid_val in enumerate(entity_uuids):
-            logger.info(f"Creating async entity {i} with UUID {uuid_val}")
-            entity = TestEntityFactory.create_test_entity(test_uuid=uuid_val, description=f"Async Entity {i + 1}")
-            async_adapter = get_async_adapter(context)
-            await async_adapter.create(entity)
-            entities.append(entity)
-
-        logger.info("Multiple async entities created successfully")
-        return entities
+    created_at = datetime.now()
+    entities = []
+    for i, uuid_val in enumerate(entity_uuids):
+        logger.info("Creating async entity %s with UUID %s", i, uuid_val)
+        entity = TestEntityFactory.create_test_entity(
+            test_uuid=uuid_val,
+            description=f"Async Entity {i + 1}",
+            created_at=created_at,
+        )
+        entities.append(entity)
 
-    # Execute the async atomic operation
-    await create_multiple_entities()
+    # Execute the async atomic operation, inserting all entities with a single flush
+    await _atomic(_async_create_entities, db_type, is_async=True)(async_adapter, entities)
+    logger.info("Multiple async entities created successfully")
 
 
 @then("all async entities should be retrievable")
 async def step_then_all_async_entities_retrievable(context):
     """Verify all entities exist after async atomic transaction."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    async_adapter = get_async_adapter(context)
     logger.info("Verifying all async entities are retrievable")
-    atomic_decorator = _get_atomic_decorator(db_type, is_async=True)
 
-    @atomic_decorator
-    async def verify_entities():
-        """Verify all entities within an async atomic block."""
-        async_adapter = get_async_adapter(context)
-        session = async_adapter.session_manager.get_session()
-
-        # Check that all entities were created
-        for i in range(5):
-            uuid_key = f"multi_async_entity_{i}"
-            if uuid_key in scenario_context.entity_ids:
-                entity_uuid = uuid.UUID(scenario_context.entity_ids[uuid_key])
-                logger.info(f"Verifying async entity {i} with UUID {entity_uuid}")
-
-                retrieved_entity = await session.get(TestEntity, entity_uuid)
-                assert retrieved_entity is not None, f"Entity {i + 1} not found after async atomic transaction"
-                assert (
-                    retrieved_entity.description == f"Async Entity {i + 1}"
-                ), f"Entity {i + 1} has incorrect description"
-                logger.info(f"Async entity {i} verified successfully")
-
-        logger.info("All async entities verified successfully")
-        return True
+    # Collect the stored entities by their creation index
+    indexed_uuids = [
+        (i, uuid.UUID(scenario_context.entity_ids[f"multi_async_entity_{i}"]))
+        for i in range(5)
+        if f"multi_async_entity_{i}" in scenario_context.entity_ids
+    ]
 
     # Execute the async verification
-    result = await verify_entities()
-    assert result, "Entity verification failed"
+    descriptions = await _atomic(_async_fetch_descriptions, db_type, is_async=True)(
+        async_adapter,
+        [entity_uuid for _, entity_uuid in indexed_uuids],
+    )
+
+    # Check that all entities were created
+    for (i, entity_uuid), description in zip(indexed_uuids, descriptions):
+        logger.info("Verifying async entity %s with UUID %s", i, entity_uuid)
+        assert description is not None, f"Entity {i + 1} not found after async atomic transaction"
+        assert description == f"Async Entity {i + 1}", f"Entity {i + 1} has incorrect description"
+        logger.info("Async entity %s verified successfully", i)
+
+    logger.info("All async entities verified successfully")
 
 
 @when("complex async operations are performed in a transaction")
 async def step_when_complex_async_operations(context):
     """Demonstrate more complex async operations with proper session management."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    async_adapter = get_async_adapter(context)
 
     # Generate UUIDs
-    parent_uuid = uuid.uuid4()
-    related_uuids = [uuid.uuid4() for _ in range(3)]
+    parent_uuid = fast_uuid4(context.rng)
+    related_uuids = [fast_uuid4(context.rng) for _ in range(3)]
 
     # Store UUIDs in context
     scenario_context.entity_ids["complex_parent"] = str(parent_uuid)
     for i, uuid_val in enumerate(related_uuids):
         scenario_context.entity_ids[f"complex_related_{i}"] = str(uuid_val)
 
-    logger.info(f"Creating complex entity relationship with parent UUID {parent_uuid}")
+    logger.info("Creating complex entity relationship with parent UUID %s", parent_uuid)
     atomic_decorator = _get_atomic_decorator(db_type, is_async=True)
 
     # Create a parent entity and related entities in one atomic transaction
     @atomic_decorator
     async def create_entity_with_relations():
+        # One timestamp for every row written in this block
+        created_at = datetime.now()
+
         # Create the parent entity
         parent = TestEntityFactory.create_test_entity(
             test_uuid=parent_uuid,
             description="Parent Entity for Complex Operations",
+            created_at=created_at,
         )
-        async_adapter = get_async_adapter(context)
-        await async_adapter.create(parent)
 
-        # Create related entities
+        # Build the related entities and insert them with the parent in a single flush.
+        # The unit of work orders the parent INSERT ahead of the children through the FK.
+        related_entities = []
         for i, related_uuid in enumerate(related_uuids):
-            logger.info(f"Creating complex related entity {i} with UUID {related_uuid}")
+            logger.info("Creating complex related entity %s with UUID %s", i, related_uuid)
             related = TestEntityFactory.create_related_test_entity(
                 related_uuid=related_uuid,
                 name=f"Complex Related {i + 1}",
                 parent_id=parent_uuid,
                 value=f"Value {i + 1}",
+                created_at=created_at,
             )
-            await async_adapter.create(related)
+            related_entities.append(related)
+        await async_adapter.bulk_create([parent, *related_entities])
 
         logger.info("Complex entity relationships created successfully")
         return parent
@@ -1400,39 +1498,37 @@ async def step_when_complex_async_operations(context):
 @then("all related entities should be accessible")
 async def step_then_related_entities_accessible(context):
     """Verify that related entities can be accessed through relationships."""
-    logger = getattr(context, "logger", logging.getLogger("behave.steps"))
+    logger = getattr(context, "logger", steps_logger)
     scenario_context = get_current_scenario_context(context)
-    db_type = scenario_context.get("db_type", "sqlite")
+    db_type = scenario_context.db_type
+    async_adapter = get_async_adapter(context)
 
     # Get UUIDs from context
     parent_uuid = uuid.UUID(get_entity_id(context, "complex_parent"))
-    logger.info(f"Verifying related entities for parent UUID {parent_uuid}")
+    logger.info("Verifying related entities for parent UUID %s", parent_uuid)
     atomic_decorator = _get_atomic_decorator(db_type, is_async=True)
 
     @atomic_decorator
     async def verify_relationships():
-        async_adapter = get_async_adapter(context)
         session = async_adapter.session_manager.get_session()
 
-        # Get the parent entity
-        parent = await session.get(TestEntity, parent_uuid)
+        # Get the parent entity with its related entities eagerly loaded
+        result = await session.execute(ENTITY_WITH_RELATED_QUERY, {"entity_uuid": parent_uuid})
+        parent = result.scalar_one_or_none()
         assert parent is not None, "Parent entity not found"
         logger.info("Parent entity retrieved successfully")
 
-        # Query for related entities
-        stmt = select(RelatedTestEntity).where(RelatedTestEntity.parent_id == parent_uuid)
-        result = await session.execute(stmt)
-        related_entities = result.scalars().all()
+        related_entities = parent.related_entities
 
         # Check the relationship is loaded correctly
         assert len(related_entities) == 3, f"Expected 3 related entities, found {len(related_entities)}"
-        logger.info(f"Found {len(related_entities)} related entities")
+        logger.info("Found %s related entities", len(related_entities))
 
         # Verify each related entity
         for i, related in enumerate(related_entities):
             assert related.parent_id == parent_uuid, "Related entity has wrong parent_id"
             assert related.name == f"Complex Related {i + 1}", f"Related entity {i} has wrong name"
-            logger.info(f"Verified related entity: {related.name}")
+            logger.info("Verified related entity: %s", related.name)
 
         logger.info("All related entities verified successfully")
         return True
@@ -1,5 +1,5 @@
+import functools
 from datetime import UTC, date, datetime, timedelta
-from unittest.mock import patch
 
 from behave import given, then, when
 from behave.runner import Context
@@ -9,10 +9,29 @@ from archipy.helpers.utils.datetime_utils import DatetimeUtils
 from features.test_helpers import get_current_scenario_context
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(date_string: str) -> datetime:
+    """Parse an ISO 8601 datetime string, memoized since Examples tables repeat the same values."""
+    return datetime.fromisoformat(date_string)
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_datetime(datetime_obj: datetime, format_string: str) -> str:
+    """Format a datetime, memoized per (datetime, format) pair since Examples tables repeat them."""
+    return datetime_obj.strftime(format_string)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_ymd(date_str: str) -> date:
+    """Parse a YYYY-MM-DD date string, memoized since Examples tables repeat the same values."""
+    return date.fromisoformat(date_str)
+
+
 @given('a naive datetime "{date_string}"')
-def step_given_naive_datetime(context: Context, date_string) -> None:
+@given('a datetime "{date_string}"')
+def step_given_datetime(context: Context, date_string) -> None:
     scenario_context = get_current_scenario_context(context)
-    datetime_obj = datetime.fromisoformat(date_string)
+    datetime_obj = _parse_iso(date_string)
     scenario_context.store("datetime_obj", datetime_obj)
 
 
@@ -31,13 +50,6 @@ def step_then_result_should_be_utc(context: Context) -> None:
     assert result_datetime.tzinfo == UTC
 
 
-@given('a datetime "{date_string}"')
-def step_given_datetime(context: Context, date_string) -> None:
-    scenario_context = get_current_scenario_context(context)
-    datetime_obj = datetime.fromisoformat(date_string)
-    scenario_context.store("datetime_obj", datetime_obj)
-
-
 @when("the datetime is converted to a string")
 def step_when_datetime_is_converted(context: Context) -> None:
     scenario_context = get_current_scenario_context(context)
@@ -51,7 +63,7 @@ def step_then_string_should_match_format(context: Context, format_string) -> Non
     scenario_context = get_current_scenario_context(context)
     datetime_obj = scenario_context.get("datetime_obj")
     result_string = scenario_context.get("result_string")
-    expected_string = datetime_obj.strftime(format_string)
+    expected_string = _format_datetime(datetime_obj, format_string)
     assert result_string == expected_string
 
 
@@ -73,7 +85,7 @@ def step_when_string_to_datetime(context: Context) -> None:
 def step_then_result_is_datetime(context: Context) -> None:
     scenario_context = get_current_scenario_context(context)
     result_datetime = scenario_context.get("result_datetime")
-    assert isinstance(result_datetime, datetime)
+    assert type(result_datetime) is datetime
 
 
 @when("the current UTC time is retrieved")
@@ -87,7 +99,7 @@ def step_when_get_current_utc(context: Context) -> None:
 def step_then_utc_now_is_datetime(context: Context) -> None:
     scenario_context = get_current_scenario_context(context)
     utc_now = scenario_context.get("utc_now")
-    assert isinstance(utc_now, datetime)
+    assert type(utc_now) is datetime
 
 
 @when("the current epoch time is retrieved")
@@ -101,7 +113,7 @@ def step_when_get_epoch_now(context: Context) -> None:
 def step_then_epoch_is_integer(context: Context) -> None:
     scenario_context = get_current_scenario_context(context)
     epoch_now = scenario_context.get("epoch_now")
-    assert isinstance(epoch_now, int)
+    assert type(epoch_now) is int
 
 
 @when("1 day is added")
@@ -119,7 +131,7 @@ def step_when_add_day(context: Context) -> None:
 def step_then_datetime_is_correct(context: Context, expected_date) -> None:
     scenario_context = get_current_scenario_context(context)
     result_datetime = scenario_context.get("result_datetime")
-    expected_datetime = datetime.fromisoformat(expected_date)
+    expected_datetime = _parse_iso(expected_date)
     assert result_datetime == expected_datetime
 
 
@@ -139,7 +151,7 @@ def step_given_gregorian_date(context: Context, date_str) -> None:
     scenario_context = get_current_scenario_context(context)
     scenario_context.store("date_str", date_str)
     try:
-        target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+        target_date = _parse_ymd(date_str)
         scenario_context.store("target_date", target_date)
     except ValueError:
         scenario_context.store("target_date", None)
@@ -179,31 +191,15 @@ def step_when_check_holiday_in_iran(context: Context) -> None:
 
 @when("we check if the date is a holiday in Iran multiple times")
 def step_when_check_holiday_multiple_times(context: Context) -> None:
+    # The holiday API is patched for the whole scenario by the @mock-holiday-api tag
     scenario_context = get_current_scenario_context(context)
     target_date = scenario_context.get("target_date")
 
-    def mock_call_holiday_api(jalali_date) -> dict:
-        current_count = scenario_context.get("api_call_count", 0)
-        scenario_context.store("api_call_count", current_count + 1)
-        return {
-            "data": {
-                "event_list": [
-                    {
-                        "jalali_year": target_date.year,
-                        "jalali_month": target_date.month,
-                        "jalali_day": target_date.day,
-                        "is_holiday": True,
-                    },
-                ],
-            },
-        }
-
-    with patch.object(DatetimeUtils, "_call_holiday_api", side_effect=mock_call_holiday_api):
-        scenario_context.store("api_call_count", 0)
-        result_first = DatetimeUtils.is_holiday_in_iran(target_date)
-        result_second = DatetimeUtils.is_holiday_in_iran(target_date)
-        scenario_context.store("result_first", result_first)
-        scenario_context.store("result_second", result_second)
+    scenario_context.store("api_call_count", 0)
+    result_first = DatetimeUtils.is_holiday_in_iran(target_date)
+    result_second = DatetimeUtils.is_holiday_in_iran(target_date)
+    scenario_context.store("result_first", result_first)
+    scenario_context.store("result_second", result_second)
 
 
 @then("an error should be raised")
@@ -228,7 +224,7 @@ def step_then_result_should_be_cached(context: Context) -> None:
 def step_given_historical_gregorian_date(context: Context, date_str) -> None:
     scenario_context = get_current_scenario_context(context)
     scenario_context.store("date_str", date_str)
-    target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+    target_date = _parse_ymd(date_str)
     scenario_context.store("target_date", target_date)
     scenario_context.store("is_historical", True)
 
@@ -249,73 +245,44 @@ def step_given_gregorian_date_strictly_after_today(context: Context) -> None:
 
 @when("we check if the date is a holiday in Iran with cache verification")
 def step_when_check_holiday_with_cache_verification(context: Context) -> None:
+    # The holiday API is patched for the whole scenario by the @mock-holiday-api tag
     scenario_context = get_current_scenario_context(context)
     target_date = scenario_context.get("target_date")
 
-    def mock_call_holiday_api(jalali_date) -> dict:
-        return {
-            "data": {
-                "event_list": [
-                    {
-                        "jalali_year": jalali_date.year,
-                        "jalali_month": jalali_date.month,
-                        "jalali_day": jalali_date.day,
-                        "is_holiday": True,
-                    },
-                ],
-            },
-        }
-
-    with patch.object(DatetimeUtils, "_call_holiday_api", side_effect=mock_call_holiday_api):
-        result = DatetimeUtils.is_holiday_in_iran(target_date)
-        scenario_context.store("result", result)
-
-        date_str = target_date.strftime("%Y-%m-%d")
-        utc_today = DatetimeUtils.get_datetime_utc_now().date()
-        is_historical = target_date <= utc_today
-        cache_entry = DatetimeUtils._holiday_cache.get(date_str)
-        scenario_context.store("cache_entry", cache_entry)
+    result = DatetimeUtils.is_holiday_in_iran(target_date)
+    scenario_context.store("result", result)
 
+    date_str = target_date.strftime("%Y-%m-%d")
+    cache_entry = DatetimeUtils._holiday_cache.get(date_str)
+    scenario_context.store("cache_entry", cache_entry)
 
-@then("the result should be cached with historical TTL")
-def step_then_cached_with_historical_ttl(context: Context) -> None:
-    from datetime import timedelta
 
+def _assert_cached_with_ttl(context: Context, ttl_seconds: int) -> None:
     scenario_context = get_current_scenario_context(context)
     cache_entry = scenario_context.get("cache_entry")
-    test_config = BaseConfig.global_config()
 
     assert cache_entry is not None, "Cache entry should exist"
-    assert test_config is not None, "Test config should be available"
 
     is_holiday, expiry_time = cache_entry
     current_time = DatetimeUtils.get_datetime_utc_now()
 
-    expected_expiry_range_start = current_time + timedelta(seconds=test_config.DATETIME.HISTORICAL_CACHE_TTL - 5)
-    expected_expiry_range_end = current_time + timedelta(seconds=test_config.DATETIME.HISTORICAL_CACHE_TTL + 5)
+    expected_expiry_range_start = current_time + timedelta(seconds=ttl_seconds - 5)
+    expected_expiry_range_end = current_time + timedelta(seconds=ttl_seconds + 5)
 
     assert (
         expected_expiry_range_start <= expiry_time <= expected_expiry_range_end
-    ), f"Cache expiry time should be around {test_config.DATETIME.HISTORICAL_CACHE_TTL} seconds from now"
+    ), f"Cache expiry time should be around {ttl_seconds} seconds from now"
 
 
-@then("the result should be cached with standard TTL")
-def step_then_cached_with_standard_ttl(context: Context) -> None:
-    from datetime import timedelta
-
-    scenario_context = get_current_scenario_context(context)
-    cache_entry = scenario_context.get("cache_entry")
+@then("the result should be cached with historical TTL")
+def step_then_cached_with_historical_ttl(context: Context) -> None:
     test_config = BaseConfig.global_config()
-
-    assert cache_entry is not None, "Cache entry should exist"
     assert test_config is not None, "Test config should be available"
+    _assert_cached_with_ttl(context, test_config.DATETIME.HISTORICAL_CACHE_TTL)
 
-    is_holiday, expiry_time = cache_entry
-    current_time = DatetimeUtils.get_datetime_utc_now()
-
-    expected_expiry_range_start = current_time + timedelta(seconds=test_config.DATETIME.CACHE_TTL - 5)
-    expected_expiry_range_end = current_time + timedelta(seconds=test_config.DATETIME.CACHE_TTL + 5)
 
-    assert (
-        expected_expiry_range_start <= expiry_time <= expected_expiry_range_end
-    ), f"Cache expiry time should be around {test_config.DATETIME.CACHE_TTL} seconds from now"
+@then("the result should be cached with standard TTL")
+def step_then_cached_with_standard_ttl(context: Context) -> None:
+    test_config = BaseConfig.global_config()
+    assert test_config is not None, "Test config should be available"
+    _assert_cached_with_ttl(context, test_config.DATETIME.CACHE_TTL)
@@ -5,11 +5,12 @@ import logging
 import ast
 import asyncio
 import uuid
+from functools import lru_cache, partial
 
 from behave import given, when, then
 from behave.runner import Context
 
-from features.test_helpers import get_current_scenario_context
+from features.test_helpers import get_current_scenario_context, get_shared_adapter, maybe_await
 from archipy.adapters.elasticsearch.adapters import ElasticsearchAdapter, AsyncElasticsearchAdapter
 from archipy.configs.base_config import BaseConfig
 
@@ -17,24 +18,30 @@ logger = logging.getLogger(__name__)
 
 
 def get_es_adapter(context):
-    """Get or initialize the appropriate Elasticsearch adapter based on scenario tags."""
-    scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
+    """Get the appropriate Elasticsearch adapter based on scenario tags.
 
-    if is_async:
-        if not hasattr(scenario_context, "async_adapter") or scenario_context.async_adapter is None:
-            test_config = BaseConfig.global_config()
-            scenario_context.async_adapter = AsyncElasticsearchAdapter(test_config.ELASTIC)
-        return scenario_context.async_adapter
-    if not hasattr(scenario_context, "adapter") or scenario_context.adapter is None:
-        test_config = BaseConfig.global_config()
-        scenario_context.adapter = ElasticsearchAdapter(test_config.ELASTIC)
-    return scenario_context.adapter
+    Adapters are shared across scenarios and keyed by the Elasticsearch config, so a
+    container restarted on another port gets a fresh client.
+    """
+    scenario_context = get_current_scenario_context(context)
+    is_async = context.is_async
+    attr = "async_adapter" if is_async else "adapter"
+
+    adapter = getattr(scenario_context, attr, None)
+    if adapter is None:
+        es_config = BaseConfig.global_config().ELASTIC
+        adapter_class = AsyncElasticsearchAdapter if is_async else ElasticsearchAdapter
+        adapter = get_shared_adapter(
+            ("elasticsearch", is_async, es_config.model_dump_json()),
+            lambda: adapter_class(es_config),
+        )
+        setattr(scenario_context, attr, adapter)
+    return adapter
 
 
 def _is_async_scenario(context: Context) -> bool:
     """Check if the current scenario is async."""
-    return "async" in context.scenario.tags
+    return context.is_async
 
 
 def _get_scenario_context(context: Context):
@@ -42,11 +49,6 @@ def _get_scenario_context(context: Context):
     return get_current_scenario_context(context)
 
 
-async def _wait_for_propagation() -> None:
-    """Wait for Elasticsearch operations to propagate."""
-    await asyncio.sleep(0.5)
-
-
 def _log_operation(context: Context, operation: str, details: str) -> None:
     """Log operation details."""
     context.logger.info(f"{operation}: {details}")
@@ -66,6 +68,37 @@ def get_actual_index_name(context: Context, index_name: str) -> str:
     return index_name
 
 
+@lru_cache(maxsize=None)
+def _parse_document(text: str):
+    """Parse a document literal from a step, once per distinct string.
+
+    The feature files use JSON, so json.loads is tried first and ast.literal_eval
+    covers Python-style literals. The cached value is shared, callers must not mutate it.
+    """
+    try:
+        return json.loads(text)
+    except ValueError:
+        return ast.literal_eval(text)
+
+
+def _bulk_action_lines(row, actual_index_name: str):
+    """Yield the bulk metadata line for a table row, followed by its document line if any."""
+    action = row["action"]
+    if action not in ("index", "create", "update", "delete"):
+        return
+
+    yield {action: {"_index": actual_index_name, "_id": row["id"]}}
+    # Delete actions only carry metadata
+    if action == "delete" or not row["document"]:
+        return
+
+    doc_content = _parse_document(row["document"])
+    # Update actions need the document wrapped in 'doc' unless the user already provided it
+    if action == "update" and "doc" not in doc_content:
+        doc_content = {"doc": doc_content}
+    yield doc_content
+
+
 # Background and setup steps
 @given("an Elasticsearch cluster is running")
 async def step_cluster_running(context: Context) -> None:
@@ -99,7 +132,6 @@ async def step_index_exists(context: Context, index_name: str) -> None:
     """Create an index with a unique name to avoid conflicts."""
     adapter = get_es_adapter(context)
     scenario_context = _get_scenario_context(context)
-    is_async = _is_async_scenario(context)
 
     # Generate a unique index name to avoid conflicts
     unique_suffix = str(uuid.uuid4())[:8]
@@ -107,10 +139,7 @@ async def step_index_exists(context: Context, index_name: str) -> None:
 
     try:
         # Create the index with unique name
-        if is_async:
-            await adapter.create_index(index=unique_index_name)
-        else:
-            adapter.create_index(index=unique_index_name)
+        await maybe_await(adapter.create_index(index=unique_index_name))
 
         # Store the unique name for cleanup
         created_indices = scenario_context.get("created_indices", [])
@@ -174,16 +203,12 @@ async def step_document_exists(context: Context, index_name: str, doc_id: str, c
     """Create a document in the specified index."""
     adapter = get_es_adapter(context)
     scenario_context = _get_scenario_context(context)
-    is_async = _is_async_scenario(context)
 
     try:
-        doc_content = ast.literal_eval(content)
+        doc_content = _parse_document(content)
         actual_index_name = get_actual_index_name(context, index_name)
 
-        if is_async:
-            result = await adapter.index(index=actual_index_name, document=doc_content, doc_id=doc_id)
-        else:
-            result = adapter.index(index=actual_index_name, document=doc_content, doc_id=doc_id)
+        result = await maybe_await(adapter.index(index=actual_index_name, document=doc_content, doc_id=doc_id))
 
         # Store created document for cleanup
         created_documents = scenario_context.get("created_documents", [])
@@ -207,31 +232,6 @@ async def step_document_exists(context: Context, index_name: str, doc_id: str, c
             f"Document with id '{doc_id}' created in index '{actual_index_name}'",
         )
 
-        # Wait for propagation
-        if is_async:
-            await _wait_for_propagation()
-        else:
-            # Simple delay for sync operations
-            time.sleep(0.5)
-
-        # Refresh the index to make the document immediately searchable
-        try:
-            if is_async:
-                await adapter.client.indices.refresh(index=actual_index_name)
-            else:
-                adapter.client.indices.refresh(index=actual_index_name)
-            context.logger.info(f"Refreshed index {actual_index_name} after document creation")
-
-            # Verify the document exists after refresh
-            if is_async:
-                doc_exists = await adapter.exists(index=actual_index_name, doc_id=doc_id)
-            else:
-                doc_exists = adapter.exists(index=actual_index_name, doc_id=doc_id)
-            context.logger.info(f"Document {doc_id} exists after refresh: {doc_exists}")
-
-        except Exception as e:
-            context.logger.warning(f"Failed to refresh index {actual_index_name}: {e}")
-
     except Exception as e:
         scenario_context.store("document_creation_error", str(e))
         context.logger.exception(f"Failed to create document '{doc_id}' in index '{actual_index_name}'")
@@ -244,16 +244,12 @@ async def step_index_document(context: Context, doc_id: str, content: str, index
     """Index a document into the specified index."""
     adapter = get_es_adapter(context)
     scenario_context = _get_scenario_context(context)
-    is_async = _is_async_scenario(context)
 
     try:
-        doc_content = ast.literal_eval(content)
+        doc_content = _parse_document(content)
         actual_index_name = get_actual_index_name(context, index_name)
 
-        if is_async:
-            result = await adapter.index(index=actual_index_name, document=doc_content, doc_id=doc_id)
-        else:
-            result = adapter.index(index=actual_index_name, document=doc_content, doc_id=doc_id)
+        result = await maybe_await(adapter.index(index=actual_index_name, document=doc_content, doc_id=doc_id))
 
         _store_result(scenario_context, "last_index_result", result)
         _log_operation(context, "Document indexing", f"Indexed document with id '{doc_id}' into '{actual_index_name}'")
@@ -264,24 +260,6 @@ async def step_index_document(context: Context, doc_id: str, content: str, index
             created_documents.append((actual_index_name, doc_id))
             scenario_context.store("created_documents", created_documents)
 
-        # Refresh the index to make the document immediately searchable
-        try:
-            if is_async:
-                await adapter.client.indices.refresh(index=actual_index_name)
-            else:
-                adapter.client.indices.refresh(index=actual_index_name)
-            context.logger.info(f"Refreshed index {actual_index_name} after document indexing")
-
-            # Verify the document exists after refresh
-            if is_async:
-                doc_exists = await adapter.exists(index=actual_index_name, doc_id=doc_id)
-            else:
-                doc_exists = adapter.exists(index=actual_index_name, doc_id=doc_id)
-            context.logger.info(f"Document {doc_id} exists after refresh: {doc_exists}")
-
-        except Exception as e:
-            context.logger.warning(f"Failed to refresh index {actual_index_name}: {e}")
-
     except Exception as e:
         scenario_context.store("last_error", str(e))
         context.logger.exception(f"Failed to index document: {e}")
@@ -293,16 +271,14 @@ async def step_search_documents(context: Context, query: str, index_name: str) -
     """Search for documents in the specified index."""
     adapter = get_es_adapter(context)
     scenario_context = _get_scenario_context(context)
-    is_async = _is_async_scenario(context)
 
     try:
         search_query = {"query": {"multi_match": {"query": query, "fields": ["*"]}}}
         actual_index_name = get_actual_index_name(context, index_name)
 
-        if is_async:
-            result = await adapter.search(index=actual_index_name, query=search_query)
-        else:
-            result = adapter.search(index=actual_index_name, query=search_query)
+        # Writes don't refresh on their own, make them all searchable with one refresh
+        await maybe_await(adapter.client.indices.refresh(index=actual_index_name))
+        result = await maybe_await(adapter.search(index=actual_index_name, query=search_query))
 
         _store_result(scenario_context, "last_search_result", result)
         _log_operation(context, "Document search", f"Searched for '{query}' in '{actual_index_name}'")
@@ -318,7 +294,6 @@ async def step_update_document(context: Context, doc_id: str, content: str, inde
     """Update a document in the specified index."""
     adapter = get_es_adapter(context)
     scenario_context = _get_scenario_context(context)
-    is_async = _is_async_scenario(context)
 
     try:
         if content.startswith("'") and content.endswith("'"):
@@ -332,10 +307,7 @@ async def step_update_document(context: Context, doc_id: str, content: str, inde
 
         actual_index_name = get_actual_index_name(context, index_name)
 
-        if is_async:
-            result = await adapter.update(index=actual_index_name, doc_id=doc_id, doc=doc_content)
-        else:
-            result = adapter.update(index=actual_index_name, doc_id=doc_id, doc=doc_content)
+        result = await maybe_await(adapter.update(index=actual_index_name, doc_id=doc_id, doc=doc_content))
 
         _store_result(scenario_context, "last_update_result", result)
         _log_operation(context, "Document update", f"Updated document '{doc_id}' in '{actual_index_name}'")
@@ -351,15 +323,11 @@ async def step_delete_document(context: Context, doc_id: str, index_name: str) -
     """Delete a document from the specified index."""
     adapter = get_es_adapter(context)
     scenario_context = _get_scenario_context(context)
-    is_async = _is_async_scenario(context)
 
     try:
         actual_index_name = get_actual_index_name(context, index_name)
 
-        if is_async:
-            result = await adapter.delete(index=actual_index_name, doc_id=doc_id)
-        else:
-            result = adapter.delete(index=actual_index_name, doc_id=doc_id)
+        result = await maybe_await(adapter.delete(index=actual_index_name, doc_id=doc_id))
 
         _store_result(scenario_context, "last_delete_result", result)
         _log_operation(context, "Document deletion", f"Deleted document '{doc_id}' from '{actual_index_name}'")
@@ -376,7 +344,6 @@ async def step_create_index(context: Context, index_name: str, shards: str, repl
     """Create a new index with specified shard and replica configuration."""
     adapter = get_es_adapter(context)
     scenario_context = _get_scenario_context(context)
-    is_async = _is_async_scenario(context)
 
     try:
         index_body = {"settings": {"number_of_shards": int(shards), "number_of_replicas": int(replicas)}}
@@ -392,10 +359,7 @@ async def step_create_index(context: Context, index_name: str, shards: str, repl
             index_name_mapping[index_name] = actual_index_name
             scenario_context.store("index_name_mapping", index_name_mapping)
 
-        if is_async:
-            result = await adapter.create_index(index=actual_index_name, body=index_body)
-        else:
-            result = adapter.create_index(index=actual_index_name, body=index_body)
+        result = await maybe_await(adapter.create_index(index=actual_index_name, body=index_body))
 
         _store_result(scenario_context, "last_create_index_result", result)
 
@@ -417,15 +381,11 @@ async def step_delete_index(context: Context, index_name: str) -> None:
     """Delete the specified index."""
     adapter = get_es_adapter(context)
     scenario_context = _get_scenario_context(context)
-    is_async = _is_async_scenario(context)
 
     try:
         actual_index_name = get_actual_index_name(context, index_name)
 
-        if is_async:
-            result = await adapter.delete_index(index=actual_index_name)
-        else:
-            result = adapter.delete_index(index=actual_index_name)
+        result = await maybe_await(adapter.delete_index(index=actual_index_name))
 
         _store_result(scenario_context, "last_delete_index_result", result)
         _log_operation(context, "Index deletion", f"Deleted index '{actual_index_name}'")
@@ -442,48 +402,15 @@ async def step_bulk_operation(context: Context) -> None:
     """Perform bulk operations based on the provided table."""
     adapter = get_es_adapter(context)
     scenario_context = _get_scenario_context(context)
-    is_async = _is_async_scenario(context)
 
     try:
-        bulk_actions = []
-        for row in context.table:
-            action = row["action"]
-            doc_id = row["id"]
-            index_name = row["index"]
-            actual_index_name = get_actual_index_name(context, index_name)
-
-            if action == "index":
-                # For index actions, add action metadata then document
-                bulk_actions.append({action: {"_index": actual_index_name, "_id": doc_id}})
-                if row["document"]:
-                    doc_content = ast.literal_eval(row["document"])
-                    bulk_actions.append(doc_content)
-            elif action == "create":
-                # For create actions, add action metadata then document
-                bulk_actions.append({action: {"_index": actual_index_name, "_id": doc_id}})
-                if row["document"]:
-                    doc_content = ast.literal_eval(row["document"])
-                    bulk_actions.append(doc_content)
-            elif action == "update":
-                # For update actions, add action metadata then update document
-                bulk_actions.append({action: {"_index": actual_index_name, "_id": doc_id}})
-                if row["document"]:
-                    doc_content = ast.literal_eval(row["document"])
-                    # Check if the user already provided the Elasticsearch format with 'doc' field
-                    if "doc" in doc_content:
-                        # User already provided the correct format, use as-is
-                        bulk_actions.append(doc_content)
-                    else:
-                        # User provided raw document, wrap in 'doc' field
-                        bulk_actions.append({"doc": doc_content})
-            elif action == "delete":
-                # For delete actions, only add action metadata (no document needed)
-                bulk_actions.append({action: {"_index": actual_index_name, "_id": doc_id}})
-
-        if is_async:
-            result = await adapter.bulk(actions=bulk_actions)
-        else:
-            result = adapter.bulk(actions=bulk_actions)
+        bulk_actions = [
+            line
+            for row in context.table
+            for line in _bulk_action_lines(row, get_actual_index_name(context, row["index"]))
+        ]
+
+        result = await maybe_await(adapter.bulk(actions=bulk_actions))
 
         _store_result(scenario_context, "last_bulk_result", result)
         _log_operation(context, "Bulk operation", f"Performed bulk operation with {len(bulk_actions)} actions")
@@ -522,13 +449,9 @@ async def step_document_retrievable(context: Context, doc_id: str, index_name: s
     """Verify that the document can be retrieved by its ID."""
     adapter = get_es_adapter(context)
     actual_index_name = get_actual_index_name(context, index_name)
-    is_async = _is_async_scenario(context)
 
     try:
-        if is_async:
-            doc = await adapter.get(index=actual_index_name, doc_id=doc_id)
-        else:
-            doc = adapter.get(index=actual_index_name, doc_id=doc_id)
+        doc = await maybe_await(adapter.get(index=actual_index_name, doc_id=doc_id))
 
         assert doc["found"], f"Document {doc_id} not found"
         context.logger.info(f"Document {doc_id} is retrievable")
@@ -553,8 +476,9 @@ def step_hit_contains_field(context: Context, field: str, value: str) -> None:
     hits = scenario_context.get("last_search_result")["hits"]["hits"]
     assert hits, "No hits found"
 
-    found = any(str(hit["_source"].get(field)) == value for hit in hits)
-    assert found, f"No hit contains field '{field}' with value '{value}'"
+    # Only hits that carry the field count, so a missing field never matches the string "None"
+    values = {str(hit["_source"][field]) for hit in hits if field in hit["_source"]}
+    assert value in values, f"No hit contains field '{field}' with value '{value}', found {sorted(values)}"
     context.logger.info(f"Hit contains field '{field}' with value '{value}'")
 
 
@@ -573,13 +497,9 @@ async def step_document_updated(context: Context) -> None:
     scenario_context = _get_scenario_context(context)
     update_result = scenario_context.get("last_update_result")
     adapter = get_es_adapter(context)
-    is_async = _is_async_scenario(context)
 
     try:
-        if is_async:
-            doc = await adapter.get(index=update_result["_index"], doc_id=update_result["_id"])
-        else:
-            doc = adapter.get(index=update_result["_index"], doc_id=update_result["_id"])
+        doc = await maybe_await(adapter.get(index=update_result["_index"], doc_id=update_result["_id"]))
 
         assert doc["found"], "Document not found after update"
         context.logger.info("Document content updated successfully")
@@ -604,17 +524,10 @@ async def step_document_not_exist(context: Context) -> None:
     scenario_context = _get_scenario_context(context)
     delete_result = scenario_context.get("last_delete_result")
     adapter = get_es_adapter(context)
-    is_async = _is_async_scenario(context)
 
-    try:
-        if is_async:
-            exists = await adapter.exists(index=delete_result["_index"], doc_id=delete_result["_id"])
-        else:
-            exists = adapter.exists(index=delete_result["_index"], doc_id=delete_result["_id"])
-
-        assert not exists, "Document still exists after deletion"
-    except Exception:
-        pass  # Expected for non-existent documents
+    # exists returns False for a missing document, transport errors should fail the step
+    exists = await maybe_await(adapter.exists(index=delete_result["_index"], doc_id=delete_result["_id"]))
+    assert not exists, "Document still exists after deletion"
 
     context.logger.info("Document successfully deleted")
 
@@ -633,19 +546,15 @@ async def step_index_exists_in_cluster(context: Context, index_name: str) -> Non
     """Verify that the index exists in the cluster."""
     adapter = get_es_adapter(context)
     actual_index_name = get_actual_index_name(context, index_name)
-    is_async = _is_async_scenario(context)
 
     try:
-        if is_async:
-            exists = await adapter.index_exists(index=actual_index_name)
-        else:
-            exists = adapter.index_exists(index=actual_index_name)
-
-        assert exists, f"Index {actual_index_name} does not exist"
-        context.logger.info(f"Index {actual_index_name} exists in cluster")
+        exists = await maybe_await(adapter.index_exists(index=actual_index_name))
     except Exception as e:
         context.logger.error(f"Failed to check if index {actual_index_name} exists: {e}")
-        assert False, f"Index {actual_index_name} does not exist"
+        exists = False
+
+    assert exists, f"Index {actual_index_name} does not exist"
+    context.logger.info(f"Index {actual_index_name} exists in cluster")
 
 
 @then("the index deletion should succeed")
@@ -662,20 +571,17 @@ async def step_index_not_exist_in_cluster(context: Context, index_name: str) ->
     """Verify that the index no longer exists in the cluster."""
     adapter = get_es_adapter(context)
     actual_index_name = get_actual_index_name(context, index_name)
-    is_async = _is_async_scenario(context)
 
     try:
-        if is_async:
-            exists = await adapter.index_exists(index=actual_index_name)
-        else:
-            exists = adapter.index_exists(index=actual_index_name)
-
-        assert not exists, f"Index {actual_index_name} still exists"
-        context.logger.info(f"Index {actual_index_name} does not exist in cluster")
+        exists = await maybe_await(adapter.index_exists(index=actual_index_name))
     except Exception as e:
         context.logger.error(f"Failed to check if index {actual_index_name} exists: {e}")
         # If we can't check, assume it was deleted
         context.logger.info(f"Index {actual_index_name} assumed deleted (check failed)")
+        return
+
+    assert not exists, f"Index {actual_index_name} still exists"
+    context.logger.info(f"Index {actual_index_name} does not exist in cluster")
 
 
 @then("the bulk operation should succeed")
@@ -743,44 +649,26 @@ async def step_bulk_operations_reflected(context: Context) -> None:
     scenario_context = _get_scenario_context(context)
     result = scenario_context.get("last_bulk_result")
     adapter = get_es_adapter(context)
-    is_async = _is_async_scenario(context)
 
-    for item in result["items"]:
-        action_type = next(iter(item))  # Get the first key (index/update/delete)
-        action_result = item[action_type]
+    # (action type, result) per bulk item, verified together with one multi-get
+    item_results = [next(iter(item.items())) for item in result["items"]]
+    mget_docs = [
+        {"_index": action_result["_index"], "_id": action_result["_id"]} for _, action_result in item_results
+    ]
+
+    try:
+        response = await maybe_await(adapter.client.mget(docs=mget_docs))
+    except Exception as e:
+        context.logger.error(f"Failed to verify bulk operations: {e}")
+        raise
 
+    for (action_type, action_result), doc in zip(item_results, response["docs"], strict=True):
         if action_type in ["index", "create"]:
-            try:
-                if is_async:
-                    doc = await adapter.get(index=action_result["_index"], doc_id=action_result["_id"])
-                else:
-                    doc = adapter.get(index=action_result["_index"], doc_id=action_result["_id"])
-                assert doc["found"], f"Document {action_result['_id']} not found after bulk operation"
-            except Exception as e:
-                context.logger.error(
-                    f"Failed to verify {action_type} operation for document {action_result['_id']}: {e}",
-                )
-                raise
+            assert doc["found"], f"Document {action_result['_id']} not found after bulk operation"
         elif action_type == "update":
-            try:
-                if is_async:
-                    doc = await adapter.get(index=action_result["_index"], doc_id=action_result["_id"])
-                else:
-                    doc = adapter.get(index=action_result["_index"], doc_id=action_result["_id"])
-                assert doc["found"], f"Document {action_result['_id']} not found after bulk update"
-            except Exception as e:
-                context.logger.error(f"Failed to verify update operation for document {action_result['_id']}: {e}")
-                raise
+            assert doc["found"], f"Document {action_result['_id']} not found after bulk update"
         elif action_type == "delete":
-            try:
-                if is_async:
-                    exists = await adapter.exists(index=action_result["_index"], doc_id=action_result["_id"])
-                else:
-                    exists = adapter.exists(index=action_result["_index"], doc_id=action_result["_id"])
-                assert not exists, f"Document {action_result['_id']} still exists after bulk delete"
-            except Exception as e:
-                context.logger.error(f"Failed to verify delete operation for document {action_result['_id']}: {e}")
-                raise
+            assert not doc.get("found", False), f"Document {action_result['_id']} still exists after bulk delete"
 
     context.logger.info("All bulk operations reflected in index")
 
@@ -795,13 +683,9 @@ def step_connection_successful(context: Context) -> None:
 async def step_can_perform_operations(context: Context) -> None:
     """Verify that operations can be performed on the cluster."""
     adapter = get_es_adapter(context)
-    is_async = _is_async_scenario(context)
 
     try:
-        if is_async:
-            result = await adapter.ping()
-        else:
-            result = adapter.ping()
+        result = await maybe_await(adapter.ping())
 
         assert result, "Cannot perform operations on cluster"
         context.logger.info("Able to perform operations on the cluster")
@@ -811,32 +695,46 @@ async def step_can_perform_operations(context: Context) -> None:
 
 
 # Cleanup
-async def after_scenario(context: Context, scenario) -> None:
-    """Clean up after each scenario."""
+async def cleanup_elasticsearch_scenario(context: Context) -> None:
+    """Delete the indices and documents the scenario created, called from environment.after_scenario."""
     scenario_context = _get_scenario_context(context)
     adapter = get_es_adapter(context)
     is_async = _is_async_scenario(context)
 
-    # Clean up created documents
-    created_documents = scenario_context.get("created_documents", [])
-    for index_name, doc_id in created_documents:
-        try:
-            if is_async:
-                await adapter.delete(index=index_name, doc_id=doc_id)
-            else:
-                adapter.delete(index=index_name, doc_id=doc_id)
-            context.logger.info(f"Deleted test document {doc_id} from {index_name}")
-        except Exception as e:
-            context.logger.error(f"Failed to delete document {doc_id}: {e}")
-
-    # Clean up created indices
     created_indices = scenario_context.get("created_indices", [])
-    for index_name in created_indices:
-        try:
-            if is_async:
-                await adapter.delete_index(index=index_name)
-            else:
-                adapter.delete_index(index=index_name)
-            context.logger.info(f"Deleted test index {index_name}")
-        except Exception as e:
-            context.logger.error(f"Failed to delete index {index_name}: {e}")
+    # Documents in indices that are dropped below go away with their index
+    dropped_indices = set(created_indices)
+    created_documents = [
+        (index_name, doc_id)
+        for index_name, doc_id in scenario_context.get("created_documents", [])
+        if index_name not in dropped_indices
+    ]
+    indices = ",".join(created_indices)
+
+    # (description, operation) pairs; the two operations touch disjoint indices
+    cleanups = []
+    if created_documents:
+        bulk_actions = [{"delete": {"_index": index_name, "_id": doc_id}} for index_name, doc_id in created_documents]
+        cleanups.append(
+            (f"{len(created_documents)} test documents", partial(adapter.bulk, actions=bulk_actions, refresh=False)),
+        )
+    if created_indices:
+        cleanups.append(
+            (f"test indices {indices}", partial(adapter.delete_index, index=indices, ignore_unavailable=True)),
+        )
+
+    if is_async:
+        results = await asyncio.gather(*(operation() for _, operation in cleanups), return_exceptions=True)
+    else:
+        results = []
+        for _, operation in cleanups:
+            try:
+                results.append(operation())
+            except Exception as e:
+                results.append(e)
+
+    for (description, _), result in zip(cleanups, results, strict=True):
+        if isinstance(result, Exception):
+            context.logger.error(f"Failed to delete {description}: {result}")
+        else:
+            context.logger.info(f"Deleted {description}")
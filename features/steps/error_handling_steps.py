@@ -1,6 +1,8 @@
 """Step definitions for error handling tests."""
 
+from functools import partial
 from http import HTTPStatus
+from types import MappingProxyType
 from typing import ClassVar
 from unittest.mock import patch
 
@@ -64,7 +66,7 @@ except ImportError:
     PROTOBUF_AVAILABLE = False
     test_service_pb2_grpc = None
 
-ERROR_MAPPING = {
+ERROR_MAPPING = MappingProxyType({
     "NotFoundError": NotFoundError,
     "InvalidArgumentError": InvalidArgumentError,
     "UnauthenticatedError": UnauthenticatedError,
@@ -74,13 +76,22 @@ ERROR_MAPPING = {
     "InvalidPhoneNumberError": InvalidPhoneNumberError,
     "InvalidEmailError": InvalidEmailError,
     "InvalidNationalCodeError": InvalidNationalCodeError,
-}
+})
 
-ERROR_TYPE_MAPPING = {
-    "INVALID_PHONE": InvalidPhoneNumberError,
+# Error enum -> ready-to-call factory, with constructor arguments bound once at import
+ERROR_TYPE_FACTORIES = MappingProxyType({
+    "INVALID_PHONE": partial(InvalidPhoneNumberError, phone_number="09123456789"),
     "NOT_FOUND": NotFoundError,
     "TOKEN_EXPIRED": TokenExpiredError,
-}
+})
+
+# Built-in exceptions a scenario can raise with just a message
+RAISED_ERROR_TYPES = MappingProxyType({
+    "ValueError": ValueError,
+    "TypeError": TypeError,
+    "KeyError": KeyError,
+    "RuntimeError": RuntimeError,
+})
 
 
 @given("a FastAPI test application")
@@ -104,20 +115,14 @@ def step_given_grpc_test_server(context):
 @given('an error type "{error_enum}"')
 def step_given_error_type(context, error_enum):
     scenario_context = get_current_scenario_context(context)
-    error_class = ERROR_TYPE_MAPPING[error_enum]
-
-    if error_enum == "INVALID_PHONE":
-        error_instance = error_class(phone_number="09123456789")
-    else:
-        error_instance = error_class()
-
+    error_instance = ERROR_TYPE_FACTORIES[error_enum]()
     scenario_context.store("error_detail", error_instance)
 
 
 @given('a raised error "{error_type}" with message "{message}"')
 def step_given_raised_error(context, error_type, message):
     scenario_context = get_current_scenario_context(context)
-    error = eval(f"{error_type}('{message}')")
+    error = RAISED_ERROR_TYPES[error_type](message)
     scenario_context.store("error", error)
 
 
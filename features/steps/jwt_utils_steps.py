@@ -1,27 +1,30 @@
 import time
-from uuid import uuid4
 
 from behave import given, then, when
 
-from archipy.configs.base_config import BaseConfig
 from archipy.helpers.utils.jwt_utils import JWTUtils
 from archipy.models.errors import InvalidTokenError, TokenExpiredError
-from features.test_helpers import get_current_scenario_context
+from features.test_helpers import fast_uuid4, get_current_scenario_context
+
+# Taken once at import; time only moves forward, so the claim stays in the past for the whole run
+EXPIRED_TOKEN_CLAIMS = {"exp": int(time.time()) - 10}
+
+# Dot-separated like a JWT but not base64url JSON, so decoding fails before any signature check
+INVALID_TOKEN = "invalid.token.structure"
 
 
 @given("a valid user UUID")
 def step_given_valid_user_uuid(context):
     scenario_context = get_current_scenario_context(context)
-    scenario_context.store("user_uuid", uuid4())
+    scenario_context.store("user_uuid", fast_uuid4(context.rng))
 
 
 @when("an access token is created")
 def step_when_access_token_created(context):
     scenario_context = get_current_scenario_context(context)
     user_uuid = scenario_context.get("user_uuid")
-    test_config = BaseConfig.global_config()
 
-    token = JWTUtils.create_access_token(user_uuid, auth_config=test_config.AUTH)
+    token = JWTUtils.create_access_token(user_uuid, auth_config=context.auth_config)
     scenario_context.store("token", token)
 
 
@@ -29,9 +32,8 @@ def step_when_access_token_created(context):
 def step_when_refresh_token_created(context):
     scenario_context = get_current_scenario_context(context)
     user_uuid = scenario_context.get("user_uuid")
-    test_config = BaseConfig.global_config()
 
-    token = JWTUtils.create_refresh_token(user_uuid, auth_config=test_config.AUTH)
+    token = JWTUtils.create_refresh_token(user_uuid, auth_config=context.auth_config)
     scenario_context.store("token", token)
 
 
@@ -48,9 +50,8 @@ def step_then_jwt_token_returned(context):
 def step_given_valid_access_token(context):
     scenario_context = get_current_scenario_context(context)
     user_uuid = scenario_context.get("user_uuid")
-    test_config = BaseConfig.global_config()
 
-    token = JWTUtils.create_access_token(user_uuid, auth_config=test_config.AUTH)
+    token = JWTUtils.create_access_token(user_uuid, auth_config=context.auth_config)
     scenario_context.store("token", token)
 
 
@@ -58,9 +59,8 @@ def step_given_valid_access_token(context):
 def step_given_valid_refresh_token(context):
     scenario_context = get_current_scenario_context(context)
     user_uuid = scenario_context.get("user_uuid")
-    test_config = BaseConfig.global_config()
 
-    token = JWTUtils.create_refresh_token(user_uuid, auth_config=test_config.AUTH)
+    token = JWTUtils.create_refresh_token(user_uuid, auth_config=context.auth_config)
     scenario_context.store("token", token)
 
 
@@ -68,12 +68,11 @@ def step_given_valid_refresh_token(context):
 def step_given_expired_access_token(context):
     scenario_context = get_current_scenario_context(context)
     user_uuid = scenario_context.get("user_uuid")
-    test_config = BaseConfig.global_config()
 
     token = JWTUtils.create_access_token(
         user_uuid,
-        additional_claims={"exp": time.time() - 10},
-        auth_config=test_config.AUTH,
+        additional_claims=EXPIRED_TOKEN_CLAIMS,
+        auth_config=context.auth_config,
     )
     scenario_context.store("token", token)
 
@@ -81,22 +80,24 @@ def step_given_expired_access_token(context):
 @given("an invalid token")
 def step_given_invalid_token(context):
     scenario_context = get_current_scenario_context(context)
-    scenario_context.store("token", "invalid.token.structure")
+    scenario_context.store("token", INVALID_TOKEN)
 
 
 @when("the token is decoded")
 def step_when_token_decoded(context):
     scenario_context = get_current_scenario_context(context)
     token = scenario_context.get("token")
-    test_config = BaseConfig.global_config()
 
+    # Only the documented decode failures are expected, anything else should fail the step
     try:
-        decoded_payload = JWTUtils.decode_token(token, auth_config=test_config.AUTH)
-        scenario_context.store("decode_success", True)
-        scenario_context.store("decoded_payload", decoded_payload)
-    except Exception as e:
+        decoded_payload = JWTUtils.decode_token(token, auth_config=context.auth_config)
+    except (TokenExpiredError, InvalidTokenError) as e:
         scenario_context.store("decode_success", False)
         scenario_context.store("decode_error", e)
+    else:
+        scenario_context.store("decode_success", True)
+        scenario_context.store("decoded_payload", decoded_payload)
+        scenario_context.store("decode_error", None)
 
 
 @then("the decoded payload should be valid")
@@ -106,9 +107,9 @@ def step_then_decoded_payload_valid(context):
     decoded_payload = scenario_context.get("decoded_payload")
 
     assert decode_success is True
-    assert isinstance(decoded_payload, dict)
-    assert "sub" in decoded_payload
-    assert "type" in decoded_payload
+    # decode_token returns a dict, a missing claim surfaces as a KeyError naming it
+    assert decoded_payload["sub"] is not None
+    assert decoded_payload["type"] is not None
 
 
 @then("a TokenExpiredError should be raised")
@@ -116,7 +117,7 @@ def step_then_token_expired_exception_raised(context):
     scenario_context = get_current_scenario_context(context)
     decode_error = scenario_context.get("decode_error")
 
-    assert isinstance(decode_error, TokenExpiredError)
+    assert type(decode_error) is TokenExpiredError, f"Expected TokenExpiredError, got {decode_error!r}"
 
 
 @then("an InvalidTokenError should be raised")
@@ -124,4 +125,4 @@ def step_then_invalid_token_exception_raised(context):
     scenario_context = get_current_scenario_context(context)
     decode_error = scenario_context.get("decode_error")
 
-    assert isinstance(decode_error, InvalidTokenError)
+    assert type(decode_error) is InvalidTokenError, f"Expected InvalidTokenError, got {decode_error!r}"
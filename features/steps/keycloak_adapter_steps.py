@@ -1,66 +1,180 @@
 # features/steps/keycloak_auth_steps.py
 
+import asyncio
 import logging
+import time
+from collections.abc import Callable
+from functools import partial, wraps
+from types import MappingProxyType
+from typing import Any
 
-from behave import given, then, when
+from behave import given, register_type, then, when
 from behave.runner import Context
+from parse import with_pattern
 from features.scenario_context import ScenarioContext
-from features.test_helpers import get_current_scenario_context
+from features.test_helpers import get_current_scenario_context, get_shared_adapter, maybe_await
 
 from archipy.adapters.keycloak.adapters import AsyncKeycloakAdapter, KeycloakAdapter
 from archipy.configs.base_config import BaseConfig
+from archipy.models.errors import RealmAlreadyExistsError, UserAlreadyExistsError
+
+
+# Fixed fields of the users created by step_create_user_basic, merged into a new dict per call
+BASIC_USER_TEMPLATE = MappingProxyType({
+    "enabled": True,
+    "emailVerified": True,
+    "lastName": "Test",
+    "requiredActions": [],
+    "attributes": {"locale": ["en"]},
+})
+
+# Client secrets by (realm, internal client id); a client keeps its secret for the whole run
+_client_secrets: dict[tuple[str, str], str] = {}
+
+
+@with_pattern(r"a?sync")
+def parse_adapter_type(text: str) -> bool:
+    """Parse the "sync"/"async" adapter type of a step into an is_async flag."""
+    return text == "async"
+
+
+register_type(AdapterType=parse_adapter_type)
 
 
 def get_keycloak_adapter(context: Context) -> AsyncKeycloakAdapter | KeycloakAdapter:
-    """Get or initialize the appropriate Keycloak adapter based on scenario tags."""
+    """Get the Keycloak adapter of the scenario's adapter type.
+
+    Adapters are shared across scenarios and keyed by the Keycloak config, so the admin
+    client and its token are reused instead of re-authenticating every scenario. Each shared
+    adapter owns a copy of the config and is never reconfigured; steps that switch realm or
+    client move the scenario to its own adapter through _use_scenario_adapter.
+    """
+    scenario_context = get_current_scenario_context(context)
+    is_async = context.is_async
+    attr = "async_adapter" if is_async else "adapter"
+
+    adapter = getattr(scenario_context, attr, None)
+    if adapter is None:
+        keycloak_config = BaseConfig.global_config().KEYCLOAK
+        adapter_class = AsyncKeycloakAdapter if is_async else KeycloakAdapter
+        adapter = get_shared_adapter(
+            ("keycloak", is_async, keycloak_config.model_dump_json()),
+            lambda: adapter_class(keycloak_config.model_copy()),
+        )
+        # Lookups cached by an earlier scenario may describe users and roles that are gone
+        adapter.clear_all_caches()
+        setattr(scenario_context, attr, adapter)
+    return adapter
+
+
+def _use_scenario_adapter(
+    context: Context,
+    base_adapter: AsyncKeycloakAdapter | KeycloakAdapter,
+    **config_updates: Any,
+) -> AsyncKeycloakAdapter | KeycloakAdapter:
+    """Build an adapter for this scenario only, from a copy of base_adapter's config with config_updates applied.
+
+    The new adapter replaces the scenario's adapter and is closed when the scenario ends. It never
+    enters the shared cache, so its realm or client can't leak into other scenarios.
+    """
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
+    adapter = type(base_adapter)(base_adapter.configs.model_copy(update=config_updates))
+    setattr(scenario_context, "async_adapter" if context.is_async else "adapter", adapter)
+    scenario_context.keycloak_adapters.append(adapter)
+    return adapter
 
-    if is_async:
-        if not hasattr(scenario_context, "async_adapter") or scenario_context.async_adapter is None:
-            test_config = BaseConfig.global_config()
-            scenario_context.async_adapter = AsyncKeycloakAdapter(test_config.KEYCLOAK)
-        return scenario_context.async_adapter
-    if not hasattr(scenario_context, "adapter") or scenario_context.adapter is None:
-        test_config = BaseConfig.global_config()
-        scenario_context.adapter = KeycloakAdapter(test_config.KEYCLOAK)
-    return scenario_context.adapter
+
+def _get_current_token(scenario_context: ScenarioContext) -> tuple[str, dict]:
+    """Return the username and token response of the latest "have a valid token" step."""
+    username = scenario_context.get("current_token_username")
+    if username is None:
+        raise ValueError("No previous token step found")
+    return username, scenario_context.get("current_token")
+
+
+def _store_step_error(error_key: str, message: str) -> Callable:
+    """Store the error of a failing step under error_key instead of failing the step.
+
+    The matching "should succeed" Then step asserts on error_key, so the failure is reported there.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(context: Context, *args: Any, **kwargs: Any) -> None:
+            try:
+                await func(context, *args, **kwargs)
+            except Exception as e:
+                get_current_scenario_context(context).store(error_key, str(e))
+                context.logger.exception(message)
+
+        return wrapper
+
+    return decorator
+
+
+async def _run_table_calls(context: Context, calls: list[Callable[[], Any]]) -> list[Any]:
+    """Run one adapter call per table row and return each row's result or raised exception.
+
+    The async adapter's calls are awaited together, so a table costs one round-trip of
+    wall-clock time instead of one per row.
+    """
+    if context.is_async:
+        return await asyncio.gather(*(call() for call in calls), return_exceptions=True)
+    results = []
+    for call in calls:
+        try:
+            results.append(call())
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+async def _resolve_client_id(
+    adapter: AsyncKeycloakAdapter | KeycloakAdapter,
+    scenario_context: ScenarioContext,
+    client_name: str,
+) -> str | None:
+    """Return the internal id of a client, asking Keycloak only for clients the scenario didn't create."""
+    client_result = scenario_context.get(f"client_{client_name}") or {}
+    return client_result.get("internal_client_id") or await maybe_await(adapter.get_client_id(client_name))
+
+
+def _table_errors(labels: list[str], results: list[Any]) -> str | None:
+    """Join the errors of the failed table rows into one message, or None if every row succeeded."""
+    errors = [
+        f"{label}: {result}" for label, result in zip(labels, results, strict=True) if isinstance(result, Exception)
+    ]
+    return "; ".join(errors) or None
 
 
 # Configuration steps
-@given("a configured {adapter_type} Keycloak adapter")
-def step_configured_adapter(context: Context, adapter_type: str) -> None:
-    """Configure a Keycloak adapter of the specified type."""
+@given("a configured {is_async:AdapterType} Keycloak adapter")
+def step_configured_adapter(context: Context, is_async: bool) -> None:
+    """Configure a Keycloak adapter of the specified type.
+
+    Keycloak scenarios pick the adapter from the outline's adapter_type column rather than a
+    scenario tag, so the flag parsed here is what the later steps read from context.is_async.
+    """
+    context.is_async = is_async
     get_keycloak_adapter(context)
-    context.logger.info(f"{adapter_type.capitalize()} Keycloak adapter configured")
+    context.logger.info("Async Keycloak adapter configured" if is_async else "Sync Keycloak adapter configured")
 
 
 # Realm management steps
 @given('I create a realm named "{realm_name}" with display name "{display_name}" using {adapter_type} adapter')
 @when('I create a realm named "{realm_name}" with display name "{display_name}" using {adapter_type} adapter')
+@_store_step_error("realm_error", "Realm creation failed")
 async def step_create_realm(context: Context, realm_name: str, display_name: str, adapter_type: str) -> None:
     """Create a realm with the specified name and display name."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
 
-    try:
-        if is_async:
-
-            realm_result = await adapter.create_realm(
-                realm_name=realm_name,
-                display_name=display_name,
-                skip_exists=True,
-            )
-
-        else:
-            realm_result = adapter.create_realm(realm_name=realm_name, display_name=display_name, skip_exists=True)
-        scenario_context.store("latest_realm_result", realm_result)
-        scenario_context.store(f"realm_{realm_name}", realm_result)
-        context.logger.info(f"Created realm {realm_name}")
-    except Exception as e:
-        scenario_context.store("realm_error", str(e))
-        context.logger.exception("Realm creation failed")
+    realm_result = await maybe_await(
+        adapter.create_realm(realm_name=realm_name, display_name=display_name, skip_exists=True),
+    )
+    scenario_context.store("latest_realm_result", realm_result)
+    scenario_context.store(f"realm_{realm_name}", realm_result)
+    context.logger.info(f"Created realm {realm_name}")
 
 
 
@@ -70,20 +184,13 @@ async def step_enable_realm_organizations(
 ) -> None:
     """Get realm and, if organizations not enabled, update realm via adapter.update_realm."""
     adapter = get_keycloak_adapter(context)
-    is_async = "async" in context.scenario.tags
 
     try:
-        if is_async:
-            realm = await adapter.get_realm(realm_name)
-        else:
-            realm = adapter.get_realm(realm_name)
+        realm = await maybe_await(adapter.get_realm(realm_name))
         if realm is not None and not realm.get("organizationsEnabled"):
             realm = dict(realm)
             realm["organizationsEnabled"] = True
-            if is_async:
-                await adapter.update_realm(realm_name, **realm)
-            else:
-                adapter.update_realm(realm_name, **realm)
+            await maybe_await(adapter.update_realm(realm_name, **realm))
             context.logger.info(f"Enabled organizations for realm {realm_name}")
         else:
             context.logger.info(f"Realm {realm_name} already has organizations enabled")
@@ -98,6 +205,7 @@ async def step_enable_realm_organizations(
 @when(
     'I create a client named "{client_name}" in realm "{realm_name}" with service accounts enabled using {adapter_type} adapter',
 )
+@_store_step_error("client_error", "Client creation failed")
 async def step_create_client_with_service_accounts(
     context: Context,
     client_name: str,
@@ -107,93 +215,77 @@ async def step_create_client_with_service_accounts(
     """Create a client with service accounts enabled in the specified realm."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
+    is_async = context.is_async
 
-    try:
-        if is_async:
-
-            client_result = await adapter.create_client(
-                client_id=client_name,
-                realm=realm_name,
-                skip_exists=True,
-                public_client=False,  # Use confidential client for hybrid operations
-                service_account_enabled=True,  # Enable for client credentials flow
-                direct_access_grants_enabled=True,  # Enable direct access grants
-                standard_flow_enabled=True,  # Enable standard flow
-                authorization_services_enabled=True,  # Enable for token introspection
-            )
-            scenario_context.store("latest_client_result", client_result)
-            scenario_context.store(f"client_{client_name}", client_result)
-            await update_adapter_config(adapter, client_name, realm_name, scenario_context)
-        else:
-            client_result = adapter.create_client(
-                client_id=client_name,
-                realm=realm_name,
-                skip_exists=True,
-                public_client=False,
-                service_account_enabled=True,
-                direct_access_grants_enabled=True,
-                standard_flow_enabled=True,
-                authorization_services_enabled=True,
-            )
-            scenario_context.store("latest_client_result", client_result)
-            scenario_context.store(f"client_{client_name}", client_result)
+    if is_async:
 
-        context.logger.info(f"Created client {client_name} in realm {realm_name}")
+        client_result = await adapter.create_client(
+            client_id=client_name,
+            realm=realm_name,
+            skip_exists=True,
+            public_client=False,  # Use confidential client for hybrid operations
+            service_account_enabled=True,  # Enable for client credentials flow
+            direct_access_grants_enabled=True,  # Enable direct access grants
+            standard_flow_enabled=True,  # Enable standard flow
+            authorization_services_enabled=True,  # Enable for token introspection
+        )
+        scenario_context.store("latest_client_result", client_result)
+        scenario_context.store(f"client_{client_name}", client_result)
+        update_adapter_config(context, adapter, client_name, realm_name)
+    else:
+        client_result = adapter.create_client(
+            client_id=client_name,
+            realm=realm_name,
+            skip_exists=True,
+            public_client=False,
+            service_account_enabled=True,
+            direct_access_grants_enabled=True,
+            standard_flow_enabled=True,
+            authorization_services_enabled=True,
+        )
+        scenario_context.store("latest_client_result", client_result)
+        scenario_context.store(f"client_{client_name}", client_result)
 
-    except Exception as e:
-        scenario_context.store("client_error", str(e))
-        context.logger.exception("Client creation failed")
+    context.logger.info(f"Created client {client_name} in realm {realm_name}")
 
 
-async def update_adapter_config(
+def update_adapter_config(
+    context: Context,
     adapter: AsyncKeycloakAdapter | KeycloakAdapter,
     client_name: str,
     realm_name: str,
-    scenario_context: ScenarioContext,
-    is_async: bool = False,
-) -> None:
+) -> AsyncKeycloakAdapter | KeycloakAdapter:
+    """Move the scenario to an adapter for the given realm and client and return it."""
+    scenario_context = get_current_scenario_context(context)
     try:
-        original_realm = adapter.configs.REALM_NAME
-        adapter.configs.REALM_NAME = realm_name
-        adapter._admin_adapter = None
-        adapter._admin_token_expiry = 0
-        if adapter.configs.IS_ADMIN_MODE_ENABLED and (
-            adapter.configs.CLIENT_SECRET_KEY or (adapter.configs.ADMIN_USERNAME and adapter.configs.ADMIN_PASSWORD)
-        ):
-            adapter._initialize_admin_client()
         client_result = scenario_context.get(f"client_{client_name}")
         if not client_result or "internal_client_id" not in client_result:
             raise ValueError(f"Client result not found or missing ID for client {client_name}")
         client_id = client_result["internal_client_id"]
-        # For confidential clients, we need to get the client secret
-        adapter.configs.CLIENT_ID = client_name
 
         # For confidential clients, we'll set the secret to None and let the adapter handle it
         # The client secret will be retrieved when needed by the adapter
-        adapter.configs.CLIENT_SECRET_KEY = None
-
-        # Force recreation of the OpenID client with new configuration
-        adapter.openid_adapter = adapter._get_openid_client(adapter.configs)
-        adapter._admin_adapter = None
-        adapter._admin_token_expiry = 0
-        if adapter.configs.IS_ADMIN_MODE_ENABLED and (
-            adapter.configs.CLIENT_SECRET_KEY or (adapter.configs.ADMIN_USERNAME and adapter.configs.ADMIN_PASSWORD)
-        ):
-            adapter._initialize_admin_client()
+        scenario_adapter = _use_scenario_adapter(
+            context,
+            adapter,
+            REALM_NAME=realm_name,
+            CLIENT_ID=client_name,
+            CLIENT_SECRET_KEY=None,
+        )
         scenario_context.store(
             "client_config_updated",
             {
                 "client_id": client_name,
                 "realm": realm_name,
                 "secret": None,  # Will be retrieved when needed
-                "previous_realm": original_realm,
+                "previous_realm": adapter.configs.REALM_NAME,
                 "internal_client_id": client_id,
             },
         )
     except Exception as e:
         scenario_context.store("client_config_error", str(e))
         raise
+    return scenario_adapter
 
 
 async def _ensure_introspection_audience_mapper(
@@ -205,13 +297,10 @@ async def _ensure_introspection_audience_mapper(
     is_async: bool,
     logger: logging.Logger,
 ) -> None:
-    """Add audience mapper so the introspecting client is included in token ``aud`` (Keycloak 26.6.2+)."""
-    adapter.configs.REALM_NAME = realm_name
-    adapter._admin_adapter = None
-    adapter._admin_token_expiry = 0
-    if adapter.configs.IS_ADMIN_MODE_ENABLED:
-        adapter._initialize_admin_client()
+    """Add audience mapper so the introspecting client is included in token ``aud`` (Keycloak 26.6.2+).
 
+    The adapter must already be configured for realm_name.
+    """
     mapper_name = f"audience-{client_name}"
     mapper_payload = {
         "name": mapper_name,
@@ -257,7 +346,7 @@ async def step_create_client_and_update_adapter(
     """Create a client with service accounts enabled and create a new adapter instance for it."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
+    is_async = context.is_async
 
     try:
         if is_async:
@@ -273,17 +362,8 @@ async def step_create_client_and_update_adapter(
             scenario_context.store("latest_client_result", client_result)
             scenario_context.store(f"client_{client_name}", client_result)
 
-            await update_adapter_config(adapter, client_name, realm_name, scenario_context, is_async=True)
-
-            # Ensure the adapter is properly configured for the new client
-            # Reinitialize the adapter with the updated configuration
-            adapter.configs.REALM_NAME = realm_name
-            adapter.configs.CLIENT_ID = client_name
-            # Force reinitialization of the OpenID client
-            adapter._admin_adapter = None
-            adapter._admin_token_expiry = 0
-            if adapter.configs.IS_ADMIN_MODE_ENABLED:
-                adapter._initialize_admin_client()
+            # Moves the scenario to an adapter for the new realm and client, with admin authenticated there
+            adapter = update_adapter_config(context, adapter, client_name, realm_name)
 
             # Extract the internal client ID from the result
             if not client_result or "internal_client_id" not in client_result:
@@ -291,20 +371,21 @@ async def step_create_client_and_update_adapter(
 
             client_id = client_result["internal_client_id"]  # This is the internal UUID
 
-            # Get the client secret using the internal client ID with retry logic
-            import asyncio
-
+            # Get the client secret using the internal client ID with retry logic, once per client
+            client_secret = _client_secrets.get((realm_name, client_id))
             max_retries = 3
-            for attempt in range(max_retries):
+            for attempt in range(max_retries if client_secret is None else 0):
                 try:
-                    # Ensure admin adapter is properly configured for the correct realm
-                    adapter.configs.REALM_NAME = realm_name
-                    adapter._admin_adapter = None
-                    adapter._admin_token_expiry = 0
-                    if adapter.configs.IS_ADMIN_MODE_ENABLED:
-                        adapter._initialize_admin_client()
+                    # update_adapter_config just built the admin client for this realm, so keep
+                    # its HTTP session and token on the first attempt and only rebuild on retries
+                    if attempt:
+                        adapter._admin_adapter = None
+                        adapter._admin_token_expiry = 0
+                        if adapter.configs.IS_ADMIN_MODE_ENABLED:
+                            adapter._initialize_admin_client()
 
                     client_secret = await adapter.get_client_secret(client_id)
+                    _client_secrets[realm_name, client_id] = client_secret
                     break
                 except Exception as e:
                     if attempt < max_retries - 1:
@@ -314,25 +395,13 @@ async def step_create_client_and_update_adapter(
                         context.logger.error(f"Failed to get client secret after {max_retries} attempts: {e}")
                         raise
 
-            # Create new configuration
-            from archipy.configs.config_template import KeycloakConfig
-
-            new_config = KeycloakConfig()
-            new_config.SERVER_URL = adapter.configs.SERVER_URL
-            new_config.CLIENT_ID = client_name  # Use client name for configuration
-            new_config.REALM_NAME = realm_name
-            new_config.CLIENT_SECRET_KEY = client_secret
-            new_config.VERIFY_SSL = adapter.configs.VERIFY_SSL
-            new_config.TIMEOUT = adapter.configs.TIMEOUT
-            new_config.ADMIN_USERNAME = adapter.configs.ADMIN_USERNAME
-            new_config.ADMIN_PASSWORD = adapter.configs.ADMIN_PASSWORD
-            new_config.ADMIN_REALM_NAME = adapter.configs.ADMIN_REALM_NAME
-
-            # Create new adapter instance
-            from archipy.adapters.keycloak.adapters import AsyncKeycloakAdapter
-
-            new_adapter = AsyncKeycloakAdapter(new_config)
-            scenario_context.async_adapter = new_adapter
+            # Create an adapter for the new client; admin mode stays off for the client adapter
+            new_adapter = _use_scenario_adapter(
+                context,
+                adapter,
+                CLIENT_SECRET_KEY=client_secret,
+                IS_ADMIN_MODE_ENABLED=False,
+            )
 
             await _ensure_introspection_audience_mapper(
                 new_adapter,
@@ -363,25 +432,23 @@ async def step_create_client_and_update_adapter(
 
             client_id = client_result["internal_client_id"]  # This is the internal UUID
 
-            # Update the adapter configuration
-            adapter.configs.CLIENT_ID = client_name
-            adapter.configs.REALM_NAME = realm_name
-
-            # Get the client secret for confidential client with retry logic
-            import time
+            # Move the scenario to an adapter for the new realm and client, with admin authenticated there
+            adapter = _use_scenario_adapter(context, adapter, CLIENT_ID=client_name, REALM_NAME=realm_name)
 
+            # Get the client secret for confidential client with retry logic, once per client
+            client_secret = _client_secrets.get((realm_name, client_id))
             max_retries = 3
-            for attempt in range(max_retries):
+            for attempt in range(max_retries if client_secret is None else 0):
                 try:
-                    # Ensure admin adapter is properly configured for the correct realm
-                    adapter.configs.REALM_NAME = realm_name
-                    adapter._admin_adapter = None
-                    adapter._admin_token_expiry = 0
-                    if adapter.configs.IS_ADMIN_MODE_ENABLED:
-                        adapter._initialize_admin_client()
+                    # The new adapter just authenticated admin for this realm, only rebuild it on retries
+                    if attempt:
+                        adapter._admin_adapter = None
+                        adapter._admin_token_expiry = 0
+                        if adapter.configs.IS_ADMIN_MODE_ENABLED:
+                            adapter._initialize_admin_client()
 
                     client_secret = adapter.get_client_secret(client_id)
-                    adapter.configs.CLIENT_SECRET_KEY = client_secret
+                    _client_secrets[realm_name, client_id] = client_secret
                     break
                 except Exception as e:
                     if attempt < max_retries - 1:
@@ -389,15 +456,8 @@ async def step_create_client_and_update_adapter(
                         time.sleep(1)  # Wait 1 second before retry
                     else:
                         context.logger.warning(f"Could not get client secret after {max_retries} attempts: {e}")
-                        # Set to None for now, it will be retrieved when needed
-                        adapter.configs.CLIENT_SECRET_KEY = None
-
-            # Force reinitialization of the OpenID client
-            adapter._openid_adapter = adapter._get_openid_client(adapter.configs)
-            adapter._admin_adapter = None
-            adapter._admin_token_expiry = 0
-            if adapter.configs.IS_ADMIN_MODE_ENABLED:
-                adapter._initialize_admin_client()
+            # Left as None when it couldn't be fetched, it will be retrieved when needed
+            adapter = _use_scenario_adapter(context, adapter, CLIENT_SECRET_KEY=client_secret)
 
             await _ensure_introspection_audience_mapper(
                 adapter,
@@ -414,6 +474,30 @@ async def step_create_client_and_update_adapter(
         context.logger.exception("Client creation and adapter update failed")
 
 
+def _create_user_replacing_existing(adapter: KeycloakAdapter, user_data: dict) -> str | None:
+    """Create the user, replacing a leftover user with the same username only on conflict."""
+    try:
+        return adapter.create_user(user_data)
+    except UserAlreadyExistsError:
+        existing_user = adapter.get_user_by_username(user_data["username"])
+        if not existing_user:
+            raise
+        adapter.delete_user(existing_user["id"])
+        return adapter.create_user(user_data)
+
+
+async def _async_create_user_replacing_existing(adapter: AsyncKeycloakAdapter, user_data: dict) -> str | None:
+    """Async variant of _create_user_replacing_existing."""
+    try:
+        return await adapter.create_user(user_data)
+    except UserAlreadyExistsError:
+        existing_user = await adapter.get_user_by_username(user_data["username"])
+        if not existing_user:
+            raise
+        await adapter.delete_user(existing_user["id"])
+        return await adapter.create_user(user_data)
+
+
 # User management steps
 @given('I create a user with username "{username}" and password "{password}" using {adapter_type} adapter')
 @when('I create a user with username "{username}" and password "{password}" using {adapter_type} adapter')
@@ -421,41 +505,28 @@ async def step_create_user_basic(context: Context, username: str, password: str,
     """Create a user with the specified username and password."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
+    is_async = context.is_async
 
     user_data = {
+        **BASIC_USER_TEMPLATE,
         "username": username,
-        "enabled": True,
-        "emailVerified": True,
         "firstName": username,
-        "lastName": "Test",
         "email": f"{username}@test.com",
         "credentials": [{"type": "password", "value": password, "temporary": False}],
-        "requiredActions": [],
-        "attributes": {"locale": ["en"]},
     }
 
     try:
         if is_async:
 
-            existing_user = await adapter.get_user_by_username(username)
-            if existing_user:
-                await adapter.delete_user(existing_user["id"])
-
-            user_id = await adapter.create_user(user_data)
-            scenario_context.store(f"user_id_{username}", user_id)
+            user_id = await _async_create_user_replacing_existing(adapter, user_data)
+            scenario_context.user_ids[username] = user_id
             scenario_context.store("latest_user_creation", {"username": username, "user_id": user_id})
 
         else:
-            # Check if user exists and delete if needed
-            existing_user = adapter.get_user_by_username(username)
-            if existing_user:
-                adapter.delete_user(existing_user["id"])
-
-            user_id = adapter.create_user(user_data)
-            scenario_context.store(f"user_id_{username}", user_id)
+            user_id = _create_user_replacing_existing(adapter, user_data)
+            scenario_context.user_ids[username] = user_id
             scenario_context.store("latest_user_creation", {"username": username, "user_id": user_id})
-        context.logger.info(f"Created user {username} with ID {scenario_context.get(f'user_id_{username}')}")
+        context.logger.info(f"Created user {username} with ID {scenario_context.user_ids.get(username)}")
     except Exception as e:
         scenario_context.store("user_creation_error", str(e))
         context.logger.exception(f"Failed to create user {username}")
@@ -477,7 +548,7 @@ async def step_create_user_with_email(
     """Create a user with the specified username, email, and password."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
+    is_async = context.is_async
 
     user_data = {
         "username": username,
@@ -489,25 +560,16 @@ async def step_create_user_with_email(
     try:
         if is_async:
 
-            existing_user = await adapter.get_user_by_username(username)
-            if existing_user:
-                await adapter.delete_user(existing_user["id"])
-
-            user_id = await adapter.create_user(user_data)
-            scenario_context.store(f"user_id_{username}", user_id)
+            user_id = await _async_create_user_replacing_existing(adapter, user_data)
+            scenario_context.user_ids[username] = user_id
             scenario_context.store(
                 "latest_user_creation",
                 {"username": username, "email": email, "user_id": user_id},
             )
 
         else:
-            # Check if user exists and delete if needed
-            existing_user = adapter.get_user_by_username(username)
-            if existing_user:
-                adapter.delete_user(existing_user["id"])
-
-            user_id = adapter.create_user(user_data)
-            scenario_context.store(f"user_id_{username}", user_id)
+            user_id = _create_user_replacing_existing(adapter, user_data)
+            scenario_context.user_ids[username] = user_id
             scenario_context.store("latest_user_creation", {"username": username, "email": email, "user_id": user_id})
         context.logger.info(f"Created user {username} with email {email}")
     except Exception as e:
@@ -520,40 +582,26 @@ async def step_have_valid_token(context: Context, username: str, password: str,
     """Obtain a valid token for the specified username and password."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
-
-    if is_async:
 
-        token_response = await adapter.get_token(username, password)
-        scenario_context.store(f"token_response_{username}", token_response)
-
-    else:
-        token_response = adapter.get_token(username, password)
-        scenario_context.store(f"token_response_{username}", token_response)
+    token_response = await maybe_await(adapter.get_token(username, password))
+    scenario_context.store(f"token_response_{username}", token_response)
+    # Later token steps act on the user and token of the most recent valid token
+    scenario_context.store("current_token_username", username)
+    scenario_context.store("current_token", token_response)
     context.logger.info(f"Obtained initial token for {username}")
 
 
 # Token management steps
 @when('I request a token with username "{username}" and password "{password}" using {adapter_type} adapter')
+@_store_step_error("token_error", "Token request failed")
 async def step_request_token(context: Context, username: str, password: str, adapter_type: str) -> None:
     """Request a token with the specified username and password."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
 
-    try:
-        if is_async:
-
-            token_response = await adapter.get_token(username, password)
-            scenario_context.store("latest_token_response", token_response)
-
-        else:
-            token_response = adapter.get_token(username, password)
-            scenario_context.store("latest_token_response", token_response)
-        context.logger.info(f"Requested token for {username}")
-    except Exception as e:
-        scenario_context.store("token_error", str(e))
-        context.logger.exception("Token request failed")
+    token_response = await maybe_await(adapter.get_token(username, password))
+    scenario_context.store("latest_token_response", token_response)
+    context.logger.info(f"Requested token for {username}")
 
 
 @when("I refresh the token using {adapter_type} adapter")
@@ -561,24 +609,12 @@ async def step_refresh_token(context: Context, adapter_type: str) -> None:
     """Refresh the token using the adapter of the specified type."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
-
-    # Find the username from previous steps
-    prev_step = next((s for s in reversed(context.scenario.steps) if "have a valid token" in s.name), None)
-    if not prev_step:
-        raise ValueError("No previous token step found")
 
-    username = prev_step.name.split('"')[1]
-    refresh_token = scenario_context.get(f"token_response_{username}")["refresh_token"]
+    username, token_response = _get_current_token(scenario_context)
+    refresh_token = token_response["refresh_token"]
 
-    if is_async:
-
-        new_token = await adapter.refresh_token(refresh_token)
-        scenario_context.store("latest_token_response", new_token)
-
-    else:
-        new_token = adapter.refresh_token(refresh_token)
-        scenario_context.store("latest_token_response", new_token)
+    new_token = await maybe_await(adapter.refresh_token(refresh_token))
+    scenario_context.store("latest_token_response", new_token)
     context.logger.info(f"Refreshed token for {username}")
 
 
@@ -587,23 +623,12 @@ async def step_request_user_info(context: Context, adapter_type: str) -> None:
     """Request user info using the token and the adapter of the specified type."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
 
-    prev_step = next((s for s in reversed(context.scenario.steps) if "have a valid token" in s.name), None)
-    if not prev_step:
-        raise ValueError("No previous token step found")
-
-    username = prev_step.name.split('"')[1]
-    access_token = scenario_context.get(f"token_response_{username}")["access_token"]
-
-    if is_async:
-
-        user_info = await adapter.get_userinfo(access_token)
-        scenario_context.store("latest_user_info", user_info)
+    username, token_response = _get_current_token(scenario_context)
+    access_token = token_response["access_token"]
 
-    else:
-        user_info = adapter.get_userinfo(access_token)
-        scenario_context.store("latest_user_info", user_info)
+    user_info = await maybe_await(adapter.get_userinfo(access_token))
+    scenario_context.store("latest_user_info", user_info)
     context.logger.info(f"Requested user info for {username}")
 
 
@@ -612,23 +637,12 @@ async def step_logout_user(context: Context, adapter_type: str) -> None:
     """Logout the user using the adapter of the specified type."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
-
-    prev_step = next((s for s in reversed(context.scenario.steps) if "have a valid token" in s.name), None)
-    if not prev_step:
-        raise ValueError("No previous token step found")
 
-    username = prev_step.name.split('"')[1]
-    refresh_token = scenario_context.get(f"token_response_{username}")["refresh_token"]
-
-    if is_async:
+    username, token_response = _get_current_token(scenario_context)
+    refresh_token = token_response["refresh_token"]
 
-        result = await adapter.logout(refresh_token)
-        scenario_context.store("logout_result", result)
-
-    else:
-        result = adapter.logout(refresh_token)
-        scenario_context.store("logout_result", result)
+    result = await maybe_await(adapter.logout(refresh_token))
+    scenario_context.store("logout_result", result)
     context.logger.info(f"Logged out user {username}")
 
 
@@ -637,23 +651,12 @@ async def step_validate_token(context: Context, adapter_type: str) -> None:
     """Validate the token using the adapter of the specified type."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
 
-    prev_step = next((s for s in reversed(context.scenario.steps) if "have a valid token" in s.name), None)
-    if not prev_step:
-        raise ValueError("No previous token step found")
+    username, token_response = _get_current_token(scenario_context)
+    access_token = token_response["access_token"]
 
-    username = prev_step.name.split('"')[1]
-    access_token = scenario_context.get(f"token_response_{username}")["access_token"]
-
-    if is_async:
-
-        result = await adapter.validate_token(access_token)
-        scenario_context.store("validation_result", result)
-
-    else:
-        result = adapter.validate_token(access_token)
-        scenario_context.store("validation_result", result)
+    result = await maybe_await(adapter.validate_token(access_token))
+    scenario_context.store("validation_result", result)
     context.logger.info(f"Validated token for {username}")
 
 
@@ -663,16 +666,9 @@ async def step_get_user_by_username(context: Context, username: str, adapter_typ
     """Get user by username."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
-
-    if is_async:
-
-        user = await adapter.get_user_by_username(username)
-        scenario_context.store("latest_user_retrieval", user)
 
-    else:
-        user = adapter.get_user_by_username(username)
-        scenario_context.store("latest_user_retrieval", user)
+    user = await maybe_await(adapter.get_user_by_username(username))
+    scenario_context.store("latest_user_retrieval", user)
     context.logger.info(f"Retrieved user by username {username}")
 
 
@@ -681,16 +677,9 @@ async def step_get_user_by_email(context: Context, email: str, adapter_type: str
     """Get user by email."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
-
-    if is_async:
 
-        user = await adapter.get_user_by_email(email)
-        scenario_context.store("latest_user_retrieval", user)
-
-    else:
-        user = adapter.get_user_by_email(email)
-        scenario_context.store("latest_user_retrieval", user)
+    user = await maybe_await(adapter.get_user_by_email(email))
+    scenario_context.store("latest_user_retrieval", user)
     context.logger.info(f"Retrieved user by email {email}")
 
 
@@ -699,32 +688,22 @@ async def step_get_user_by_email(context: Context, email: str, adapter_type: str
 
 @given('I create a realm role named "{role_name}" with description "{description}" using {adapter_type} adapter')
 @when('I create a realm role named "{role_name}" with description "{description}" using {adapter_type} adapter')
+@_store_step_error("realm_role_error", "Realm role creation failed")
 async def step_create_realm_role(context: Context, role_name: str, description: str, adapter_type: str) -> None:
     """Create a realm role."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
 
-    try:
-        if is_async:
-
-            role = await adapter.create_realm_role(role_name, description)
-            scenario_context.store("latest_realm_role", role)
-            scenario_context.store(f"realm_role_{role_name}", role)
-
-        else:
-            role = adapter.create_realm_role(role_name, description)
-            scenario_context.store("latest_realm_role", role)
-            scenario_context.store(f"realm_role_{role_name}", role)
-        context.logger.info(f"Created realm role {role_name}")
-    except Exception as e:
-        scenario_context.store("realm_role_error", str(e))
-        context.logger.exception("Realm role creation failed")
+    role = await maybe_await(adapter.create_realm_role(role_name, description))
+    scenario_context.store("latest_realm_role", role)
+    scenario_context.store(f"realm_role_{role_name}", role)
+    context.logger.info(f"Created realm role {role_name}")
 
 
 @when(
     'I create a client role named "{role_name}" for client "{client_id}" with description "{description}" using {adapter_type} adapter',
 )
+@_store_step_error("client_role_error", "Client role creation failed")
 async def step_create_client_role(
     context: Context,
     role_name: str,
@@ -735,52 +714,54 @@ async def step_create_client_role(
     """Create a client role."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
 
-    try:
-        if is_async:
-
-            role = await adapter.create_client_role(client_id, role_name, description)
-            scenario_context.store("latest_client_role", role)
-            scenario_context.store(f"client_role_{role_name}_{client_id}", role)
-
-        else:
-            role = adapter.create_client_role(client_id, role_name, description)
-            scenario_context.store("latest_client_role", role)
-            scenario_context.store(f"client_role_{role_name}_{client_id}", role)
-        context.logger.info(f"Created client role {role_name} for client {client_id}")
-    except Exception as e:
-        scenario_context.store("client_role_error", str(e))
-        context.logger.exception("Client role creation failed")
+    role = await maybe_await(adapter.create_client_role(client_id, role_name, description))
+    scenario_context.store("latest_client_role", role)
+    scenario_context.store(f"client_role_{role_name}_{client_id}", role)
+    context.logger.info(f"Created client role {role_name} for client {client_id}")
 
 
 @given('I assign realm role "{role_name}" to user "{username}" using {adapter_type} adapter')
 @when('I assign realm role "{role_name}" to user "{username}" using {adapter_type} adapter')
+@_store_step_error("role_assignment_error", "Role assignment failed")
 async def step_assign_realm_role(context: Context, role_name: str, username: str, adapter_type: str) -> None:
     """Assign a realm role to a user."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
 
-    user_id = scenario_context.get(f"user_id_{username}")
+    user_id = scenario_context.user_ids.get(username)
 
-    try:
-        if is_async:
+    await maybe_await(adapter.assign_realm_role(user_id, role_name))
+    scenario_context.store("latest_role_assignment", {"user": username, "role": role_name})
 
-            await adapter.assign_realm_role(user_id, role_name)
-            scenario_context.store("latest_role_assignment", {"user": username, "role": role_name})
+    context.logger.info(f"Assigned realm role {role_name} to user {username}")
 
-        else:
-            adapter.assign_realm_role(user_id, role_name)
-            scenario_context.store("latest_role_assignment", {"user": username, "role": role_name})
 
-        context.logger.info(f"Assigned realm role {role_name} to user {username}")
-    except Exception as e:
-        scenario_context.store("role_assignment_error", str(e))
-        context.logger.exception("Role assignment failed")
+@when("I assign the following realm roles using {adapter_type} adapter")
+async def step_bulk_assign_realm_roles(context: Context, adapter_type: str) -> None:
+    """Assign the realm role of each table row to its user."""
+    adapter = get_keycloak_adapter(context)
+    scenario_context = get_current_scenario_context(context)
+
+    assignments = [{"user": row["username"], "role": row["role_name"]} for row in context.table]
+    results = await _run_table_calls(
+        context,
+        [
+            partial(adapter.assign_realm_role, scenario_context.user_ids.get(a["user"]), a["role"])
+            for a in assignments
+        ],
+    )
+    error = _table_errors([f"{a['user']}/{a['role']}" for a in assignments], results)
+    scenario_context.store("latest_role_assignment", assignments)
+    scenario_context.store("role_assignment_error", error)
+    if error:
+        context.logger.error(f"Bulk role assignment failed: {error}")
+    else:
+        context.logger.info(f"Assigned {len(assignments)} realm roles")
 
 
 @when('I assign client role "{role_name}" of client "{client_id}" to user "{username}" using {adapter_type} adapter')
+@_store_step_error("client_role_assignment_error", "Client role assignment failed")
 async def step_assign_client_role(
     context: Context,
     role_name: str,
@@ -791,53 +772,29 @@ async def step_assign_client_role(
     """Assign a client role to a user."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
-
-    user_id = scenario_context.get(f"user_id_{username}")
 
-    try:
-        if is_async:
-
-            await adapter.assign_client_role(user_id, client_id, role_name)
-            scenario_context.store(
-                "latest_client_role_assignment",
-                {"user": username, "role": role_name, "client": client_id},
-            )
+    user_id = scenario_context.user_ids.get(username)
 
-        else:
-            adapter.assign_client_role(user_id, client_id, role_name)
-            scenario_context.store(
-                "latest_client_role_assignment",
-                {"user": username, "role": role_name, "client": client_id},
-            )
-        context.logger.info(f"Assigned client role {role_name} of client {client_id} to user {username}")
-    except Exception as e:
-        scenario_context.store("client_role_assignment_error", str(e))
-        context.logger.exception("Client role assignment failed")
+    await maybe_await(adapter.assign_client_role(user_id, client_id, role_name))
+    scenario_context.store(
+        "latest_client_role_assignment",
+        {"user": username, "role": role_name, "client": client_id},
+    )
+    context.logger.info(f"Assigned client role {role_name} of client {client_id} to user {username}")
 
 
 @when('I remove realm role "{role_name}" from user "{username}" using {adapter_type} adapter')
+@_store_step_error("role_removal_error", "Role removal failed")
 async def step_remove_realm_role(context: Context, role_name: str, username: str, adapter_type: str) -> None:
     """Remove a realm role from a user."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
 
-    user_id = scenario_context.get(f"user_id_{username}")
+    user_id = scenario_context.user_ids.get(username)
 
-    try:
-        if is_async:
-
-            await adapter.remove_realm_role(user_id, role_name)
-            scenario_context.store("latest_role_removal", {"user": username, "role": role_name})
-
-        else:
-            adapter.remove_realm_role(user_id, role_name)
-            scenario_context.store("latest_role_removal", {"user": username, "role": role_name})
-        context.logger.info(f"Removed realm role {role_name} from user {username}")
-    except Exception as e:
-        scenario_context.store("role_removal_error", str(e))
-        context.logger.exception("Role removal failed")
+    await maybe_await(adapter.remove_realm_role(user_id, role_name))
+    scenario_context.store("latest_role_removal", {"user": username, "role": role_name})
+    context.logger.info(f"Removed realm role {role_name} from user {username}")
 
 
 # Search and update steps
@@ -846,68 +803,64 @@ async def step_search_users(context: Context, query: str, adapter_type: str) ->
     """Search for users."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
-
-    if is_async:
 
-        users = await adapter.search_users(query)
-        scenario_context.store("search_results", users)
-
-    else:
-        users = adapter.search_users(query)
-        scenario_context.store("search_results", users)
+    users = await maybe_await(adapter.search_users(query))
+    scenario_context.store("search_results", users)
     context.logger.info(f"Searched for users with query {query}")
 
 
 @when(
     'I update user "{username}" with first name "{first_name}" and last name "{last_name}" using {adapter_type} adapter',
 )
+@_store_step_error("user_update_error", "User update failed")
 async def step_update_user(context: Context, username: str, first_name: str, last_name: str, adapter_type: str) -> None:
     """Update user details."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
 
-    user_id = scenario_context.get(f"user_id_{username}")
+    user_id = scenario_context.user_ids.get(username)
     update_data = {"firstName": first_name, "lastName": last_name}
 
-    try:
-        if is_async:
+    await maybe_await(adapter.update_user(user_id, update_data))
+    scenario_context.store("latest_user_update", {"user": username, "data": update_data})
+    context.logger.info(f"Updated user {username}")
 
-            await adapter.update_user(user_id, update_data)
-            scenario_context.store("latest_user_update", {"user": username, "data": update_data})
 
-        else:
-            adapter.update_user(user_id, update_data)
-            scenario_context.store("latest_user_update", {"user": username, "data": update_data})
-        context.logger.info(f"Updated user {username}")
-    except Exception as e:
-        scenario_context.store("user_update_error", str(e))
-        context.logger.exception("User update failed")
+@when("I update the following users using {adapter_type} adapter")
+async def step_bulk_update_users(context: Context, adapter_type: str) -> None:
+    """Update the first and last name of each table row's user."""
+    adapter = get_keycloak_adapter(context)
+    scenario_context = get_current_scenario_context(context)
+
+    updates = [
+        {"user": row["username"], "data": {"firstName": row["first_name"], "lastName": row["last_name"]}}
+        for row in context.table
+    ]
+    results = await _run_table_calls(
+        context,
+        [partial(adapter.update_user, scenario_context.user_ids.get(u["user"]), u["data"]) for u in updates],
+    )
+    error = _table_errors([u["user"] for u in updates], results)
+    scenario_context.store("latest_user_update", updates)
+    scenario_context.store("user_update_error", error)
+    if error:
+        context.logger.error(f"Bulk user update failed: {error}")
+    else:
+        context.logger.info(f"Updated {len(updates)} users")
 
 
 @when('I reset password for user "{username}" to "{new_password}" using {adapter_type} adapter')
+@_store_step_error("password_reset_error", "Password reset failed")
 async def step_reset_password(context: Context, username: str, new_password: str, adapter_type: str) -> None:
     """Reset user password."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
 
-    user_id = scenario_context.get(f"user_id_{username}")
+    user_id = scenario_context.user_ids.get(username)
 
-    try:
-        if is_async:
-
-            await adapter.reset_password(user_id, new_password, temporary=False)
-            scenario_context.store("latest_password_reset", {"user": username, "new_password": new_password})
-
-        else:
-            adapter.reset_password(user_id, new_password, temporary=False)
-            scenario_context.store("latest_password_reset", {"user": username, "new_password": new_password})
-        context.logger.info(f"Reset password for user {username}")
-    except Exception as e:
-        scenario_context.store("password_reset_error", str(e))
-        context.logger.exception("Password reset failed")
+    await maybe_await(adapter.reset_password(user_id, new_password, temporary=False))
+    scenario_context.store("latest_password_reset", {"user": username, "new_password": new_password})
+    context.logger.info(f"Reset password for user {username}")
 
 
 @when('I clear sessions for user "{username}" using {adapter_type} adapter')
@@ -915,43 +868,26 @@ async def step_clear_user_sessions(context: Context, username: str, adapter_type
     """Clear user sessions."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
-
-    user_id = scenario_context.get(f"user_id_{username}")
 
-    if is_async:
+    user_id = scenario_context.user_ids.get(username)
 
-        await adapter.clear_user_sessions(user_id)
-        scenario_context.store("latest_session_clear", {"user": username})
-
-    else:
-        adapter.clear_user_sessions(user_id)
-        scenario_context.store("latest_session_clear", {"user": username})
+    await maybe_await(adapter.clear_user_sessions(user_id))
+    scenario_context.store("latest_session_clear", {"user": username})
     context.logger.info(f"Cleared sessions for user {username}")
 
 
 @when('I delete user "{username}" using {adapter_type} adapter')
+@_store_step_error("user_deletion_error", "User deletion failed")
 async def step_delete_user(context: Context, username: str, adapter_type: str) -> None:
     """Delete a user."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
 
-    user_id = scenario_context.get(f"user_id_{username}")
+    user_id = scenario_context.user_ids.get(username)
 
-    try:
-        if is_async:
-
-            await adapter.delete_user(user_id)
-            scenario_context.store("latest_user_deletion", {"user": username})
-
-        else:
-            adapter.delete_user(user_id)
-            scenario_context.store("latest_user_deletion", {"user": username})
-        context.logger.info(f"Deleted user {username}")
-    except Exception as e:
-        scenario_context.store("user_deletion_error", str(e))
-        context.logger.exception("User deletion failed")
+    await maybe_await(adapter.delete_user(user_id))
+    scenario_context.store("latest_user_deletion", {"user": username})
+    context.logger.info(f"Deleted user {username}")
 
 
 # Advanced token operations
@@ -960,16 +896,9 @@ async def step_request_client_credentials_token(context: Context, adapter_type:
     """Request client credentials token."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
-
-    if is_async:
-
-        token = await adapter.get_client_credentials_token()
-        scenario_context.store("latest_token_response", token)
 
-    else:
-        token = adapter.get_client_credentials_token()
-        scenario_context.store("latest_token_response", token)
+    token = await maybe_await(adapter.get_client_credentials_token())
+    scenario_context.store("latest_token_response", token)
     context.logger.info("Requested client credentials token")
 
 
@@ -978,23 +907,12 @@ async def step_introspect_token(context: Context, adapter_type: str) -> None:
     """Introspect the token."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
-
-    prev_step = next((s for s in reversed(context.scenario.steps) if "have a valid token" in s.name), None)
-    if not prev_step:
-        raise ValueError("No previous token step found")
-
-    username = prev_step.name.split('"')[1]
-    access_token = scenario_context.get(f"token_response_{username}")["access_token"]
-
-    if is_async:
 
-        result = await adapter.introspect_token(access_token)
-        scenario_context.store("introspection_result", result)
+    username, token_response = _get_current_token(scenario_context)
+    access_token = token_response["access_token"]
 
-    else:
-        result = adapter.introspect_token(access_token)
-        scenario_context.store("introspection_result", result)
+    result = await maybe_await(adapter.introspect_token(access_token))
+    scenario_context.store("introspection_result", result)
     context.logger.info("Introspected token")
 
 
@@ -1003,23 +921,12 @@ async def step_get_token_info(context: Context, adapter_type: str) -> None:
     """Get token info."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
 
-    prev_step = next((s for s in reversed(context.scenario.steps) if "have a valid token" in s.name), None)
-    if not prev_step:
-        raise ValueError("No previous token step found")
+    username, token_response = _get_current_token(scenario_context)
+    access_token = token_response["access_token"]
 
-    username = prev_step.name.split('"')[1]
-    access_token = scenario_context.get(f"token_response_{username}")["access_token"]
-
-    if is_async:
-
-        result = await adapter.get_token_info(access_token)
-        scenario_context.store("token_info_result", result)
-
-    else:
-        result = adapter.get_token_info(access_token)
-        scenario_context.store("token_info_result", result)
+    result = await maybe_await(adapter.get_token_info(access_token))
+    scenario_context.store("token_info_result", result)
     context.logger.info("Retrieved token info")
 
 
@@ -1028,23 +935,12 @@ async def step_check_user_role(context: Context, role_name: str, adapter_type: s
     """Check if user has a specific role."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
-
-    prev_step = next((s for s in reversed(context.scenario.steps) if "have a valid token" in s.name), None)
-    if not prev_step:
-        raise ValueError("No previous token step found")
 
-    username = prev_step.name.split('"')[1]
-    access_token = scenario_context.get(f"token_response_{username}")["access_token"]
+    username, token_response = _get_current_token(scenario_context)
+    access_token = token_response["access_token"]
 
-    if is_async:
-
-        has_role = await adapter.has_role(access_token, role_name)
-        scenario_context.store("role_check_result", {"role": role_name, "has_role": has_role})
-
-    else:
-        has_role = adapter.has_role(access_token, role_name)
-        scenario_context.store("role_check_result", {"role": role_name, "has_role": has_role})
+    has_role = await maybe_await(adapter.has_role(access_token, role_name))
+    scenario_context.store("role_check_result", {"role": role_name, "has_role": has_role})
 
     context.logger.info(f"Checked if user has role {role_name}")
 
@@ -1116,20 +1012,11 @@ async def step_user_has_realm_role(context: Context, username: str, role_name: s
     """Verify that the user has the specified realm role."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
 
-    user_id = scenario_context.get(f"user_id_{username}")
+    user_id = scenario_context.user_ids.get(username)
 
-    if is_async:
-
-        roles = await adapter.get_user_roles(user_id)
-        role_names = [role["name"] for role in roles]
-        assert role_name in role_names, f"User {username} does not have realm role {role_name}"
-
-    else:
-        roles = adapter.get_user_roles(user_id)
-        role_names = [role["name"] for role in roles]
-        assert role_name in role_names, f"User {username} does not have realm role {role_name}"
+    roles = await maybe_await(adapter.get_user_roles(user_id))
+    assert any(role["name"] == role_name for role in roles), f"User {username} does not have realm role {role_name}"
     context.logger.info(f"Verified user {username} has realm role {role_name}")
 
 
@@ -1138,23 +1025,53 @@ async def step_user_has_client_role(context: Context, username: str, role_name:
     """Verify that the user has the specified client role."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
 
-    user_id = scenario_context.get(f"user_id_{username}")
+    user_id = scenario_context.user_ids.get(username)
 
-    if is_async:
+    client_id = await _resolve_client_id(adapter, scenario_context, client_name)
+    roles = await maybe_await(adapter.get_client_roles_for_user(user_id, client_id))
+    assert any(
+        role["name"] == role_name for role in roles
+    ), f"User {username} does not have client role {role_name} for client {client_id}"
+    context.logger.info(f"Verified user {username} has client role {role_name} for client {client_id}")
 
-        client_id = await adapter.get_client_id(client_name)
-        roles = await adapter.get_client_roles_for_user(user_id, client_id)
-        role_names = [role["name"] for role in roles]
-        assert role_name in role_names, f"User {username} does not have client role {role_name} for client {client_id}"
 
-    else:
-        client_id = adapter.get_client_id(client_name)
-        roles = adapter.get_client_roles_for_user(user_id, client_id)
-        role_names = [role["name"] for role in roles]
-        assert role_name in role_names, f"User {username} does not have client role {role_name} for client {client_id}"
-    context.logger.info(f"Verified user {username} has client role {role_name} for client {client_id}")
+@then("the following client roles should be assigned")
+async def step_client_roles_assigned(context: Context) -> None:
+    """Verify that each table row's user has the row's client role.
+
+    Rows for the same user and client share one role lookup, and the lookups of the async
+    adapter run together.
+    """
+    adapter = get_keycloak_adapter(context)
+    scenario_context = get_current_scenario_context(context)
+
+    client_ids = {}
+    expected = []
+    for row in context.table:
+        client_name = row["client_name"]
+        if client_name not in client_ids:
+            client_ids[client_name] = await _resolve_client_id(adapter, scenario_context, client_name)
+        user_id = scenario_context.user_ids.get(row["username"])
+        expected.append((row["username"], row["role_name"], client_name, (user_id, client_ids[client_name])))
+
+    pairs = list(dict.fromkeys(pair for *_, pair in expected))
+    results = await _run_table_calls(
+        context,
+        [partial(adapter.get_client_roles_for_user, user_id, client_id) for user_id, client_id in pairs],
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+    role_names = {pair: {role["name"] for role in roles} for pair, roles in zip(pairs, results, strict=True)}
+
+    missing = [
+        f"{username}/{role_name}@{client_name}"
+        for username, role_name, client_name, pair in expected
+        if role_name not in role_names[pair]
+    ]
+    assert not missing, f"Missing client roles: {', '.join(missing)}"
+    context.logger.info(f"Verified {len(expected)} client role assignments")
 
 
 @then('the user "{username}" should not have realm role "{role_name}"')
@@ -1162,20 +1079,11 @@ async def step_user_not_have_realm_role(context: Context, username: str, role_na
     """Verify that the user does not have the specified realm role."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
 
-    user_id = scenario_context.get(f"user_id_{username}")
+    user_id = scenario_context.user_ids.get(username)
 
-    if is_async:
-
-        roles = await adapter.get_user_roles(user_id)
-        role_names = [role["name"] for role in roles]
-        assert role_name not in role_names, f"User {username} still has realm role {role_name}"
-
-    else:
-        roles = adapter.get_user_roles(user_id)
-        role_names = [role["name"] for role in roles]
-        assert role_name not in role_names, f"User {username} still has realm role {role_name}"
+    roles = await maybe_await(adapter.get_user_roles(user_id))
+    assert not any(role["name"] == role_name for role in roles), f"User {username} still has realm role {role_name}"
     context.logger.info(f"Verified user {username} does not have realm role {role_name}")
 
 
@@ -1213,20 +1121,12 @@ async def step_user_has_names(context: Context, username: str, first_name: str,
     """Verify that the user has the specified first and last names."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
 
-    user_id = scenario_context.get(f"user_id_{username}")
+    user_id = scenario_context.user_ids.get(username)
 
-    if is_async:
-
-        user = await adapter.get_user_by_id(user_id)
-        assert user["firstName"] == first_name, f"Expected first name {first_name}, got {user.get('firstName')}"
-        assert user["lastName"] == last_name, f"Expected last name {last_name}, got {user.get('lastName')}"
-
-    else:
-        user = adapter.get_user_by_id(user_id)
-        assert user["firstName"] == first_name, f"Expected first name {first_name}, got {user.get('firstName')}"
-        assert user["lastName"] == last_name, f"Expected last name {last_name}, got {user.get('lastName')}"
+    user = await maybe_await(adapter.get_user_by_id(user_id))
+    assert user["firstName"] == first_name, f"Expected first name {first_name}, got {user.get('firstName')}"
+    assert user["lastName"] == last_name, f"Expected last name {last_name}, got {user.get('lastName')}"
     context.logger.info(f"Verified user {username} has names {first_name} {last_name}")
 
 
@@ -1264,16 +1164,9 @@ def step_user_deletion_succeeds(context: Context, adapter_type: str) -> None:
 async def step_user_not_exist(context: Context, username: str) -> None:
     """Verify that the user no longer exists."""
     adapter = get_keycloak_adapter(context)
-    is_async = "async" in context.scenario.tags
-
-    if is_async:
 
-        user = await adapter.get_user_by_username(username)
-        assert user is None, f"User {username} still exists"
-
-    else:
-        user = adapter.get_user_by_username(username)
-        assert user is None, f"User {username} still exists"
+    user = await maybe_await(adapter.get_user_by_username(username, brief=True))
+    assert user is None, f"User {username} still exists"
     context.logger.info(f"Verified user {username} does not exist")
 
 
@@ -1372,8 +1265,7 @@ def step_all_operations_successful(context: Context) -> None:
     scenario_context = get_current_scenario_context(context)
 
     # Check for any stored errors
-    error_keys = [key for key in scenario_context._storage.keys() if "error" in key.lower()]
-    for error_key in error_keys:
+    for error_key in scenario_context.error_keys:
         error_value = scenario_context.get(error_key)
         assert not error_value, f"Operation failed with error in {error_key}: {error_value}"
 
@@ -1386,9 +1278,9 @@ def step_scenario_created_resources(context: Context) -> None:
     scenario_context = get_current_scenario_context(context)
 
     # Count the resources that should have been created based on scenario steps
-    realm_count = len([key for key in scenario_context._storage.keys() if key.startswith("realm_")])
-    client_count = len([key for key in scenario_context._storage.keys() if key.startswith("client_")])
-    user_count = len([key for key in scenario_context._storage.keys() if key.startswith("user_id_")])
+    realm_count = len(scenario_context.keys_by_prefix.get("realm", ()))
+    client_count = len(scenario_context.keys_by_prefix.get("client", ()))
+    user_count = len(scenario_context.user_ids)
 
     assert realm_count > 0, "No realms were created"
     assert client_count > 0, "No clients were created"
@@ -1419,9 +1311,8 @@ def step_debug_user_info(context: Context) -> None:
 @then("I should see all stored data")
 def step_debug_all_data(context: Context) -> None:
     """Debug step to print all stored scenario data."""
-    scenario_context = get_current_scenario_context(context)
-    all_data = {key: value for key, value in scenario_context._storage.items()}
-    context.logger.info(f"All stored data: {all_data}")
+    if context.logger.isEnabledFor(logging.INFO):
+        context.logger.info("All stored data: %r", get_current_scenario_context(context).storage)
 
 
 # Security verification steps
@@ -1501,18 +1392,32 @@ def _create_or_get_realm(
     try:
         realm_result = adapter.create_realm(realm_name=realm_name, display_name=display_name, skip_exists=True)
         context.logger.info(f"Created realm {realm_name}")
-    except Exception as e:
-        if "already exists" in str(e).lower():
-            context.logger.info(f"Realm {realm_name} already exists, retrieving existing realm")
-            realm_result = adapter.get_realm(realm_name)
-        else:
-            raise
+    except RealmAlreadyExistsError:
+        context.logger.info(f"Realm {realm_name} already exists, retrieving existing realm")
+        realm_result = adapter.get_realm(realm_name)
 
     # Store the result (either newly created or existing realm)
     scenario_context.store("latest_realm_result", realm_result)
     scenario_context.store(f"realm_{realm_name}", realm_result)
 
 
+async def _await_adapter_call(
+    adapter: AsyncKeycloakAdapter | KeycloakAdapter,
+    method_name: str,
+    /,
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """Await an adapter method, running a sync adapter's blocking call in a worker thread.
+
+    Keeps the shared event loop free when a sync adapter is used from async code.
+    """
+    method = getattr(adapter, method_name)
+    if isinstance(adapter, AsyncKeycloakAdapter):
+        return await method(*args, **kwargs)
+    return await asyncio.to_thread(method, *args, **kwargs)
+
+
 async def _create_or_get_realm_async(
     adapter: AsyncKeycloakAdapter | KeycloakAdapter,
     realm_name: str,
@@ -1522,14 +1427,17 @@ async def _create_or_get_realm_async(
 ) -> None:
     """Async helper function to create a realm or get existing one if it already exists."""
     try:
-        realm_result = await adapter.create_realm(realm_name=realm_name, display_name=display_name, skip_exists=True)
+        realm_result = await _await_adapter_call(
+            adapter,
+            "create_realm",
+            realm_name=realm_name,
+            display_name=display_name,
+            skip_exists=True,
+        )
         context.logger.info(f"Created realm {realm_name}")
-    except Exception as e:
-        if "already exists" in str(e).lower():
-            context.logger.info(f"Realm {realm_name} already exists, retrieving existing realm")
-            realm_result = await adapter.get_realm(realm_name)
-        else:
-            raise
+    except RealmAlreadyExistsError:
+        context.logger.info(f"Realm {realm_name} already exists, retrieving existing realm")
+        realm_result = await _await_adapter_call(adapter, "get_realm", realm_name)
 
     # Store the result (either newly created or existing realm)
     scenario_context.store("latest_realm_result", realm_result)
@@ -1562,18 +1470,11 @@ async def step_update_realm_display_name(
 ) -> None:
     """Update realm display name via adapter.update_realm (get realm, set displayName, update)."""
     adapter = get_keycloak_adapter(context)
-    is_async = "async" in context.scenario.tags
-    if is_async:
-        realm = await adapter.get_realm(realm_name)
-    else:
-        realm = adapter.get_realm(realm_name)
+    realm = await maybe_await(adapter.get_realm(realm_name))
     assert realm is not None, f"Realm {realm_name!r} not found"
     payload = dict(realm)
     payload["displayName"] = new_display_name
-    if is_async:
-        await adapter.update_realm(realm_name, **payload)
-    else:
-        adapter.update_realm(realm_name, **payload)
+    await maybe_await(adapter.update_realm(realm_name, **payload))
     context.logger.info(f"Updated realm {realm_name} display name to {new_display_name!r}")
 
 
@@ -1584,11 +1485,7 @@ async def step_realm_has_display_name_by_name(
 ) -> None:
     """Verify the realm has the given display name by fetching the realm."""
     adapter = get_keycloak_adapter(context)
-    is_async = "async" in context.scenario.tags
-    if is_async:
-        realm = await adapter.get_realm(realm_name)
-    else:
-        realm = adapter.get_realm(realm_name)
+    realm = await maybe_await(adapter.get_realm(realm_name))
     assert realm is not None, f"Realm {realm_name!r} not found"
     actual = realm.get("displayName")
     assert actual == display_name, f"Expected displayName {display_name!r}, got {actual!r}"
@@ -1873,23 +1770,16 @@ def step_async_token_validation_succeeds(context: Context) -> None:
 # Organization steps
 @given('I create an organization with name "{org_name}" and alias "{org_alias}" using {adapter_type} adapter')
 @when('I create an organization with name "{org_name}" and alias "{org_alias}" using {adapter_type} adapter')
+@_store_step_error("organization_creation_error", "Organization creation failed")
 async def step_create_organization(context: Context, org_name: str, org_alias: str, adapter_type: str) -> None:
     """Create an organization with the specified name and alias."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
 
-    try:
-        if is_async:
-            org_id = await adapter.create_organization(name=org_name, alias=org_alias)
-        else:
-            org_id = adapter.create_organization(name=org_name, alias=org_alias)
-        scenario_context.store("latest_organization_id", org_id)
-        scenario_context.store("latest_organization_creation", {"name": org_name, "alias": org_alias, "id": org_id})
-        context.logger.info(f"Created organization {org_name} with id {org_id}")
-    except Exception as e:
-        scenario_context.store("organization_creation_error", str(e))
-        context.logger.exception("Organization creation failed")
+    org_id = await maybe_await(adapter.create_organization(name=org_name, alias=org_alias))
+    scenario_context.store("latest_organization_id", org_id)
+    scenario_context.store("latest_organization_creation", {"name": org_name, "alias": org_alias, "id": org_id})
+    context.logger.info(f"Created organization {org_name} with id {org_id}")
 
 
 @then("the {adapter_type} organization creation should succeed")
@@ -1908,15 +1798,11 @@ async def step_update_organization_name(context: Context, name: str, adapter_typ
     """Update the current organization's name (Keycloak 26 uses name, not displayName)."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
     org_id = scenario_context.get("latest_organization_id")
     assert org_id, "No organization id in context (create organization first)"
 
     try:
-        if is_async:
-            current = await adapter.get_organization(organization_id=org_id)
-        else:
-            current = adapter.get_organization(organization_id=org_id)
+        current = await maybe_await(adapter.get_organization(organization_id=org_id))
         update_kwargs: dict[str, str] = (
             {"name": name, "alias": current.get("alias", "")} if isinstance(current, dict) else {"name": name}
         )
@@ -1924,10 +1810,7 @@ async def step_update_organization_name(context: Context, name: str, adapter_typ
         update_kwargs = {"name": name}
 
     try:
-        if is_async:
-            await adapter.update_organization(org_id, **update_kwargs)
-        else:
-            adapter.update_organization(org_id, **update_kwargs)
+        await maybe_await(adapter.update_organization(org_id, **update_kwargs))
         scenario_context.store("latest_organization_update", {"name": name})
         context.logger.info(f"Updated organization name to {name}")
     except Exception as e:
@@ -1940,15 +1823,11 @@ async def step_delete_organization(context: Context, adapter_type: str) -> None:
     """Delete the current organization."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
     org_id = scenario_context.get("latest_organization_id")
     assert org_id, "No organization id in context"
 
     try:
-        if is_async:
-            await adapter.delete_organization(organization_id=org_id)
-        else:
-            adapter.delete_organization(organization_id=org_id)
+        await maybe_await(adapter.delete_organization(organization_id=org_id))
         scenario_context.store("latest_organization_deletion", org_id)
         context.logger.info("Deleted organization")
     except Exception as e:
@@ -1962,17 +1841,13 @@ async def step_organization_user_add(context: Context, username: str, adapter_ty
     """Add a user to the current organization."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
     org_id = scenario_context.get("latest_organization_id")
-    user_id = scenario_context.get(f"user_id_{username}")
+    user_id = scenario_context.user_ids.get(username)
     assert org_id, "No organization id in context"
     assert user_id, f"No user id for username {username}"
 
     try:
-        if is_async:
-            await adapter.organization_user_add(user_id=user_id, organization_id=org_id)
-        else:
-            adapter.organization_user_add(user_id=user_id, organization_id=org_id)
+        await maybe_await(adapter.organization_user_add(user_id=user_id, organization_id=org_id))
         scenario_context.store("organization_add_member_error", None)
         context.logger.info(f"Added user {username} to organization")
     except Exception as e:
@@ -1985,15 +1860,11 @@ async def step_get_organization_members(context: Context, adapter_type: str) ->
     """Get members of the current organization."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
     org_id = scenario_context.get("latest_organization_id")
     assert org_id, "No organization id in context"
 
     try:
-        if is_async:
-            members = await adapter.get_organization_members(organization_id=org_id)
-        else:
-            members = adapter.get_organization_members(organization_id=org_id)
+        members = await maybe_await(adapter.get_organization_members(organization_id=org_id))
         scenario_context.store("organization_members", members)
         context.logger.info(f"Got {len(members)} organization members")
     except Exception as e:
@@ -2006,17 +1877,13 @@ async def step_organization_user_remove(context: Context, username: str, adapter
     """Remove a user from the current organization."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
     org_id = scenario_context.get("latest_organization_id")
-    user_id = scenario_context.get(f"user_id_{username}")
+    user_id = scenario_context.user_ids.get(username)
     assert org_id, "No organization id in context"
     assert user_id, f"No user id for username {username}"
 
     try:
-        if is_async:
-            await adapter.organization_user_remove(user_id=user_id, organization_id=org_id)
-        else:
-            adapter.organization_user_remove(user_id=user_id, organization_id=org_id)
+        await maybe_await(adapter.organization_user_remove(user_id=user_id, organization_id=org_id))
         scenario_context.store("organization_remove_member_error", None)
         context.logger.info(f"Removed user {username} from organization")
     except Exception as e:
@@ -2029,15 +1896,11 @@ async def step_get_organization_members_count(context: Context, adapter_type: st
     """Get the number of members in the current organization."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
     org_id = scenario_context.get("latest_organization_id")
     assert org_id, "No organization id in context"
 
     try:
-        if is_async:
-            count = await adapter.get_organization_members_count(organization_id=org_id)
-        else:
-            count = adapter.get_organization_members_count(organization_id=org_id)
+        count = await maybe_await(adapter.get_organization_members_count(organization_id=org_id))
         scenario_context.store("organization_members_count", count)
         context.logger.info(f"Organization members count: {count}")
     except Exception as e:
@@ -2050,15 +1913,11 @@ async def step_get_user_organizations(context: Context, username: str, adapter_t
     """Get organizations the user is member of."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
-    user_id = scenario_context.get(f"user_id_{username}")
+    user_id = scenario_context.user_ids.get(username)
     assert user_id, f"No user id for username {username}"
 
     try:
-        if is_async:
-            orgs = await adapter.get_user_organizations(user_id=user_id)
-        else:
-            orgs = adapter.get_user_organizations(user_id=user_id)
+        orgs = await maybe_await(adapter.get_user_organizations(user_id=user_id))
         scenario_context.store("user_organizations", orgs)
         scenario_context.store("user_organizations_error", None)
         context.logger.info(f"Got {len(orgs)} organizations for user {username}")
@@ -2074,14 +1933,10 @@ async def step_organization_exists(context: Context, org_name: str) -> None:
     """Verify the organization exists by fetching it by id."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
     org_id = scenario_context.get("latest_organization_id")
     assert org_id, "No organization id in context"
 
-    if is_async:
-        org = await adapter.get_organization(organization_id=org_id)
-    else:
-        org = adapter.get_organization(organization_id=org_id)
+    org = await maybe_await(adapter.get_organization(organization_id=org_id))
     scenario_context.store("latest_organization_result", org)
     assert org is not None, "Organization not found"
     assert org.get("name") == org_name, f"Organization name mismatch: expected {org_name}, got {org.get('name')}"
@@ -2099,42 +1954,28 @@ def step_organization_has_alias(context: Context, org_alias: str) -> None:
 
 
 @when("I get all organizations using {adapter_type} adapter")
+@_store_step_error("organizations_list_error", "Get all organizations failed")
 async def step_get_all_organizations(context: Context, adapter_type: str) -> None:
     """Get all organizations (no query). Tests get_organizations(query=None)."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
-    try:
-        if is_async:
-            orgs = await adapter.get_organizations(query=None)
-        else:
-            orgs = adapter.get_organizations(query=None)
-        scenario_context.store("organizations_list", orgs)
-        context.logger.info(f"Got {len(orgs)} organizations (all)")
-    except Exception as e:
-        scenario_context.store("organizations_list_error", str(e))
-        context.logger.exception("Get all organizations failed")
+    orgs = await maybe_await(adapter.get_organizations(query=None))
+    scenario_context.store("organizations_list", orgs)
+    context.logger.info(f"Got {len(orgs)} organizations (all)")
 
 
 @when('I get organizations with search "{search}" using {adapter_type} adapter')
+@_store_step_error("organizations_list_error", "Get organizations with search failed")
 async def step_get_organizations_with_search(
     context: Context, search: str, adapter_type: str,
 ) -> None:
     """Get organizations with query search. Tests get_organizations(query={\"search\": search})."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
     query = {"search": search}
-    try:
-        if is_async:
-            orgs = await adapter.get_organizations(query=query)
-        else:
-            orgs = adapter.get_organizations(query=query)
-        scenario_context.store("organizations_list", orgs)
-        context.logger.info(f"Got {len(orgs)} organizations with search={search!r}")
-    except Exception as e:
-        scenario_context.store("organizations_list_error", str(e))
-        context.logger.exception("Get organizations with search failed")
+    orgs = await maybe_await(adapter.get_organizations(query=query))
+    scenario_context.store("organizations_list", orgs)
+    context.logger.info(f"Got {len(orgs)} organizations with search={search!r}")
 
 
 @then('the organizations list should contain organization "{org_name}"')
@@ -2163,14 +2004,10 @@ async def step_organization_has_name(context: Context, name: str) -> None:
     """Verify the organization has the expected name (Keycloak 26 uses name)."""
     adapter = get_keycloak_adapter(context)
     scenario_context = get_current_scenario_context(context)
-    is_async = "async" in context.scenario.tags
     org_id = scenario_context.get("latest_organization_id")
     assert org_id, "No organization id in context"
 
-    if is_async:
-        org = await adapter.get_organization(organization_id=org_id)
-    else:
-        org = adapter.get_organization(organization_id=org_id)
+    org = await maybe_await(adapter.get_organization(organization_id=org_id))
     assert org is not None, "Organization not found"
     actual = org.get("name")
     assert actual == name, f"Expected organization name {name!r}, got {actual!r}"
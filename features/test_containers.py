@@ -325,6 +325,10 @@ class PostgresTestContainer(metaclass=Singleton, thread_safe=True):
         logger.info("PostgreSQL container stopped")
 
 
+# Keycloak's default JVM sizing assumes a dedicated host
+KEYCLOAK_JAVA_OPTS = "-Xms512m -Xmx1024m -XX:MaxMetaspaceSize=256m"
+
+
 @ContainerManager.register("keycloak")
 class KeycloakTestContainer(metaclass=Singleton, thread_safe=True):
     def __init__(self, config: KeycloakConfig | None = None, image: str | None = None) -> None:
@@ -352,6 +356,9 @@ class KeycloakTestContainer(metaclass=Singleton, thread_safe=True):
         )
         # enable Organizations feature for Keycloak 25+
         self._container.with_command("start-dev --features organization")
+        # Cap the JVM memory and keep caches local so Keycloak fits on small CI runners
+        self._container.with_env("JAVA_OPTS_APPEND", KEYCLOAK_JAVA_OPTS)
+        self._container.with_env("KC_CACHE", "local")
 
     def start(self) -> KeycloakContainer:
         """Start the Keycloak container."""
@@ -370,6 +377,9 @@ class KeycloakTestContainer(metaclass=Singleton, thread_safe=True):
             )
             # enable Organizations feature for Keycloak 25+
             self._container.with_command("start-dev --features organization")
+            # Cap the JVM memory and keep caches local so Keycloak fits on small CI runners
+            self._container.with_env("JAVA_OPTS_APPEND", KEYCLOAK_JAVA_OPTS)
+            self._container.with_env("KC_CACHE", "local")
 
         self._container.start()
         self._is_running = True
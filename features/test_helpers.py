@@ -1,7 +1,92 @@
 """Shared utilities for Behave BDD step implementations."""
 
+import asyncio
+import inspect
+import logging
+import uuid
+
 from archipy.models.entities import BaseEntity
 
+logger = logging.getLogger(__name__)
+
+# Adapters reused by every scenario of the run, closed once in after_all
+_shared_adapters = {}
+
+
+def get_shared_adapter(key, factory):
+    """Return the adapter cached under ``key``, building it with ``factory`` on first use.
+
+    Args:
+        key: Hashable cache key, should include everything the adapter is configured from
+        factory: Zero-argument callable creating the adapter
+
+    Returns:
+        The cached adapter instance
+    """
+    adapter = _shared_adapters.get(key)
+    if adapter is None:
+        adapter = _shared_adapters[key] = factory()
+    return adapter
+
+
+def close_shared_adapters(async_runner) -> None:
+    """Close the clients of every shared adapter, skipping those with nothing to close.
+
+    Args:
+        async_runner: The asyncio.Runner the async clients were used on
+    """
+    for key, adapter in _shared_adapters.items():
+        if key[0] == "keycloak":
+            close_keycloak_adapter(adapter, async_runner)
+            continue
+        close = getattr(getattr(adapter, "client", adapter), "close", None)
+        if close is None:
+            continue
+        try:
+            result = close()
+            if inspect.isawaitable(result):
+                async_runner.run(result)
+        except Exception as e:
+            logger.warning("Failed to close shared adapter %s: %s", key, e)
+    _shared_adapters.clear()
+
+
+def close_keycloak_adapter(adapter, async_runner) -> None:
+    """Close the HTTP sessions of a Keycloak adapter's OpenID and admin clients.
+
+    The Keycloak adapters have no close method. Each python-keycloak client keeps a requests
+    session and an httpx async client on its connection manager, and both are closed here.
+
+    Args:
+        adapter: A KeycloakAdapter or AsyncKeycloakAdapter
+        async_runner: The asyncio.Runner the async clients were used on
+    """
+    # The sync adapter keeps its OpenID client private, the async one exposes it
+    openid_client = getattr(adapter, "_openid_adapter", None) or getattr(adapter, "openid_adapter", None)
+    for client in (openid_client, getattr(adapter, "_admin_adapter", None)):
+        connection = getattr(client, "connection", None)
+        if connection is None:
+            continue
+        try:
+            session = getattr(connection, "_s", None)
+            if session is not None:
+                session.close()
+            async_session = getattr(connection, "async_s", None)
+            if async_session is not None:
+                async_runner.run(async_session.aclose())
+        except Exception as e:
+            logger.warning("Failed to close Keycloak client %r: %s", client, e)
+
+
+async def maybe_await(result):
+    """Await the result of an adapter call when it came from the async adapter.
+
+    Lets a step make one call that works with both the sync and async adapter variants.
+    """
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
 
 def get_current_scenario_context(context):
     """Get the current scenario context from the pool.
@@ -15,6 +100,11 @@ def get_current_scenario_context(context):
     Raises:
         AttributeError: If no scenario context pool or current scenario is available
     """
+    # Fast path: before_scenario caches the scenario context for the running scenario
+    scenario_context = getattr(context, "current_scenario_context", None)
+    if scenario_context is not None:
+        return scenario_context
+
     if not hasattr(context, "scenario_context_pool"):
         raise AttributeError("No scenario context pool available")
 
@@ -32,6 +122,20 @@ def get_current_scenario_context(context):
     return current_scenario
 
 
+def fast_uuid4(rng):
+    """Build a random version 4 UUID from a seeded generator.
+
+    Cheaper than uuid.uuid4() for test fixtures, which reads os.urandom on every call.
+
+    Args:
+        rng: A random.Random instance, seeded once per scenario
+
+    Returns:
+        A version 4 UUID
+    """
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
 def get_adapter(context):
     """Get the adapter for the current scenario."""
     scenario_context = get_current_scenario_context(context)
@@ -64,6 +168,65 @@ async def async_schema_setup(async_adapter):
         await conn.run_sync(BaseEntity.metadata.create_all)
 
 
+def warm_up_connection_pool(engine, size: int) -> None:
+    """Open and return connections so the pool is warm before the first atomic block.
+
+    Args:
+        engine: The sync SQLAlchemy engine whose pool should be filled
+        size (int): Number of connections to establish
+    """
+    connections = [engine.connect() for _ in range(size)]
+    for connection in connections:
+        connection.close()
+
+
+async def async_warm_up_connection_pool(async_engine, size: int) -> None:
+    """Open and return async connections so the pool is warm before the first atomic block.
+
+    Args:
+        async_engine: The async SQLAlchemy engine whose pool should be filled
+        size (int): Number of connections to establish
+    """
+    connections = await asyncio.gather(*(async_engine.connect().start() for _ in range(size)))
+    await asyncio.gather(*(connection.close() for connection in connections))
+
+
+def bind_session_to_outer_transaction(session_manager):
+    """Run every session of the manager inside one outer transaction that is never committed.
+
+    Sessions join the outer transaction in ``create_savepoint`` mode, so each atomic
+    block commits or rolls back a SAVEPOINT and the scenario's rows are discarded when
+    the outer transaction is rolled back during cleanup.
+
+    Args:
+        session_manager: The sync session manager of the scenario adapter
+
+    Returns:
+        tuple: The outer connection and its transaction
+    """
+    connection = session_manager.engine.connect()
+    transaction = connection.begin()
+    session_manager.remove_session()
+    session_manager._session_generator.configure(bind=connection, join_transaction_mode="create_savepoint")
+    return connection, transaction
+
+
+async def async_bind_session_to_outer_transaction(async_session_manager):
+    """Run every async session of the manager inside one outer transaction that is never committed.
+
+    Args:
+        async_session_manager: The async session manager of the scenario adapter
+
+    Returns:
+        tuple: The outer async connection and its transaction
+    """
+    connection = await async_session_manager.engine.connect()
+    transaction = await connection.begin()
+    await async_session_manager.remove_session()
+    async_session_manager._session_generator.configure(bind=connection, join_transaction_mode="create_savepoint")
+    return connection, transaction
+
+
 # Temporal-specific helper functions
 def wait_for_temporal_condition(condition_func, max_retries: int = 10, delay: float = 0.5) -> bool:
     """Wait for a Temporal condition to be met with retries.
@@ -104,3 +267,36 @@ def create_test_workflow_id(prefix: str = "test") -> str:
     timestamp = int(time.time() * 1000)
     unique_id = str(uuid4())[:8]
     return f"{prefix}-{timestamp}-{unique_id}"
+
+
+def start_holiday_api_mock(scenario_context):
+    """Patch the holiday API for a scenario, counting calls in the scenario context.
+
+    Args:
+        scenario_context: The scenario context that records api_call_count
+
+    Returns:
+        The started patcher; the caller stops it when the scenario ends
+    """
+    from unittest.mock import patch
+
+    from archipy.helpers.utils.datetime_utils import DatetimeUtils
+
+    def mock_call_holiday_api(jalali_date) -> dict:
+        scenario_context.store("api_call_count", scenario_context.get("api_call_count", 0) + 1)
+        return {
+            "data": {
+                "event_list": [
+                    {
+                        "jalali_year": jalali_date.year,
+                        "jalali_month": jalali_date.month,
+                        "jalali_day": jalali_date.day,
+                        "is_holiday": True,
+                    },
+                ],
+            },
+        }
+
+    patcher = patch.object(DatetimeUtils, "_call_holiday_api", side_effect=mock_call_holiday_api)
+    patcher.start()
+    return patcher